@@ -94,14 +94,14 @@ module iob_fp_add #(
    wire             A_sign;
    assign A_Mantissa = comp ? {1'b1, op_a_i[MAN_W-2:0]} : {1'b1, op_b_i[MAN_W-2:0]};
    assign A_Exponent = comp ? op_a_i[DATA_W-2-:EXP_W] : op_b_i[DATA_W-2-:EXP_W];
-   assign A_sign     = comp ? op_a_i : op_b_i[DATA_W-1];
+   assign A_sign     = comp ? op_a_i[DATA_W-1] : op_b_i[DATA_W-1];
 
    wire [MAN_W-1:0] B_Mantissa;
    wire [EXP_W-1:0] B_Exponent;
    wire             B_sign;
    assign B_Mantissa = comp ? {1'b1, op_b_i[MAN_W-2:0]} : {1'b1, op_a_i[MAN_W-2:0]};
    assign B_Exponent = comp ? op_b_i[DATA_W-2-:EXP_W] : op_a_i[DATA_W-2-:EXP_W];
-   assign B_sign     = comp ? op_b_i : op_a_i[DATA_W-1];
+   assign B_sign     = comp ? op_b_i[DATA_W-1] : op_a_i[DATA_W-1];
 
    // pipeline stage 1
    reg             A_sign_reg;
@@ -194,11 +194,15 @@ module iob_fp_add #(
       end
    end
 
-   // Addition
-   wire [MAN_W:0] Temp;
-   assign           Temp = (A_sign_reg2 ^ B_sign_reg2)? A_Mantissa_reg2 - B_Mantissa_reg2 : A_Mantissa_reg2 + B_Mantissa_reg2;
+   // Addition (extra bits included, so that subtraction borrows from them)
+   wire [MAN_W+EXTRA-1:0] A_Mantissa_ext;
+   wire [MAN_W+EXTRA-1:0] B_Mantissa_ext;
+   assign A_Mantissa_ext = {A_Mantissa_reg2, {EXTRA{1'b0}}};
+   assign B_Mantissa_ext = {B_Mantissa_reg2, guard_bit_reg, round_bit_reg, sticky_bit_reg};
+   wire [MAN_W+EXTRA:0] Temp;
+   assign           Temp = (A_sign_reg2 ^ B_sign_reg2)? A_Mantissa_ext - B_Mantissa_ext : A_Mantissa_ext + B_Mantissa_ext;
    wire carry;
-   assign carry = Temp[MAN_W];
+   assign carry = Temp[MAN_W+EXTRA];
 
    // pipeline stage 3
    reg                   A_sign_reg3;
@@ -221,7 +225,7 @@ module iob_fp_add #(
          A_sign_reg3     <= A_sign_reg2;
          A_Exponent_reg3 <= A_Exponent_reg2;
 
-         Temp_reg        <= {Temp[MAN_W-1:0], guard_bit_reg, round_bit_reg, sticky_bit_reg};
+         Temp_reg        <= Temp[MAN_W+EXTRA-1:0];
          carry_reg       <= carry;
 
          done_int3       <= done_int2;
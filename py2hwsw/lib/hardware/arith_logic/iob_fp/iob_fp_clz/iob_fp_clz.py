@@ -42,6 +42,7 @@ def setup(py_params_dict):
                     {
                         "name": "data_o",
                         "width": "$clog2(DATA_W+1)",
+                        "isvar": True,
                     },
                 ],
             },
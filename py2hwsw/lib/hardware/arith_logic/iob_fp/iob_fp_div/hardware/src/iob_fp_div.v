@@ -154,6 +154,7 @@ module iob_fp_div #(
    wire [EXP_W-1:0] Temp_Exponent;
    assign Temp_Exponent = A_Exponent_reg - B_Exponent_reg + BIAS;
    wire [2*MAN_W+EXTRA-1:0] Temp_Mantissa;  // = A_Mantissa_reg / B_Mantissa_reg;
+   wire [2*MAN_W+EXTRA-1:0] Temp_Remainder;  // < B_Mantissa_reg
    iob_div_subshift #(
       .DIVIDEND_W(2 * MAN_W + EXTRA)
    ) div_subshift (
@@ -168,7 +169,7 @@ module iob_fp_div #(
       .dividend_i ({1'b0, A_Mantissa, {(MAN_W + EXTRA - 1) {1'b0}}}),
       .divisor_i  ({{(MAN_W + EXTRA) {1'b0}}, B_Mantissa}),
       .quotient_o (Temp_Mantissa),
-      .remainder_o()
+      .remainder_o(Temp_Remainder)
    );
 
    // pipeline stage 2
@@ -187,7 +188,8 @@ module iob_fp_div #(
       end else begin
          Temp_sign_reg     <= Temp_sign;
          Temp_Exponent_reg <= Temp_Exponent;
-         Temp_Mantissa_reg <= Temp_Mantissa[MAN_W+EXTRA-1:0];
+         // Sticky bit includes the remainder
+         Temp_Mantissa_reg <= {Temp_Mantissa[MAN_W+EXTRA-1:1], Temp_Mantissa[0] | (|Temp_Remainder[MAN_W-1:0])};
 
          done_int2         <= done_int;
       end
@@ -0,0 +1,118 @@
+// SPDX-FileCopyrightText: 2026 IObundle
+//
+// SPDX-License-Identifier: CERN-OHL-S-2.0
+
+`timescale 1ns / 1ps
+
+// Random vectors test of the pipelined FPU.
+// Vectors {funct, op_a, op_b, res} are generated at setup by the reference model
+// in scripts/iob_fp_fpu_model.py. To regenerate with another seed:
+//    ./iob_fp_fpu_model.py -s <seed> src/iob_fp_fpu_vectors.hex
+
+module iob_fp_fpu_tb;
+
+   localparam DATA_W = 32;
+   localparam EXP_W = 8;
+   localparam TAG_W = 4;
+   localparam FUNCT_W = 4;
+   localparam VECTOR_W = FUNCT_W + 3 * DATA_W;
+   localparam N_VECTORS = 4096;
+
+   reg                clk = 0;
+   reg                rst = 0;
+
+   reg                start = 0;
+   reg  [FUNCT_W-1:0] funct = 0;
+   reg  [ DATA_W-1:0] op_a = 0;
+   reg  [ DATA_W-1:0] op_b = 0;
+   wire               ready;
+   wire [ DATA_W-1:0] res;
+   wire               done;
+   wire [  TAG_W-1:0] tag;
+
+   parameter clk_per = 10;  // clk period = 10 timeticks
+   always #(clk_per / 2) clk = ~clk;
+
+   reg     [VECTOR_W-1:0] vectors   [0:N_VECTORS-1];
+
+   integer                i;  // issued vectors
+   integer                j;  // checked results
+   integer                cycles;
+   integer                fd;
+
+   // Issue process
+   initial begin
+      $readmemh("src/iob_fp_fpu_vectors.hex", vectors, 0, N_VECTORS - 1);
+
+`ifdef VCD
+      $dumpfile("uut.vcd");
+      $dumpvars();
+`endif
+
+      @(posedge clk) #1;
+      rst = 1;
+      repeat (4) @(posedge clk) #1;
+      rst = 0;
+
+      i = 0;
+      while (i < N_VECTORS) begin
+         // Issue every cycle, with some bubbles
+         start = ($random % 8) != 0;
+         {funct, op_a, op_b} = vectors[i][VECTOR_W-1:DATA_W];
+         @(negedge clk);
+         if (start & ready) i = i + 1;
+         @(posedge clk) #1;
+      end
+      start = 0;
+   end
+
+   // Check process
+   initial begin
+      j      = 0;
+      cycles = 0;
+      @(negedge rst);
+      while (j < N_VECTORS) begin
+         @(posedge clk) #1;
+         cycles = cycles + 1;
+         if (done) begin
+            if (res !== vectors[j][DATA_W-1:0] || tag !== j[TAG_W-1:0]) begin
+               $fatal(1, "ERROR: vector %0d: funct=%0d op_a=%h op_b=%h: expected res=%h tag=%0d, got res=%h tag=%0d",
+                      j, vectors[j][VECTOR_W-1-:FUNCT_W], vectors[j][2*DATA_W+:DATA_W],
+                      vectors[j][DATA_W+:DATA_W], vectors[j][DATA_W-1:0], j[TAG_W-1:0], res, tag);
+            end
+            j = j + 1;
+         end
+      end
+
+      $display("INFO: %0d results checked in %0d cycles", N_VECTORS, cycles);
+      $display("%c[1;34m", 27);
+      $display("Test completed successfully.");
+      $display("%c[0m", 27);
+      fd = $fopen("test.log", "w");
+      $fdisplay(fd, "Test passed!");
+      $fclose(fd);
+      #(5 * clk_per) $finish();
+   end
+
+   // Instantiate the Unit Under Test (UUT)
+   iob_fp_fpu #(
+      .DATA_W   (DATA_W),
+      .EXP_W    (EXP_W),
+      .PIPELINED(1),
+      .TAG_W    (TAG_W)
+   ) uut (
+      .clk_i    (clk),
+      .rst_i    (rst),
+      .start_i  (start),
+      .funct_i  (funct),
+      .rs1_i    (op_a),
+      .rs2_i    (op_b),
+      .rs3_i    ({DATA_W{1'b0}}),
+      .rs1_int_i({DATA_W{1'b0}}),
+      .res_o    (res),
+      .done_o   (done),
+      .ready_o  (ready),
+      .tag_o    (tag)
+   );
+
+endmodule
@@ -29,9 +29,24 @@
 
 //`define __FULL_FPU__
 
+//
+// Pipelined mode (PIPELINED=1)
+//   Operations are issued with start_i while ready_o is set, one per cycle.
+//   ADD, SUB and MUL go through the add and multiply pipelines, padded to the
+//   same latency, so results leave in issue order. DIV is iterative: it is only
+//   issued with the pipelines empty, and nothing else is issued while it is busy.
+//   Each result is signaled by a one cycle pulse of done_o, with the tag_o issue
+//   number (modulo 2**TAG_W) of its operation.
+//   ADD_STAGES and MUL_STAGES add output register stages to the add and multiply
+//   units, to be retimed by synthesis. Other functions are not supported.
+//
 module iob_fp_fpu # (
               parameter DATA_W = 32,
-              parameter EXP_W = 8
+              parameter EXP_W = 8,
+              parameter PIPELINED = 0,
+              parameter ADD_STAGES = 0,
+              parameter MUL_STAGES = 0,
+              parameter TAG_W = 4
               )
    (
     input                   clk_i,
@@ -48,8 +63,12 @@ module iob_fp_fpu # (
     input [DATA_W-1:0]      rs1_int_i,
 
     // Outputs
-    output reg [DATA_W-1:0] res_o,
-    output                  done_o
+    output [DATA_W-1:0]     res_o,
+    output                  done_o,
+
+    // Pipelined mode
+    output                  ready_o,
+    output [TAG_W-1:0]      tag_o
     );
 
    reg                              add, sub;
@@ -97,6 +116,8 @@ module iob_fp_fpu # (
    wire [DATA_W-1:0]                float2uint_res;
 
    wire                             add_done, mul_done, div_done, sqrt_done, min_max_done, cmp_done, int2float_done, uint2float_done, float2int_done, float2uint_done;
+   reg [DATA_W-1:0]                 res_seq;
+   wire                             done_seq;
    reg                              done_int;
    reg                              done_reg;
 
@@ -113,9 +134,12 @@ module iob_fp_fpu # (
    wire                             float2int_start;
    wire                             float2uint_start;
    wire                             start_int;
-   assign                           add_start = any_add & ~(any_add_reg & ~ready_reg);
-   assign                           mul_start = any_mul & ~(any_mul_reg & ~ready_reg);
-   assign                           div_start = any_div & ~(any_div_reg & ~ready_reg);
+   wire                             add_start_pipe;
+   wire                             mul_start_pipe;
+   wire                             div_start_pipe;
+   assign                           add_start = PIPELINED? add_start_pipe: any_add & ~(any_add_reg & ~ready_reg);
+   assign                           mul_start = PIPELINED? mul_start_pipe: any_mul & ~(any_mul_reg & ~ready_reg);
+   assign                           div_start = PIPELINED? div_start_pipe: any_div & ~(any_div_reg & ~ready_reg);
    assign                           sqrt_start = any_sqrt & ~(any_sqrt_reg & ~ready_reg);
    assign                           min_max_start = any_min_max & ~(any_min_max_reg & ~ready_reg);
    assign                           cmp_start = any_cmp & ~(any_cmp_reg & ~ready_reg);
@@ -127,8 +151,8 @@ module iob_fp_fpu # (
 
    wire                             fpu_wait;
    wire                             ready;
-   assign                             fpu_wait = start_int | ~done_o;
-   assign                             ready = done_o & ~done_reg;
+   assign                             fpu_wait = start_int | ~done_seq;
+   assign                             ready = done_seq & ~done_reg;
 
    always @* begin
       add = 0;
@@ -211,7 +235,7 @@ module iob_fp_fpu # (
       if (rst_i) begin
          done_reg <= 1'b1;
       end else begin
-         done_reg <= done_o;
+         done_reg <= done_seq;
       end
    end
 
@@ -264,6 +288,9 @@ module iob_fp_fpu # (
       .res_o(mul_res)
       );
 
+   wire [DATA_W-1:0] div_op_a;
+   wire [DATA_W-1:0] div_op_b;
+
    iob_fp_div #(
             .DATA_W (DATA_W),
             .EXP_W  (EXP_W)
@@ -280,8 +307,8 @@ module iob_fp_fpu # (
       .start_i(div_start),
       .done_o(div_done),
 
-      .op_a_i(rs1_i),
-      .op_b_i(rs2_i),
+      .op_a_i(div_op_a),
+      .op_b_i(div_op_b),
       .res_o(div_res)
       );
 
@@ -387,50 +414,167 @@ module iob_fp_fpu # (
       );
 `endif
 
-   assign done_o = start_int? 1'b0: done_int;
+   assign done_seq = start_int? 1'b0: done_int;
 
    always @* begin
-      res_o = {DATA_W{1'b0}};
+      res_seq = {DATA_W{1'b0}};
       done_int = 1'b1;
 
       if (any_add) begin
          if (nmadd | nmsub) begin
-            res_o = {~add_res[DATA_W-1], add_res[DATA_W-2:0]};
+            res_seq = {~add_res[DATA_W-1], add_res[DATA_W-2:0]};
          end else begin
-            res_o = add_res;
+            res_seq = add_res;
          end
 
          done_int = add_done;
       end else if (any_mul) begin
-         res_o = mul_res;
+         res_seq = mul_res;
          done_int = mul_done;
       end else if (any_div) begin
-         res_o = div_res;
+         res_seq = div_res;
          done_int = div_done;
 `ifdef __FULL_FPU__
       end else if (any_sqrt) begin
-         res_o = sqrt_res;
+         res_seq = sqrt_res;
          done_int = sqrt_done;
       end else if (any_min_max) begin
-         res_o = min_max_res;
+         res_seq = min_max_res;
          done_int = min_max_done;
       end else if (any_cmp) begin
-         res_o = {{(DATA_W-1){1'b0}}, cmp_res};
+         res_seq = {{(DATA_W-1){1'b0}}, cmp_res};
          done_int = cmp_done;
       end else if (any_int2float) begin
-         res_o = int2float_res;
+         res_seq = int2float_res;
          done_int = int2float_done;
       end else if (any_uint2float) begin
-         res_o = uint2float_res;
+         res_seq = uint2float_res;
          done_int = uint2float_done;
       end else if (any_float2int) begin
-         res_o = float2int_res;
+         res_seq = float2int_res;
          done_int = float2int_done;
       end else if (any_float2uint) begin
-         res_o = float2uint_res;
+         res_seq = float2uint_res;
          done_int = float2uint_done;
 `endif
       end
    end
 
+   generate
+      if (PIPELINED) begin : pipelined_g
+         localparam ADD_LAT = 5 + ADD_STAGES;
+         localparam MUL_LAT = 4 + MUL_STAGES;
+         localparam PIPE_LAT = (ADD_LAT > MUL_LAT) ? ADD_LAT : MUL_LAT;
+
+         // Issue
+         wire issue_div = funct_i == `FPU_DIV;
+         wire pipe_empty;
+         wire div_busy;
+         assign ready_o = ~div_busy & (~issue_div | pipe_empty);
+
+         wire issue = start_i & ready_o;
+         assign add_start_pipe = issue & (funct_i == `FPU_ADD || funct_i == `FPU_SUB);
+         assign mul_start_pipe = issue & (funct_i == `FPU_MUL);
+
+         reg [TAG_W-1:0] issue_tag;
+         always @(posedge clk_i) begin
+            if (rst_i) begin
+               issue_tag <= {TAG_W{1'b0}};
+            end else if (issue) begin
+               issue_tag <= issue_tag + 1'b1;
+            end
+         end
+
+         // Add and multiply pipelines: valid, multiply select and tag of each stage
+         reg [PIPE_LAT-1:0]       pipe_valid;
+         reg [PIPE_LAT-1:0]       pipe_mul;
+         reg [PIPE_LAT*TAG_W-1:0] pipe_tag;
+         always @(posedge clk_i) begin
+            if (rst_i) begin
+               pipe_valid <= {PIPE_LAT{1'b0}};
+               pipe_mul   <= {PIPE_LAT{1'b0}};
+               pipe_tag   <= {(PIPE_LAT*TAG_W){1'b0}};
+            end else begin
+               pipe_valid <= {pipe_valid[PIPE_LAT-2:0], issue & ~issue_div};
+               pipe_mul   <= {pipe_mul[PIPE_LAT-2:0], mul_start_pipe};
+               pipe_tag   <= {pipe_tag[(PIPE_LAT-1)*TAG_W-1:0], issue_tag};
+            end
+         end
+         assign pipe_empty = ~|pipe_valid;
+
+         // Output register stages, padding the faster unit to the pipeline latency
+         wire [(PIPE_LAT-4)*DATA_W-1:0] add_res_dly;
+         wire [(PIPE_LAT-3)*DATA_W-1:0] mul_res_dly;
+         assign add_res_dly[0+:DATA_W] = add_res;
+         assign mul_res_dly[0+:DATA_W] = mul_res;
+         genvar                         i;
+         for (i = 1; i <= PIPE_LAT - 5; i = i + 1) begin : add_res_dly_g
+            reg [DATA_W-1:0] res_reg;
+            always @(posedge clk_i) begin
+               res_reg <= add_res_dly[(i-1)*DATA_W+:DATA_W];
+            end
+            assign add_res_dly[i*DATA_W+:DATA_W] = res_reg;
+         end
+         for (i = 1; i <= PIPE_LAT - 4; i = i + 1) begin : mul_res_dly_g
+            reg [DATA_W-1:0] res_reg;
+            always @(posedge clk_i) begin
+               res_reg <= mul_res_dly[(i-1)*DATA_W+:DATA_W];
+            end
+            assign mul_res_dly[i*DATA_W+:DATA_W] = res_reg;
+         end
+
+         // Division: operands are held, and the divider is started two cycles
+         // after issue, when its registered operands are valid
+         reg [DATA_W-1:0] div_op_a_reg;
+         reg [DATA_W-1:0] div_op_b_reg;
+         reg [TAG_W-1:0]  div_tag;
+         reg [1:0]        div_wait;
+         reg              div_run;
+         wire             div_valid = div_run & div_done;
+         always @(posedge clk_i) begin
+            if (rst_i) begin
+               div_op_a_reg <= {DATA_W{1'b0}};
+               div_op_b_reg <= {DATA_W{1'b0}};
+               div_tag      <= {TAG_W{1'b0}};
+               div_wait     <= 2'b00;
+               div_run      <= 1'b0;
+            end else begin
+               if (issue & issue_div) begin
+                  div_op_a_reg <= rs1_i;
+                  div_op_b_reg <= rs2_i;
+                  div_tag      <= issue_tag;
+               end
+               div_wait <= {div_wait[0], issue & issue_div};
+               if (div_wait[1]) begin
+                  div_run <= 1'b1;
+               end else if (div_valid) begin
+                  div_run <= 1'b0;
+               end
+            end
+         end
+         assign div_op_a = div_op_a_reg;
+         assign div_op_b = div_op_b_reg;
+         assign div_start_pipe = div_wait[1];
+         assign div_busy = |div_wait | div_run;
+
+         // Results, in issue order
+         assign done_o = pipe_valid[PIPE_LAT-1] | div_valid;
+         assign res_o  = div_valid? div_res:
+                         pipe_mul[PIPE_LAT-1]? mul_res_dly[(PIPE_LAT-4)*DATA_W+:DATA_W]:
+                                               add_res_dly[(PIPE_LAT-5)*DATA_W+:DATA_W];
+         assign tag_o  = div_valid? div_tag: pipe_tag[(PIPE_LAT-1)*TAG_W+:TAG_W];
+      end else begin : sequential_g
+         assign add_start_pipe = 1'b0;
+         assign mul_start_pipe = 1'b0;
+         assign div_start_pipe = 1'b0;
+         assign div_op_a = rs1_i;
+         assign div_op_b = rs2_i;
+
+         assign done_o  = done_seq;
+         assign res_o   = res_seq;
+         assign ready_o = done_seq;
+         assign tag_o   = {TAG_W{1'b0}};
+      end
+   endgenerate
+
 endmodule
@@ -2,10 +2,71 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
+import sys
+import os
+
+# Add reference model to python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+
+from iob_fp_fpu_model import gen_vectors, write_vectors
+
+# Number of test vectors for the testbench
+N_TEST_VECTORS = 4096
+
 
 def setup(py_params_dict):
     attributes_dict = {
         "generate_hw": False,
+        "confs": [
+            {
+                "name": "DATA_W",
+                "type": "P",
+                "val": "32",
+                "min": "NA",
+                "max": "NA",
+                "descr": "Data bus width",
+            },
+            {
+                "name": "EXP_W",
+                "type": "P",
+                "val": "8",
+                "min": "NA",
+                "max": "NA",
+                "descr": "Exponent width",
+            },
+            {
+                "name": "PIPELINED",
+                "type": "P",
+                "val": "0",
+                "min": "0",
+                "max": "1",
+                "descr": "Issue one operation per cycle, with ready_o/done_o handshake and in-order result tags (1), or one operation at a time, with start_i/done_o handshake (0)",
+            },
+            {
+                "name": "ADD_STAGES",
+                "type": "P",
+                "val": "0",
+                "min": "0",
+                "max": "NA",
+                "descr": "Extra output register stages of the add unit (pipelined mode)",
+            },
+            {
+                "name": "MUL_STAGES",
+                "type": "P",
+                "val": "0",
+                "min": "0",
+                "max": "NA",
+                "descr": "Extra output register stages of the multiply unit (pipelined mode)",
+            },
+            {
+                "name": "TAG_W",
+                "type": "P",
+                "val": "4",
+                "min": "1",
+                "max": "NA",
+                "descr": "Result tag width (pipelined mode)",
+            },
+        ],
         "subblocks": [
             {
                 "core_name": "iob_fp_add",
@@ -50,4 +111,18 @@ def setup(py_params_dict):
         ],
     }
 
+    # Generate testbench vectors with the reference model
+    if (
+        py_params_dict.get("py2hwsw_target") == "setup"
+        and py_params_dict.get("top_module") == "iob_fp_fpu"
+    ):
+        sim_src_dir = os.path.join(
+            py_params_dict["build_dir"], "hardware/simulation/src"
+        )
+        os.makedirs(sim_src_dir, exist_ok=True)
+        write_vectors(
+            os.path.join(sim_src_dir, "iob_fp_fpu_vectors.hex"),
+            gen_vectors(N_TEST_VECTORS),
+        )
+
     return attributes_dict
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# Reference model of the iob_fp_fpu, for single precision (DATA_W=32, EXP_W=8).
+#
+# Operands and results are IEEE-754 bit patterns. Python floats are double
+# precision, so the result of each operation is exact enough that rounding it to
+# single precision (with struct) gives the correctly rounded (to nearest even)
+# single precision result.
+#
+# The FPU units do not handle special values (zero, subnormals, infinities and
+# NaNs), so generated vectors only use normal operands with normal results.
+
+import argparse
+import random
+import struct
+
+# Function codes (see iob_fp_fpu.v)
+FPU_ADD = 0
+FPU_SUB = 1
+FPU_MUL = 2
+FPU_DIV = 3
+
+FUNCTIONS = {
+    FPU_ADD: lambda a, b: a + b,
+    FPU_SUB: lambda a, b: a - b,
+    FPU_MUL: lambda a, b: a * b,
+    FPU_DIV: lambda a, b: a / b,
+}
+
+# Exponent range of random operands, so that most results are normal
+MIN_EXP = 64
+MAX_EXP = 190
+
+
+def to_float(bits):
+    """Convert single precision bit pattern to python float"""
+    return struct.unpack("<f", struct.pack("<I", bits))[0]
+
+
+def to_bits(value):
+    """Round python float to single precision bit pattern"""
+    return struct.unpack("<I", struct.pack("<f", value))[0]
+
+
+def fpu(funct, op_a, op_b):
+    """Compute FPU result of given function code and operand bit patterns"""
+    return to_bits(FUNCTIONS[funct](to_float(op_a), to_float(op_b)))
+
+
+def is_normal(bits):
+    """Check if bit pattern is a normal number"""
+    return 0 < (bits >> 23) & 0xFF < 0xFF
+
+
+def in_domain(op_a, op_b, res):
+    """Check if FPU units give the IEEE-754 result for these operands.
+    Results with a zero fraction are excluded, as the rounding of the units does
+    not carry into the exponent.
+    """
+    return (
+        is_normal(op_a) and is_normal(op_b) and is_normal(res) and res & 0x7FFFFF != 0
+    )
+
+
+def random_operand(rng, exponent=None):
+    """Random normal operand, with given or random exponent"""
+    if exponent is None:
+        exponent = rng.randint(MIN_EXP, MAX_EXP)
+    return (rng.getrandbits(1) << 31) | (exponent << 23) | rng.getrandbits(23)
+
+
+def gen_vectors(n_vectors, seed=0, functs=(FPU_ADD, FPU_SUB, FPU_MUL, FPU_DIV)):
+    """Generate list of (funct, op_a, op_b, res) test vectors"""
+    rng = random.Random(seed)
+    vectors = []
+    while len(vectors) < n_vectors:
+        funct = rng.choice(functs)
+        op_a = random_operand(rng)
+        # Close exponents for add/sub, to test cancellation
+        if funct in (FPU_ADD, FPU_SUB) and rng.getrandbits(1):
+            exponent = (op_a >> 23) & 0xFF
+            op_b = random_operand(rng, exponent + rng.randint(-2, 2))
+        else:
+            op_b = random_operand(rng)
+        res = fpu(funct, op_a, op_b)
+        if in_domain(op_a, op_b, res):
+            vectors.append((funct, op_a, op_b, res))
+    return vectors
+
+
+def write_vectors(file_path, vectors):
+    """Write vectors to file for $readmemh, one {funct, op_a, op_b, res} per line"""
+    with open(file_path, "w") as f:
+        for funct, op_a, op_b, res in vectors:
+            f.write(f"{funct:01x}{op_a:08x}{op_b:08x}{res:08x}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate iob_fp_fpu test vectors")
+    parser.add_argument("file", help="Output hex file")
+    parser.add_argument("-n", type=int, default=4096, help="Number of vectors")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    write_vectors(args.file, gen_vectors(args.n, args.seed))
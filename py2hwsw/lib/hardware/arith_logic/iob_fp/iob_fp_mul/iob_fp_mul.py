@@ -592,7 +592,8 @@ def setup(py_params_dict):
       end else begin
          Temp_sign_reg     <= Temp_sign;
          Temp_Exponent_reg <= Temp_Exponent;
-         Temp_Mantissa_reg <= Temp_Mantissa[2*MAN_W-1-:MAN_W+EXTRA+1];
+         // Keep sticky bit of discarded product bits
+         Temp_Mantissa_reg <= {Temp_Mantissa[2*MAN_W-1-:MAN_W+EXTRA], Temp_Mantissa[MAN_W-EXTRA-1] | (|Temp_Mantissa[MAN_W-EXTRA-2:0])};
 
          done_int2         <= done_int;
       end
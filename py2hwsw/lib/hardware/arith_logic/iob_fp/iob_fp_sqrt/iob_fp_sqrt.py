@@ -157,6 +157,15 @@ def setup(py_params_dict):
             },
         ],
         "wires": [
+            {
+                "name": "int_sqrt_clk_en_rst",
+                "descr": "Integer square root clock, clock enable and reset",
+                "signals": [
+                    {"name": "clk_i"},
+                    {"name": "int_sqrt_cke", "width": 1},
+                    {"name": "rst_i"},
+                ],
+            },
             {
                 "name": "A_Mantissa",
                 "descr": "A_Mantissa wire",
@@ -297,8 +306,7 @@ def setup(py_params_dict):
                 "instance_name": "int_sqrt",
                 "parameters": {"DATA_W": "MAN_W+2", "FRACTIONAL_W": "MAN_W"},
                 "connect": {
-                    "clk_i": "clk_i",
-                    "rst_i": "rst_i",
+                    "clk_en_rst_s": "int_sqrt_clk_en_rst",
                     "start_i": "Do_start_int",
                     "done_o": "done_int",
                     "op_i": "iob_fp_sqrt_int",
@@ -309,6 +317,7 @@ def setup(py_params_dict):
         "snippets": [
             {
                 "verilog_code": """
+        assign int_sqrt_cke = 1'b1;
         assign iob_fp_sqrt_int=A_Exponent_diff_reg[0] ? {2'b00,A_Mantissa_reg} : {1'b0,A_Mantissa_reg,1'b0};
         assign done_o = (counter == END_COUNT[COUNT_W-1:0])? 1'b1: 1'b0;
    always @(posedge clk_i, posedge rst_i) begin
@@ -5,6 +5,18 @@
 
 def setup(py_params_dict):
     CSR_IF = py_params_dict["csr_if"] if "csr_if" in py_params_dict else "iob"
+    # Number of descriptors in each (write and read) descriptor ring. Without
+    # rings (depth 0), each transfer is started by software. Up to 128, so ring
+    # pointers fit byte registers.
+    DESC_RING_DEPTH = int(py_params_dict.get("desc_ring_depth", 0))
+    assert DESC_RING_DEPTH == 0 or (
+        DESC_RING_DEPTH & (DESC_RING_DEPTH - 1) == 0 and 2 <= DESC_RING_DEPTH <= 128
+    ), f"DMA descriptor ring depth must be 0 or a power of 2 between 2 and 128, not {DESC_RING_DEPTH}."
+    # Descriptor rings also load the write length and start transfers
+    w_chain_load = " | w_chain_load" if DESC_RING_DEPTH else ""
+    w_chain_start = " | w_chain_start" if DESC_RING_DEPTH else ""
+    r_chain_start = " | r_chain_start" if DESC_RING_DEPTH else ""
+
     attributes_dict = {
         "generate_hw": True,
         "confs": [
@@ -600,7 +612,7 @@ def setup(py_params_dict):
         ],
         "snippets": [
             {
-                "verilog_code": """
+                "verilog_code": f"""
     assign counter_en = axis_in_tvalid_i & axis_in_tready_o & receive_enabled;
     assign receive_enabled = axis_in_cnt != w_length_wdata_reg;
     assign receive_valid = axis_in_tvalid_i & receive_enabled;
@@ -610,9 +622,9 @@ def setup(py_params_dict):
     assign w_start_ready_wr = 1'b1;
     assign r_start_ready_wr = 1'b1;
 
-    assign w_length_wen_wr = w_length_valid_wr & |w_length_wstrb_wr & w_length_ready_wr;
-    assign w_start_wen_wr = w_start_valid_wr & |w_start_wstrb_wr & w_start_ready_wr;
-    assign r_start_wen_wr = r_start_valid_wr & |r_start_wstrb_wr & r_start_ready_wr;
+    assign w_length_wen_wr = w_length_valid_wr & |w_length_wstrb_wr & w_length_ready_wr{w_chain_load};
+    assign w_start_wen_wr = w_start_valid_wr & |w_start_wstrb_wr & w_start_ready_wr{w_chain_start};
+    assign r_start_wen_wr = r_start_valid_wr & |r_start_wstrb_wr & r_start_ready_wr{r_chain_start};
 
     assign w_bursttype_wr = 2'b01;
     assign r_bursttype_wr = 2'b01;
@@ -621,4 +633,280 @@ def setup(py_params_dict):
         ],
     }
 
+    if DESC_RING_DEPTH:
+        add_desc_rings(attributes_dict, DESC_RING_DEPTH)
+
     return attributes_dict
+
+
+def find_by_name(elements, name, key="name"):
+    """Return element of list of dictionaries with given name"""
+    return next(e for e in elements if e[key] == name)
+
+
+def add_desc_rings(attributes_dict, depth):
+    """Add write and read descriptor rings, their CSRs and completion interrupt.
+    Each ring starts the transfers of its descriptors back-to-back, so software
+    only needs to push descriptors while the ring is not full.
+    """
+    ring_addr_w = depth.bit_length() - 1
+
+    attributes_dict["confs"].append(
+        {
+            "name": "DESC_RING_DEPTH",
+            "type": "C",
+            "val": str(depth),
+            "min": "2",
+            "max": "NA",
+            "descr": "Number of descriptors in each descriptor ring",
+        }
+    )
+    attributes_dict["ports"].append(
+        {
+            "name": "interrupt_o",
+            "descr": "Descriptor ring completion interrupt",
+            "signals": [
+                {"name": "interrupt_o", "width": 1},
+            ],
+        }
+    )
+
+    # Transfer address and length are selected from the descriptor rings when
+    # they start a transfer
+    wires = attributes_dict["wires"]
+    config_write = find_by_name(wires, "config_write")["signals"]
+    config_write[0] = {"name": "w_xfer_addr", "width": "AXI_ADDR_W"}
+    config_read = find_by_name(wires, "config_read")["signals"]
+    config_read[0] = {"name": "r_xfer_addr", "width": "AXI_ADDR_W"}
+    config_read[1] = {"name": "r_xfer_length", "width": "WLEN_W"}
+    find_by_name(attributes_dict["subblocks"], "w_length", "instance_name")["connect"][
+        "data_i"
+    ] = "w_length_wdata_int"
+    wires.append(
+        {
+            "name": "w_length_wdata_int",
+            "descr": "Write length loaded by software or by write descriptor ring",
+            "signals": [
+                {"name": "w_length_wdata_int", "width": "WLEN_W"},
+            ],
+        }
+    )
+
+    csrs = find_by_name(attributes_dict["subblocks"], "csrs", "instance_name")
+    chain_regs = []
+    for d, direction, len_w in [("w", "write", "WLEN_W"), ("r", "read", "RLEN_W")]:
+        chain_regs += [
+            {
+                "name": f"{d}_desc_addr",
+                "mode": "W",
+                "n_bits": "AXI_ADDR_W",
+                "rst_val": 0,
+                "log2n_items": 0,
+                "descr": f"DMA {direction} descriptor start address.",
+            },
+            {
+                "name": f"{d}_desc_len",
+                "mode": "W",
+                "n_bits": len_w,
+                "rst_val": 0,
+                "log2n_items": 0,
+                "descr": f"DMA {direction} descriptor length in words.",
+            },
+            {
+                "name": f"{d}_desc_flags",
+                "mode": "W",
+                "n_bits": 1,
+                "rst_val": 0,
+                "log2n_items": 0,
+                "descr": f"DMA {direction} descriptor flags. Bit 0: interrupt when the descriptor transfer finishes.",
+            },
+            {
+                "name": f"{d}_desc_push",
+                "type": "NOAUTO",
+                "mode": "W",
+                "n_bits": 1,
+                "rst_val": 0,
+                "log2n_items": 0,
+                "descr": f"DMA {direction} descriptor push: writing any value pushes the descriptor to the tail of the {direction} ring (ignored if ring is full).",
+            },
+            {
+                "name": f"{d}_ring_head",
+                "mode": "R",
+                "n_bits": ring_addr_w + 1,
+                "rst_val": 0,
+                "log2n_items": 0,
+                "descr": f"DMA {direction} ring head: number of finished descriptors (modulo {2 * depth}).",
+            },
+            {
+                "name": f"{d}_ring_tail",
+                "mode": "R",
+                "n_bits": ring_addr_w + 1,
+                "rst_val": 0,
+                "log2n_items": 0,
+                "descr": f"DMA {direction} ring tail: number of pushed descriptors (modulo {2 * depth}).",
+            },
+        ]
+        csrs["connect"] |= {
+            f"{d}_desc_addr_o": f"{d}_desc_addr",
+            f"{d}_desc_len_o": f"{d}_desc_len",
+            f"{d}_desc_flags_o": f"{d}_desc_flags",
+            f"{d}_desc_push_io": f"{d}_desc_push",
+            f"{d}_ring_head_i": f"{d}_ring_head",
+            f"{d}_ring_tail_i": f"{d}_ring_tail",
+        }
+        wires += [
+            {
+                "name": f"{d}_desc_addr",
+                "descr": "",
+                "signals": [
+                    {"name": f"{d}_desc_addr_wr", "width": "AXI_ADDR_W"},
+                ],
+            },
+            {
+                "name": f"{d}_desc_len",
+                "descr": "",
+                "signals": [
+                    {"name": f"{d}_desc_len_wr", "width": len_w},
+                ],
+            },
+            {
+                "name": f"{d}_desc_flags",
+                "descr": "",
+                "signals": [
+                    {"name": f"{d}_desc_flags_wr", "width": 1},
+                ],
+            },
+            {
+                "name": f"{d}_desc_push",
+                "descr": "",
+                "signals": [
+                    {"name": f"{d}_desc_push_valid_wr", "width": 1},
+                    {"name": f"{d}_desc_push_wdata_wr", "width": 1},
+                    {"name": f"{d}_desc_push_wstrb_wr", "width": 1},
+                    {"name": f"{d}_desc_push_ready_wr", "width": 1},
+                ],
+            },
+            {
+                "name": f"{d}_ring_head",
+                "descr": "",
+                "signals": [
+                    {"name": f"{d}_ring_head_rd", "width": ring_addr_w + 1},
+                ],
+            },
+            {
+                "name": f"{d}_ring_tail",
+                "descr": "",
+                "signals": [
+                    {"name": f"{d}_ring_tail_rd", "width": ring_addr_w + 1},
+                ],
+            },
+            # Descriptor ring wires
+            {
+                "name": f"{d}_ring_push",
+                "descr": f"Push to {direction} descriptor ring",
+                "signals": [
+                    {"name": f"{d}_desc_push_wen", "width": 1},
+                    {"name": f"{d}_desc_addr_wr"},
+                    {"name": f"{d}_desc_len_wr"},
+                    {"name": f"{d}_desc_flags_wr"},
+                ],
+            },
+            {
+                "name": f"{d}_ring_pointers",
+                "descr": f"{direction.capitalize()} descriptor ring pointers",
+                "signals": [
+                    {"name": f"{d}_ring_head_rd"},
+                    {"name": f"{d}_ring_tail_rd"},
+                ],
+            },
+            {
+                "name": f"{d}_ring_xfer",
+                "descr": f"{direction.capitalize()} transfers started by descriptor ring",
+                "signals": [
+                    {"name": f"{d}_chain_addr", "width": "AXI_ADDR_W"},
+                    {"name": f"{d}_chain_len", "width": len_w},
+                    {"name": f"{d}_chain_load", "width": 1},
+                    {"name": f"{d}_chain_start", "width": 1},
+                    {"name": f"{d}_busy_rd"},
+                ],
+            },
+            {
+                "name": f"{d}_ring_irq",
+                "descr": f"{direction.capitalize()} descriptor ring pending interrupt",
+                "signals": [
+                    {"name": f"{d}_irq_clear", "width": 1},
+                    {"name": f"{d}_irq", "width": 1},
+                ],
+            },
+        ]
+        attributes_dict["subblocks"].append(
+            {
+                "core_name": "iob_dma_desc_ring",
+                "instance_name": f"{d}_desc_ring",
+                "instance_description": f"{direction.capitalize()} descriptor ring",
+                "parameters": {
+                    "ADDR_W": "AXI_ADDR_W",
+                    "LEN_W": len_w,
+                    "RING_ADDR_W": ring_addr_w,
+                },
+                "connect": {
+                    "clk_en_rst_s": "clk_en_rst_s",
+                    "rst_i": "rst_i",
+                    "push_i": f"{d}_ring_push",
+                    "pointers_o": f"{d}_ring_pointers",
+                    "xfer_io": f"{d}_ring_xfer",
+                    "irq_io": f"{d}_ring_irq",
+                },
+            }
+        )
+
+    chain_regs.append(
+        {
+            "name": "chain_irq",
+            "descr": "This CSR will be replaced by common interrupt CSRs: status, mask, and clear. Bit 0: write ring, bit 1: read ring.",
+            "type": "INTERRUPT",
+        }
+    )
+    csrs["csrs"].append(
+        {
+            "name": "dma_chain",
+            "descr": "DMA descriptor rings software accessible registers.",
+            "regs": chain_regs,
+        }
+    )
+    csrs["connect"] |= {
+        "chain_irq_status_i": "chain_irq_status",
+        "chain_irq_mask_o": "chain_irq_mask",
+        "chain_irq_clear_o": "chain_irq_clear",
+    }
+    for reg, suffix in [("status", "rd"), ("mask", "wr"), ("clear", "wr")]:
+        wires.append(
+            {
+                "name": f"chain_irq_{reg}",
+                "descr": "",
+                "signals": [
+                    {"name": f"chain_irq_{reg}_{suffix}", "width": 32},
+                ],
+            }
+        )
+
+    attributes_dict["snippets"].append(
+        {
+            "verilog_code": """
+    assign w_desc_push_ready_wr = 1'b1;
+    assign r_desc_push_ready_wr = 1'b1;
+    assign w_desc_push_wen = w_desc_push_valid_wr & |w_desc_push_wstrb_wr & w_desc_push_ready_wr;
+    assign r_desc_push_wen = r_desc_push_valid_wr & |r_desc_push_wstrb_wr & r_desc_push_ready_wr;
+
+    assign w_xfer_addr = w_chain_start ? w_chain_addr : w_addr_wr;
+    assign w_length_wdata_int = w_chain_load ? w_chain_len : w_length_wdata_wr;
+    assign r_xfer_addr = r_chain_start ? r_chain_addr : r_addr_wr;
+    assign r_xfer_length = r_chain_start ? r_chain_len : r_length_wr;
+
+    assign w_irq_clear = chain_irq_clear_wr[0];
+    assign r_irq_clear = chain_irq_clear_wr[1];
+    assign chain_irq_status_rd = {30'd0, r_irq, w_irq};
+    assign interrupt_o = |(chain_irq_status_rd & chain_irq_mask_wr);
+""",
+        }
+    )
@@ -36,3 +36,59 @@ uint8_t dma_write_busy() { return (iob_dma_csrs_get_w_busy()); }
 
 // Check if DMA is busy for new read transfer
 uint8_t dma_read_busy() { return (iob_dma_csrs_get_r_busy()); }
+
+#ifdef IOB_DMA_DESC_RING_DEPTH
+// Descriptor rings functions
+
+// Number of descriptors in ring, given its head and tail pointers
+static uint32_t dma_ring_used(uint8_t head, uint8_t tail) {
+  return (uint8_t)(tail - head) & (2 * IOB_DMA_DESC_RING_DEPTH - 1);
+}
+
+// Push a chain of descriptors to the descriptor rings
+// Each ring starts the transfer of a descriptor as soon as the previous one
+// finishes, so this function only waits while the ring is full.
+// desc: First descriptor of the chain.
+void dma_submit_chain(dma_desc_t *desc) {
+  for (; desc; desc = desc->next) {
+    if (desc->flags & DMA_DESC_READ) {
+      while (dma_ring_used(iob_dma_csrs_get_r_ring_head(),
+                           iob_dma_csrs_get_r_ring_tail()) ==
+             IOB_DMA_DESC_RING_DEPTH)
+        ;
+      iob_dma_csrs_set_r_desc_addr(desc->addr);
+      iob_dma_csrs_set_r_desc_len(desc->len);
+      iob_dma_csrs_set_r_desc_flags(desc->flags & DMA_DESC_IRQ);
+      iob_dma_csrs_set_r_desc_push(1);
+    } else {
+      while (dma_ring_used(iob_dma_csrs_get_w_ring_head(),
+                           iob_dma_csrs_get_w_ring_tail()) ==
+             IOB_DMA_DESC_RING_DEPTH)
+        ;
+      iob_dma_csrs_set_w_desc_addr(desc->addr);
+      iob_dma_csrs_set_w_desc_len(desc->len);
+      iob_dma_csrs_set_w_desc_flags(desc->flags & DMA_DESC_IRQ);
+      iob_dma_csrs_set_w_desc_push(1);
+    }
+  }
+}
+
+// Check if all transfers of the descriptor rings finished
+uint8_t dma_poll_done() {
+  return (iob_dma_csrs_get_w_ring_head() == iob_dma_csrs_get_w_ring_tail()) &&
+         (iob_dma_csrs_get_r_ring_head() == iob_dma_csrs_get_r_ring_tail());
+}
+
+// Enable completion interrupts (bit 0: write ring, bit 1: read ring)
+void dma_chain_irq_enable(uint32_t mask) {
+  iob_dma_csrs_set_chain_irq_mask(mask);
+}
+
+// Get and clear pending completion interrupts
+uint32_t dma_chain_irq_ack() {
+  uint32_t status = iob_dma_csrs_get_chain_irq_status();
+  iob_dma_csrs_set_chain_irq_clear(status);
+  iob_dma_csrs_set_chain_irq_clear(0);
+  return status;
+}
+#endif
@@ -9,6 +9,7 @@
 
 #include <stdint.h>
 
+#include "iob_dma_conf.h"
 #include "iob_dma_csrs.h"
 
 // DMA functions
@@ -26,4 +27,30 @@ uint8_t dma_write_busy();
 
 uint8_t dma_read_busy();
 
+#ifdef IOB_DMA_DESC_RING_DEPTH
+// Descriptor flags
+#define DMA_DESC_IRQ 0x1  // interrupt when the transfer finishes
+#define DMA_DESC_READ 0x2 // read transfer (write transfer if not set)
+
+// Transfer descriptor
+typedef struct dma_desc {
+  uint32_t addr;         // physical address of external memory
+  uint32_t len;          // amount of 32-bit words to transfer
+  uint32_t flags;        // DMA_DESC_* flags
+  struct dma_desc *next; // next descriptor of chain (NULL for last)
+} dma_desc_t;
+
+// Push a chain of descriptors to the descriptor rings
+void dma_submit_chain(dma_desc_t *desc);
+
+// Check if all transfers of the descriptor rings finished
+uint8_t dma_poll_done();
+
+// Enable completion interrupts (bit 0: write ring, bit 1: read ring)
+void dma_chain_irq_enable(uint32_t mask);
+
+// Get and clear pending completion interrupts
+uint32_t dma_chain_irq_ack();
+#endif
+
 #endif //_DMA_H_
@@ -0,0 +1,159 @@
+// SPDX-FileCopyrightText: 2026 IObundle
+//
+// SPDX-License-Identifier: CERN-OHL-S-2.0
+
+`timescale 1ns / 1ps
+
+/*
+DMA descriptor ring
+   Software pushes descriptors {addr, len, flags} at the tail of the ring.
+   While the ring is not empty and the transfer unit is not busy, the descriptor
+   at the head is read, its length is loaded (xfer_load_o) and its transfer is
+   started (xfer_start_o). When the transfer unit is no longer busy, the head is
+   advanced and, if bit 0 of the descriptor flags is set, the pending interrupt
+   (irq_o) is set until cleared by irq_clear_i.
+*/
+
+module iob_dma_desc_ring #(
+   parameter ADDR_W      = 1,
+   parameter LEN_W       = 1,
+   parameter RING_ADDR_W = 2
+) (
+   // Global signals
+   `include "iob_dma_desc_ring_iob_clk_s_port.vs"
+   input rst_i,
+
+   // Descriptor push
+   input              push_i,
+   input [ADDR_W-1:0] addr_i,
+   input [ LEN_W-1:0] len_i,
+   input              flags_i,
+
+   // Ring pointers
+   output [(RING_ADDR_W+1)-1:0] head_o,
+   output [(RING_ADDR_W+1)-1:0] tail_o,
+
+   // Transfer control
+   output [ADDR_W-1:0] xfer_addr_o,
+   output [ LEN_W-1:0] xfer_len_o,
+   output reg          xfer_load_o,
+   output reg          xfer_start_o,
+   input               xfer_busy_i,
+
+   // Interrupt
+   input  irq_clear_i,
+   output irq_o
+);
+
+   localparam IDLE = 2'd0, LOAD = 2'd1, START = 2'd2, RUN = 2'd3;
+   localparam DESC_W = ADDR_W + LEN_W + 1;
+
+   wire                       empty = (head_o == tail_o);
+   wire                       full = (head_o == {~tail_o[RING_ADDR_W], tail_o[0+:RING_ADDR_W]});
+   wire                       push = push_i & ~full;
+
+   wire [         DESC_W-1:0] desc;
+   wire                       desc_flags = desc[DESC_W-1];
+   assign xfer_addr_o = desc[0+:ADDR_W];
+   assign xfer_len_o  = desc[ADDR_W+:LEN_W];
+
+   reg  [              2-1:0] state_nxt;
+   wire [              2-1:0] state;
+   reg  [(RING_ADDR_W+1)-1:0] head_nxt;
+   reg                        desc_ren;
+   reg                        done;
+
+   always @* begin
+      // FSM
+      // Default assignments
+      state_nxt    = state;
+      head_nxt     = head_o;
+      desc_ren     = 1'b0;
+      xfer_load_o  = 1'b0;
+      xfer_start_o = 1'b0;
+      done         = 1'b0;
+
+      case (state)
+         IDLE: begin
+            if (!empty && !xfer_busy_i) begin
+               // Read descriptor at head
+               desc_ren  = 1'b1;
+               state_nxt = LOAD;
+            end
+         end
+         LOAD: begin
+            xfer_load_o = 1'b1;
+            state_nxt   = START;
+         end
+         START: begin
+            xfer_start_o = 1'b1;
+            state_nxt    = RUN;
+         end
+         default: begin  // RUN
+            if (!xfer_busy_i) begin
+               head_nxt  = head_o + 1'b1;
+               done      = desc_flags;
+               state_nxt = IDLE;
+            end
+         end
+      endcase
+   end
+
+   // State register
+   iob_reg_car #(
+      .DATA_W (2),
+      .RST_VAL(IDLE)
+   ) state_reg (
+       `include "iob_dma_desc_ring_iob_clk_s_s_portmap.vs"
+       .rst_i (rst_i),
+       .data_i(state_nxt),
+       .data_o(state)
+   );
+
+   // Ring pointers
+   iob_reg_car #(
+      .DATA_W (RING_ADDR_W + 1),
+      .RST_VAL({(RING_ADDR_W + 1) {1'b0}})
+   ) head_reg (
+       `include "iob_dma_desc_ring_iob_clk_s_s_portmap.vs"
+       .rst_i (rst_i),
+       .data_i(head_nxt),
+       .data_o(head_o)
+   );
+
+   iob_reg_car #(
+      .DATA_W (RING_ADDR_W + 1),
+      .RST_VAL({(RING_ADDR_W + 1) {1'b0}})
+   ) tail_reg (
+       `include "iob_dma_desc_ring_iob_clk_s_s_portmap.vs"
+       .rst_i (rst_i),
+       .data_i(push ? tail_o + 1'b1 : tail_o),
+       .data_o(tail_o)
+   );
+
+   // Pending interrupt
+   iob_reg_car #(
+      .DATA_W (1),
+      .RST_VAL(1'd0)
+   ) irq_reg (
+       `include "iob_dma_desc_ring_iob_clk_s_s_portmap.vs"
+       .rst_i (rst_i),
+       .data_i((irq_o & ~irq_clear_i) | done),
+       .data_o(irq_o)
+   );
+
+   // Descriptor memory
+   iob_ram_t2p #(
+      .DATA_W(DESC_W),
+      .ADDR_W(RING_ADDR_W)
+   ) desc_mem (
+      .clk_i   (clk_i),
+      .w_en_i  (push),
+      .w_addr_i(tail_o[0+:RING_ADDR_W]),
+      .w_data_i({flags_i, len_i, addr_i}),
+      .r_en_i  (desc_ren),
+      .r_addr_i(head_o[0+:RING_ADDR_W]),
+      .r_data_o(desc)
+   );
+
+endmodule
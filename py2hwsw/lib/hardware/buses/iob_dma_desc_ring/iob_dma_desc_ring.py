@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# DMA descriptor ring.
+#
+# Holds up to 2**RING_ADDR_W transfer descriptors {addr, len, flags}, pushed by
+# software at the tail, and starts the transfer of each one, in order, as soon as
+# the previous one finishes. The head pointer is advanced when a transfer
+# finishes. Descriptors with the interrupt on completion flag (bit 0 of flags) set
+# the pending interrupt when their transfer finishes.
+#
+# Head and tail pointers have one more bit than the ring address, so the ring is
+# empty when they are equal and full when they differ by 2**RING_ADDR_W.
+
+
+def setup(py_params_dict):
+    attributes_dict = {
+        "generate_hw": False,
+        "confs": [
+            {
+                "name": "ADDR_W",
+                "type": "P",
+                "val": "1",
+                "min": "1",
+                "max": "32",
+                "descr": "Transfer address width",
+            },
+            {
+                "name": "LEN_W",
+                "type": "P",
+                "val": "1",
+                "min": "1",
+                "max": "32",
+                "descr": "Transfer length width",
+            },
+            {
+                "name": "RING_ADDR_W",
+                "type": "P",
+                "val": "2",
+                "min": "1",
+                "max": "NA",
+                "descr": "Log2 of number of descriptors in ring",
+            },
+        ],
+        "ports": [
+            {
+                "name": "clk_en_rst_s",
+                "signals": {
+                    "type": "iob_clk",
+                },
+                "descr": "Clock, clock enable and reset",
+            },
+            {
+                "name": "rst_i",
+                "descr": "Synchronous reset interface",
+                "signals": [
+                    {"name": "rst_i", "width": 1},
+                ],
+            },
+            {
+                "name": "push_i",
+                "descr": "Descriptor push interface. Pushes to a full ring are ignored.",
+                "signals": [
+                    {"name": "push_i", "width": 1},
+                    {"name": "addr_i", "width": "ADDR_W"},
+                    {"name": "len_i", "width": "LEN_W"},
+                    {"name": "flags_i", "width": 1},
+                ],
+            },
+            {
+                "name": "pointers_o",
+                "descr": "Ring head (next descriptor to finish) and tail (next descriptor to push) pointers",
+                "signals": [
+                    {"name": "head_o", "width": "RING_ADDR_W+1"},
+                    {"name": "tail_o", "width": "RING_ADDR_W+1"},
+                ],
+            },
+            {
+                "name": "xfer_io",
+                "descr": "Transfer control interface. The length is loaded one cycle before the start of the transfer.",
+                "signals": [
+                    {"name": "xfer_addr_o", "width": "ADDR_W"},
+                    {"name": "xfer_len_o", "width": "LEN_W"},
+                    {"name": "xfer_load_o", "width": 1},
+                    {"name": "xfer_start_o", "width": 1},
+                    {"name": "xfer_busy_i", "width": 1},
+                ],
+            },
+            {
+                "name": "irq_io",
+                "descr": "Pending interrupt and its clear input",
+                "signals": [
+                    {"name": "irq_clear_i", "width": 1},
+                    {"name": "irq_o", "width": 1},
+                ],
+            },
+        ],
+        "subblocks": [
+            {"core_name": "iob_ram_t2p"},
+            {
+                "core_name": "iob_reg",
+                "port_params": {
+                    "clk_en_rst_s": "c_a_r",
+                },
+            },
+        ],
+    }
+
+    return attributes_dict
@@ -25,6 +25,27 @@ def setup(py_params_dict):
     ADDR_W = int(py_params_dict["addr_w"]) if "addr_w" in py_params_dict else 32
     DATA_W = int(py_params_dict["data_w"]) if "data_w" in py_params_dict else 32
 
+    # Optional decode table. Format: [[base, addr_w], ...] (one entry per manager)
+    # By default, the managers are selected by the most significant bits of the address.
+    ADDR_MAP = py_params_dict.get("addr_map", None)
+    if ADDR_MAP:
+        assert len(ADDR_MAP) == NUM_MANAGERS, print(
+            "Error: Decode table must have one entry per manager interface."
+        )
+        for base, addr_w in ADDR_MAP:
+            assert base % (1 << addr_w) == 0, print(
+                f"Error: Base address {base:#x} not aligned to its size."
+            )
+        # Only decode the bits between the largest used address and the smallest manager
+        DEC_MSB = (
+            max(base + (1 << addr_w) for base, addr_w in ADDR_MAP) - 1
+        ).bit_length() - 1
+        DEC_LSB = min(addr_w for _, addr_w in ADDR_MAP)
+        assert DEC_MSB < ADDR_W, print("Error: Decode table exceeds address width.")
+        MANAGERS_ADDR_W = [addr_w for _, addr_w in ADDR_MAP]
+    else:
+        MANAGERS_ADDR_W = [ADDR_W - NBITS] * NUM_MANAGERS
+
     attributes_dict = {
         "name": py_params_dict["name"],
         "generate_hw": True,
@@ -68,7 +89,7 @@ def setup(py_params_dict):
                     # "file_prefix": f"{py_params_dict['name']}_m{port_idx}_",
                     "prefix": f"m{port_idx}_",
                     "DATA_W": DATA_W,
-                    "ADDR_W": ADDR_W - NBITS,
+                    "ADDR_W": MANAGERS_ADDR_W[port_idx],
                 },
             },
         )
@@ -326,7 +347,7 @@ def setup(py_params_dict):
     for port_idx in range(NUM_MANAGERS):
         verilog_code += f"""
     assign m{port_idx}_iob_valid_o = demux_valid_output[{port_idx}+:1];
-    assign m{port_idx}_iob_addr_o = demux_addr_output[{port_idx*ADDR_W}+:{ADDR_W-NBITS}];
+    assign m{port_idx}_iob_addr_o = demux_addr_output[{port_idx*ADDR_W}+:{MANAGERS_ADDR_W[port_idx]}];
     assign m{port_idx}_iob_wdata_o = demux_wdata_output[{port_idx*DATA_W}+:{DATA_W}];
     assign m{port_idx}_iob_wstrb_o = demux_wstrb_output[{port_idx*int(DATA_W/8)}+:{int(DATA_W/8)}];
 """
@@ -338,6 +359,33 @@ def setup(py_params_dict):
             verilog_code += f"m{port_idx}_iob_{signal}_i, "
         verilog_code = verilog_code[:-2] + "};\n"
 
+    # Address decoder function, based on decode table
+    if ADDR_MAP:
+        dec_w = DEC_MSB - DEC_LSB + 1
+        verilog_code += f"""
+    // Address decoder
+    function automatic [{NBITS-1}:0] addr_decode;
+        input [{DEC_MSB}:{DEC_LSB}] addr;
+        begin
+            casez (addr)
+"""
+        for port_idx, (base, addr_w) in enumerate(ADDR_MAP):
+            # Bits below the manager's address width are don't cares
+            pattern = "".join(
+                "?" if bit < addr_w else str((base >> bit) & 1)
+                for bit in range(DEC_MSB, DEC_LSB - 1, -1)
+            )
+            verilog_code += f"                {dec_w}'b{pattern}: addr_decode = {NBITS}'d{port_idx};\n"
+        verilog_code += f"""\
+                default: addr_decode = {NBITS}'d0;
+            endcase
+        end
+    endfunction
+"""
+        sel_code = f"addr_decode(s_iob_addr_i[{DEC_MSB}:{DEC_LSB}])"
+    else:
+        sel_code = f"s_iob_addr_i[{ADDR_W-1}-:{NBITS}]"
+
     # Create snippet with muxer and demuxer connections
     attributes_dict["snippets"] = [
         {
@@ -363,7 +411,7 @@ def setup(py_params_dict):
 """
         + f"""\
       // Allow selector to be changed
-      sel = s_iob_addr_i[{ADDR_W-1}-:{NBITS}];
+      sel = {sel_code};
 """
         + """\
       if (s_iob_valid_i && ~s_iob_ready_o) begin
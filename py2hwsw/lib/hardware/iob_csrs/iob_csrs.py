@@ -76,6 +76,12 @@ def setup(py_params_dict):
         "autoaddr": True,
         # Allow overlap between Read and Write register addresses
         "rw_overlap": False,
+        # Read decoder of auto CSRs:
+        # "compare" (address range comparators), "case" (word index case statement)
+        # or "tree" (balanced mux tree over word index)
+        "read_decoder": "compare",
+        # Register output of word-indexed read decoder (does not change read latency)
+        "read_pipeline": False,
         # Build directory for csrs (usually auto-passed py py2hwsw).
         "build_dir": "",
         # CSR Configuration to use
@@ -361,6 +367,8 @@ def setup(py_params_dict):
         "csr_if": params["csr_if"],
         "rw_overlap": params["rw_overlap"],
         "autoaddr": params["autoaddr"],
+        "read_decoder": params["read_decoder"],
+        "read_pipeline": params["read_pipeline"],
         "build_dir": params["build_dir"],
         "doc_conf": params["doc_conf"],
     }
@@ -14,6 +14,7 @@ from math import ceil, log, log2
 from latex import write_table
 import iob_colors
 import re
+from param_context import param_context
 
 
 def convert_int(value):
@@ -27,73 +28,18 @@ def convert_int(value):
         return value
 
 
-def clog2(val):
-    """Used by eval_param_expression"""
-    return ceil(log2(val))
-
-
-def eval_param_expression(param_expression, params_dict):
-    """Given a mathematical string with parameters, replace every parameter by
-    its numeric value and tries to evaluate the string.
-    param_expression: string defining a math expression that may contain parameters
-    params_dict: dictionary of parameters, where the key is the parameter name and the value is its value
-    """
-    if type(param_expression) is int:
-        return param_expression
-    else:
-        original_expression = param_expression
-        # Split string to separate parameters/macros from the rest
-        split_expression = re.split(r"([^\w_])", param_expression)
-        # Replace each parameter, following the reverse order of parameter list.
-        # The reversed order allows replacing parameters recursively (parameters may
-        # have values with parameters that came before).
-        for param_name, param_value in reversed(params_dict.items()):
-            # Replace every instance of this parameter by its value
-            for idx, word in enumerate(split_expression):
-                if word == param_name:
-                    # Replace parameter/macro by its value
-                    split_expression[idx] = str(param_value)
-                    # Remove '`' char if it was a macro
-                    if idx > 0 and split_expression[idx - 1] == "`":
-                        split_expression[idx - 1] = ""
-                    # resplit the string in case the parameter value contains other parameters
-                    split_expression = re.split(r"([^\w_])", "".join(split_expression))
-        # Join back the string
-        param_expression = "".join(split_expression)
-        # Evaluate $clog2 expressions
-        param_expression = param_expression.replace("$clog2", "clog2")
-        # Evaluate IOB_MAX and IOB_MIN expressions
-        param_expression = param_expression.replace("iob_max", "max")
-        param_expression = param_expression.replace("iob_min", "min")
-
-        # Try to calculate string as it should only contain numeric values
-        try:
-            return eval(param_expression)
-        except:
-            sys.exit(
-                f"Error: string '{original_expression}' evaluated to '{param_expression}' is not a numeric expression."
-            )
-
-
 def eval_param_expression_from_config(param_expression, confs, param_attribute):
     """Given a mathematical string with parameters, replace every parameter by its
     numeric value and tries to evaluate the string. The parameters are taken from the
     confs dictionary.
+    To evaluate multiple expressions with the same confs, use a param_context instead.
     param_expression: string defining a math expression that may contain parameters.
     confs: list of dictionaries, each of which describes a parameter and has attributes:
            'name', 'val' and 'max'.
     param_attribute: name of the attribute in the paramater that contains the value to
            replace in string given. Attribute names are: 'val', 'min, or 'max'.
     """
-    # Create parameter dictionary with correct values to be replaced in string
-    params_dict = {}
-    for conf in confs:
-        if conf["type"] in ["P", "D"]:  # Use given param_attribute
-            params_dict[conf["name"]] = conf.get(param_attribute, None)
-        else:  # M or C - Always use 'val'
-            params_dict[conf["name"]] = conf.get("val", None)
-
-    return eval_param_expression(param_expression, params_dict)
+    return param_context(confs).eval(param_expression, param_attribute)
 
 
 class csr_gen:
@@ -104,7 +50,21 @@ class csr_gen:
     def __init__(self):
         self.cpu_n_bytes = 4
         self.core_addr_w = None
+        # List of confs. Setting it also creates the context to evaluate expressions.
         self.config = None
+        # Read decoder of auto CSRs: "compare", "case" or "tree"
+        self.read_decoder = "compare"
+        self.read_pipeline = False
+
+    @property
+    def config(self):
+        return self._config
+
+    @config.setter
+    def config(self, confs):
+        self._config = confs
+        # Shared by all expressions with parameters evaluated for these confs
+        self.param_context = param_context(confs)
 
     @staticmethod
     def boffset(n, n_bytes):
@@ -156,7 +116,7 @@ class csr_gen:
 
     def bceil(self, n, log2base):
         base = int(2**log2base)
-        n = eval_param_expression_from_config(n, self.config, "max")
+        n = self.param_context.eval(n, "max")
         # print(f"{n} of {type(n)} and {base}")
         if n % base == 0:
             return n
@@ -165,12 +125,7 @@ class csr_gen:
 
     # Calculate numeric value of addr_w, replacing params by their max value
     def calc_addr_w(self, log2n_items, n_bytes):
-        return int(
-            ceil(
-                eval_param_expression_from_config(log2n_items, self.config, "max")
-                + log(n_bytes, 2)
-            )
-        )
+        return int(ceil(self.param_context.eval(log2n_items, "max") + log(n_bytes, 2)))
 
     # Generate symbolic expression string to calculate addr_w in verilog
     @staticmethod
@@ -238,9 +193,7 @@ class csr_gen:
             else:
                 lines += f"    assign {name}_addressed_w = {wstrb_addr_cmp} (wstrb_addr < ({addr}+(2**({addr_w}))));\n"
 
-            n_items = 2 ** eval_param_expression_from_config(
-                log2n_items, self.config, "max"
-            )
+            n_items = 2 ** self.param_context.eval(log2n_items, "max")
             assert (
                 n_items == 1
             ), "Regfiles (n_items > 1) cannot be generated with auto. This error is a bug, auto regfiles should be handled by previous scripts."
@@ -383,28 +336,28 @@ class csr_gen:
         lines += f"\n\n//NAME: {name};\n//MODE: {row.mode}; WIDTH: {n_bits}; RST_VAL: {rst_val}; ADDR: {addr}; SPACE (bytes): {2**self.calc_addr_w(log2n_items,n_bytes)} (max); TYPE: {row.type}. {optional_comment}\n\n"
 
         if auto:
-            # signal to indicate if the register is addressed
-            lines += f"    wire {name}_addressed_r;\n"
+            # Word-indexed decoders select the CSR in gen_auto_rd_decoder()
+            if self.read_decoder == "compare":
+                # signal to indicate if the register is addressed
+                lines += f"    wire {name}_addressed_r;\n"
 
-            # test if addr and addr_w are int and substitute with their values
-            # For (auto) REG, use special read strobe based on 'shift_amount'
-            if isinstance(addr, int) and isinstance(addr_w, int):
-                if addr == 0:
-                    lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount <= iob_max(1,{addr+2**addr_w-1}>>shift_amount));\n"
-                else:
-                    # addr > 0
-                    lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount >= ({addr}>>shift_amount)) && (internal_iob_addr_stable>>shift_amount <= iob_max(1,{addr+2**addr_w-1}>>shift_amount));\n"
+                # test if addr and addr_w are int and substitute with their values
+                # For (auto) REG, use special read strobe based on 'shift_amount'
+                if isinstance(addr, int) and isinstance(addr_w, int):
+                    if addr == 0:
+                        lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount <= iob_max(1,{addr+2**addr_w-1}>>shift_amount));\n"
+                    else:
+                        # addr > 0
+                        lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount >= ({addr}>>shift_amount)) && (internal_iob_addr_stable>>shift_amount <= iob_max(1,{addr+2**addr_w-1}>>shift_amount));\n"
 
-            else:
-                if addr == 0:
-                    lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount <= iob_max(1,({addr}+(2**({addr_w}-1)))>>shift_amount));\n"
                 else:
-                    # addr > 0:
-                    lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount >= ({addr}>>shift_amount)) && (internal_iob_addr_stable>>shift_amount <= iob_max(1,({addr}+(2**({addr_w}-1)))>>shift_amount));\n"
+                    if addr == 0:
+                        lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount <= iob_max(1,({addr}+(2**({addr_w}-1)))>>shift_amount));\n"
+                    else:
+                        # addr > 0:
+                        lines += f"    assign {name}_addressed_r = (internal_iob_addr_stable>>shift_amount >= ({addr}>>shift_amount)) && (internal_iob_addr_stable>>shift_amount <= iob_max(1,({addr}+(2**({addr_w}-1)))>>shift_amount));\n"
 
-            n_items = 2 ** eval_param_expression_from_config(
-                log2n_items, self.config, "max"
-            )
+            n_items = 2 ** self.param_context.eval(log2n_items, "max")
             assert (
                 n_items == 1
             ), "Regfiles (n_items > 1) cannot be generated with auto. This error is a bug, auto regfiles should be handled by previous scripts."
@@ -505,14 +458,12 @@ class csr_gen:
                             f"    wire [{self.verilog_max(n_bits,1)}-1:0] {name}_rd;\n"
                         )
                     else:
-                        f.write(
-                            f"""
+                        f.write(f"""
     wire [{self.verilog_max(n_bits,1)}-1:0] {name}_rdata_rd;
     wire {name}_rvalid_rd;
     wire {name}_valid_rd;
     wire {name}_ready_rd;
-"""
-                        )
+""")
         f.write("\n")
 
     # generate portmap for csrs instance in top module
@@ -534,14 +485,12 @@ class csr_gen:
                     if auto:
                         f.write(f"    .{name}_i({name}_rd),\n")
                     else:
-                        f.write(
-                            f"""
+                        f.write(f"""
     .{name}_rdata_i({name}_rdata_rd),
     .{name}_rvalid_i({name}_rvalid_rd),
     .{name}_ren_o({name}_valid_rd),
     .{name}_ready_i({name}_ready_rd),
-"""
-                        )
+""")
 
     def gen_ports_wires(self, table):
         """Generate ports and internal wires for csrs instance."""
@@ -713,12 +662,149 @@ class csr_gen:
         param_str += ") "
         return param_str
 
+    def get_auto_rd_words(self, table, byte_aligned):
+        """Group auto readable CSRs by the CPU word they belong to.
+        :param list table: list of CSR rows
+        :param dict byte_aligned: byte aligned read data expression of each CSR
+        :returns dict: {word_index: [(bit_offset, bit_width, data_expression), ...]}
+        """
+        words = {}
+        for row in table:
+            if "R" not in row.mode or row.type == "NOAUTO":
+                continue
+            n_bytes = int(self.bceil(row.n_bits, 3) / 8)
+            if n_bytes == 3:
+                n_bytes = 4
+            assert isinstance(
+                row.addr, int
+            ), f"{iob_colors.FAIL}Word-indexed read decoders need integer CSR addresses. CSR: {row.name}{iob_colors.ENDC}"
+            assert (
+                self.boffset(row.addr, self.cpu_n_bytes) + 8 * n_bytes
+                <= 8 * self.cpu_n_bytes
+            ), f"{iob_colors.FAIL}CSR '{row.name}' crosses a CPU word boundary.{iob_colors.ENDC}"
+            if row.name == "version":
+                data = f"{8*n_bytes}'h{row.rst_val}"
+            else:
+                data = byte_aligned[row.name]
+            words.setdefault(row.addr // self.cpu_n_bytes, []).append(
+                (self.boffset(row.addr, self.cpu_n_bytes), 8 * n_bytes, data)
+            )
+        return words
+
+    def gen_auto_rd_decoder(self, table, byte_aligned):
+        """Generate word-indexed read decoder of auto CSRs.
+        Drives 'auto_rdata' with the CPU word addressed by internal_iob_addr_stable.
+        Unlike the "compare" decoder, every auto CSR of the word is returned, regardless
+        of the byte/half word access size (auto CSRs have no read side effects).
+        The "case" decoder uses a single case statement on the word index.
+        The "tree" decoder uses a balanced tree of 2:1 muxes, one level per word
+        index bit, with subtrees without CSRs pruned.
+        If read_pipeline is set, 'auto_rdata' is registered at the request cycle,
+        so the decoder is not in the same path as the response mux. The data is
+        available in the WAIT_RVALID state, so read latency is unchanged.
+        :returns str: verilog code
+        """
+        data_w = 8 * self.cpu_n_bytes
+        lsb = int(log2(self.cpu_n_bytes))
+        index_w = self.core_addr_w - lsb
+        words = self.get_auto_rd_words(table, byte_aligned)
+
+        def word_assignments(signal, lanes, indent):
+            lines = ""
+            for offset, width, data in lanes:
+                lines += f"{indent}{signal}[{offset}+:{width}] = {data}|{width}'d0;\n"
+            return lines
+
+        snippet = f"""
+    // Word-indexed read decoder of auto CSRs ({self.read_decoder})
+    reg [{data_w-1}:0] auto_rdata;
+"""
+        if index_w <= 0 or not words:
+            # Single word: no decoding needed
+            snippet += f"""    always @(*) begin
+        auto_rdata = {data_w}'d0;
+{word_assignments("auto_rdata", words.get(0, []), "        ")}    end
+"""
+        elif self.read_decoder == "case":
+            snippet += f"""    always @(*) begin
+        auto_rdata = {data_w}'d0;
+        case (internal_iob_addr_stable[{self.core_addr_w-1}:{lsb}])
+"""
+            for index in sorted(words):
+                snippet += f"            {index_w}'d{index}: begin\n"
+                snippet += word_assignments(
+                    "auto_rdata", words[index], "                "
+                )
+                snippet += "            end\n"
+            snippet += f"""            default: auto_rdata = {data_w}'d0;
+        endcase
+    end
+"""
+        else:  # tree
+            # Leaves: one signal per occupied word
+            for index in sorted(words):
+                snippet += f"""    reg [{data_w-1}:0] auto_rdata_w{index};
+    always @(*) begin
+        auto_rdata_w{index} = {data_w}'d0;
+{word_assignments(f"auto_rdata_w{index}", words[index], "        ")}    end
+"""
+
+            def build_tree(first, level):
+                """Return signal driven by the subtree of 2**level words starting at
+                index 'first', or None if it has no CSRs."""
+                if level == 0:
+                    return f"auto_rdata_w{first}" if first in words else None
+                half = 1 << (level - 1)
+                low = build_tree(first, level - 1)
+                high = build_tree(first + half, level - 1)
+                if low is None and high is None:
+                    return None
+                nonlocal snippet
+                node = f"auto_rdata_t{level}_{first >> level}"
+                sel = f"internal_iob_addr_stable[{lsb + level - 1}]"
+                snippet += f"    wire [{data_w-1}:0] {node};\n"
+                zero = f"{data_w}'d0"
+                snippet += (
+                    f"    assign {node} = {sel} ? {high or zero} : {low or zero};\n"
+                )
+                return node
+
+            root = build_tree(0, index_w)
+            snippet += f"    always @(*) auto_rdata = {root};\n"
+
+        if self.read_pipeline:
+            snippet += f"""
+    // Register decoded data at the request cycle
+    wire [{data_w-1}:0] auto_rdata_r;
+    iob_reg_ca #(
+      .DATA_W ({data_w}),
+      .RST_VAL({data_w}'d0)
+    ) auto_rdata_reg (
+      .clk_i  (clk_i),
+      .cke_i  (cke_i),
+      .arst_i (arst_i),
+      .data_i (auto_rdata),
+      .data_o (auto_rdata_r)
+    );
+"""
+        return snippet
+
     def write_hwcode(self, table, core_attributes):
         """Generates and appends verilog code to core "snippets" list."""
         ports = []
         wires = []
         subblocks = []
         snippet = ""
+        self.read_decoder = core_attributes.get("read_decoder", "compare")
+        self.read_pipeline = bool(core_attributes.get("read_pipeline", False))
+        assert self.read_decoder in [
+            "compare",
+            "case",
+            "tree",
+        ], f"{iob_colors.FAIL}Invalid read_decoder '{self.read_decoder}'. Must be 'compare', 'case' or 'tree'.{iob_colors.ENDC}"
+        assert not (
+            self.read_pipeline and self.read_decoder == "compare"
+        ), f"{iob_colors.FAIL}read_pipeline requires a word-indexed read_decoder ('case' or 'tree').{iob_colors.ENDC}"
         # check if all registers are auto
         all_auto = True
         all_reads_auto = True
@@ -766,7 +852,7 @@ class csr_gen:
                 break
 
         for row in table:
-            if "R" in row.mode:
+            if "R" in row.mode and self.read_decoder == "compare":
                 # Create special read strobe for "REG" (auto) CSRs
                 snippet += """
 // Create a special readstrobe for "REG" (auto) CSRs.
@@ -933,9 +1019,7 @@ class csr_gen:
             suffix = "" if row.internal_use else "_i"
             n_bits = row.n_bits
             n_bytes = int(self.bceil(n_bits, 3) / 8)
-            bit_padding = (8 * n_bytes) - eval_param_expression_from_config(
-                n_bits, self.config, "max"
-            )
+            bit_padding = (8 * n_bytes) - self.param_context.eval(n_bits, "max")
             if n_bytes == 3:
                 n_bytes = 4
             if "R" in row.mode:
@@ -996,9 +1080,20 @@ class csr_gen:
    );
 """
 
+        if self.read_decoder != "compare":
+            snippet += self.gen_auto_rd_decoder(table, byte_aligned)
+            auto_rdata = "auto_rdata"
+            if self.read_pipeline:
+                auto_rdata = "auto_rdata_r"
+                if not all_reads_auto:
+                    # Registered data only matches the address after the request cycle
+                    auto_rdata = f"(state == WAIT_RVALID) ? auto_rdata_r : {8*self.cpu_n_bytes}'d0"
+        else:
+            auto_rdata = f"{8*self.cpu_n_bytes}'d0"
+
         snippet += f"""
     always @* begin
-        iob_rdata_nxt = {8*self.cpu_n_bytes}'d0;
+        iob_rdata_nxt = {auto_rdata};
 """
         if not all_auto:
             snippet += """
@@ -1023,6 +1118,9 @@ class csr_gen:
             auto = row.type != "NOAUTO"
             suffix = "" if row.internal_use else "_i"
 
+            if "R" in row.mode and auto and self.read_decoder != "compare":
+                # Already selected by word-indexed decoder
+                continue
             if "R" in row.mode:
                 if auto:
                     snippet += f"        if({name}_addressed_r) "
@@ -1338,6 +1436,249 @@ class csr_gen:
                 fsw.write("}\n\n")
         fsw.close()
 
+        self.write_swemul(table, out_dir, top)
+
+    def emul_reg_info(self, row):
+        """Return information to model given CSR in PC emulation:
+        C type, number of items (0 if not an array), reset value, write action,
+        read action, and name of the FIFO it belongs to (empty if none).
+        """
+        n_bytes = self.bceil(row.n_bits, 3) / 8
+        if n_bytes == 3:
+            n_bytes = 4
+        addr_w = self.calc_addr_w(row.log2n_items, n_bytes)
+        sw_type = self.csr_type(row.name, n_bytes)
+        n_items = 0
+        if addr_w / n_bytes > 1:
+            n_items = 2 ** int(ceil(self.param_context.eval(row.log2n_items, "max")))
+        if row.name == "version":
+            # version digits are hexadecimal
+            rst_val = f"0x{row.rst_val}"
+        else:
+            rst_val = self.param_context.eval(row.rst_val, "val", strict=False)
+            if type(rst_val) is not int:
+                rst_val = 0
+        # Use action of CSR fields, if they all have the same one
+        write_actions = {f.write_action for f in row.fields if f.write_action}
+        read_actions = {f.read_action for f in row.fields if f.read_action}
+        write_action = write_actions.pop() if len(write_actions) == 1 else ""
+        read_action = read_actions.pop() if len(read_actions) == 1 else ""
+        fifo = ""
+        if row.optional_comment.startswith("For use with FIFO: "):
+            fifo = row.optional_comment.split(": ")[1]
+        return sw_type, n_items, rst_val, write_action, read_action, fifo
+
+    def write_swemul(self, table, out_dir, top):
+        """Generate behavioural model of the CSRs for PC emulation.
+        Registers are stored in memory and start with their reset values. Reads and
+        writes call weak hook functions, that peripherals override to model their
+        behaviour. FIFO data registers push to/pop from a software FIFO.
+        """
+        core_prefix = f"{top}_"
+        core_prefix_upper = core_prefix.upper()
+
+        # FIFOs and their direction (as seen by software)
+        fifos = {}
+        for row in table:
+            fifo = self.emul_reg_info(row)[5]
+            if fifo and row.name == f"{fifo}_data":
+                fifos[fifo] = row.mode
+
+        #
+        # Header
+        #
+        fhdr = open(f"{out_dir}/{top}_emul.h", "w")
+        fhdr.write(f"#ifndef H_{core_prefix_upper}EMUL_H\n")
+        fhdr.write(f"#define H_{core_prefix_upper}EMUL_H\n\n")
+        fhdr.write(f"/** @file {top}_emul.h\n")
+        fhdr.write(f" *  @brief PC emulation model of the {top} registers.\n")
+        fhdr.write(" *\n")
+        fhdr.write(
+            " *  Registers are kept in memory. The hooks below are called on each access\n"
+        )
+        fhdr.write(
+            " *  and do nothing by default. Peripherals override them to model their\n"
+        )
+        fhdr.write(" *  behaviour.\n")
+        fhdr.write(" *\n")
+        fhdr.write(" *  This file is automatically generated by Py2HWSW\n")
+        fhdr.write(" */\n\n")
+        fhdr.write(f'#include "{top}.h"\n\n')
+        fhdr.write(f"#ifndef {core_prefix_upper}EMUL_FIFO_DEPTH\n")
+        fhdr.write(f"#define {core_prefix_upper}EMUL_FIFO_DEPTH 256\n")
+        fhdr.write("#endif\n\n")
+        fhdr.write("/** @brief Restore reset values of all registers. */\n")
+        fhdr.write(f"void {core_prefix}emul_reset();\n\n")
+        fhdr.write("/** @brief Hook called when base address is set. */\n")
+        fhdr.write(f"void {core_prefix}emul_init(uint32_t addr);\n")
+        for fifo, mode in fifos.items():
+            if mode == "R":
+                fhdr.write("\n/**\n")
+                fhdr.write(f" * @brief Push word to {fifo} FIFO, read by software.\n")
+                fhdr.write(" * @return 1 if pushed, 0 if FIFO is full.\n")
+                fhdr.write(" */\n")
+                fhdr.write(f"int {core_prefix}emul_{fifo}_push(uint32_t value);\n")
+            else:
+                fhdr.write("\n/**\n")
+                fhdr.write(
+                    f" * @brief Pop word from {fifo} FIFO, written by software.\n"
+                )
+                fhdr.write(" * @return 1 if popped, 0 if FIFO is empty.\n")
+                fhdr.write(" */\n")
+                fhdr.write(f"int {core_prefix}emul_{fifo}_pop(uint32_t *value);\n")
+
+        fhdr.write("\n// Register access hooks\n")
+        for row in table:
+            sw_type, n_items, _, _, _, _ = self.emul_reg_info(row)
+            addr_arg = ", int addr" if n_items else ""
+            if "W" in row.mode:
+                fhdr.write(
+                    f"void {core_prefix}emul_write_{row.name}({sw_type} value{addr_arg});\n"
+                )
+            if "R" in row.mode:
+                fhdr.write(
+                    f"{sw_type} {core_prefix}emul_read_{row.name}({sw_type} value{addr_arg});\n"
+                )
+        fhdr.write(f"\n#endif // H_{core_prefix_upper}EMUL_H\n")
+        fhdr.close()
+
+        #
+        # Source
+        #
+        fsw = open(f"{out_dir}/{top}_emul.c", "w")
+        fsw.write(f'#include "{top}_emul.h"\n\n')
+        fsw.write("#define WEAK __attribute__((weak))\n")
+
+        fsw.write("\n// Register file\n")
+        for row in table:
+            sw_type, n_items, _, _, _, _ = self.emul_reg_info(row)
+            fsw.write(f"static {sw_type} {row.name}_reg[{max(n_items, 1)}];\n")
+
+        if fifos:
+            fsw.write("\n// FIFOs\n")
+            fsw.write("typedef struct {\n")
+            fsw.write(f"  uint32_t data[{core_prefix_upper}EMUL_FIFO_DEPTH];\n")
+            fsw.write("  uint32_t rd_ptr, level;\n")
+            fsw.write("} fifo_t;\n\n")
+            fsw.write("static int fifo_push(fifo_t *fifo, uint32_t value) {\n")
+            fsw.write(f"  if (fifo->level == {core_prefix_upper}EMUL_FIFO_DEPTH)\n")
+            fsw.write("    return 0;\n")
+            fsw.write(
+                f"  fifo->data[(fifo->rd_ptr + fifo->level++) % {core_prefix_upper}EMUL_FIFO_DEPTH] = value;\n"
+            )
+            fsw.write("  return 1;\n")
+            fsw.write("}\n\n")
+            fsw.write("static int fifo_pop(fifo_t *fifo, uint32_t *value) {\n")
+            fsw.write("  if (fifo->level == 0)\n")
+            fsw.write("    return 0;\n")
+            fsw.write("  *value = fifo->data[fifo->rd_ptr];\n")
+            fsw.write(
+                f"  fifo->rd_ptr = (fifo->rd_ptr + 1) % {core_prefix_upper}EMUL_FIFO_DEPTH;\n"
+            )
+            fsw.write("  fifo->level--;\n")
+            fsw.write("  return 1;\n")
+            fsw.write("}\n\n")
+            for fifo, mode in fifos.items():
+                fsw.write(f"static fifo_t {fifo}_fifo;\n")
+                if mode == "R":
+                    fsw.write(f"int {core_prefix}emul_{fifo}_push(uint32_t value) {{\n")
+                    fsw.write(f"  return fifo_push(&{fifo}_fifo, value);\n")
+                else:
+                    fsw.write(f"int {core_prefix}emul_{fifo}_pop(uint32_t *value) {{\n")
+                    fsw.write(f"  return fifo_pop(&{fifo}_fifo, value);\n")
+                fsw.write("}\n")
+
+        fsw.write(f"\nvoid {core_prefix}emul_reset() {{\n")
+        for row in table:
+            _, n_items, rst_val, _, _, _ = self.emul_reg_info(row)
+            if n_items:
+                fsw.write(f"  for (int i = 0; i < {n_items}; i++)\n")
+                fsw.write(f"    {row.name}_reg[i] = {rst_val};\n")
+            else:
+                fsw.write(f"  {row.name}_reg[0] = {rst_val};\n")
+        for fifo in fifos:
+            fsw.write(f"  {fifo}_fifo.rd_ptr = {fifo}_fifo.level = 0;\n")
+        fsw.write("}\n")
+
+        fsw.write("\n// Base Address\n")
+        fsw.write("static uint32_t base;\n")
+        fsw.write(f"void {core_prefix}init_baseaddr(uint32_t addr) {{\n")
+        fsw.write("  base = addr;\n")
+        fsw.write(f"  {core_prefix}emul_reset();\n")
+        fsw.write(f"  {core_prefix}emul_init(addr);\n")
+        fsw.write("}\n")
+
+        fsw.write("\n// Default hooks\n")
+        fsw.write(f"WEAK void {core_prefix}emul_init(uint32_t addr) {{}}\n")
+        for row in table:
+            sw_type, n_items, _, _, _, _ = self.emul_reg_info(row)
+            addr_arg = ", int addr" if n_items else ""
+            if "W" in row.mode:
+                fsw.write(
+                    f"WEAK void {core_prefix}emul_write_{row.name}({sw_type} value{addr_arg}) {{}}\n"
+                )
+            if "R" in row.mode:
+                fsw.write(
+                    f"WEAK {sw_type} {core_prefix}emul_read_{row.name}({sw_type} value{addr_arg}) {{\n"
+                )
+                fsw.write("  return value;\n")
+                fsw.write("}\n")
+
+        fsw.write("\n// Core Setters and Getters\n")
+        for row in table:
+            name = row.name
+            sw_type, n_items, _, write_action, read_action, fifo = self.emul_reg_info(
+                row
+            )
+            reg = f"{name}_reg[addr]" if n_items else f"{name}_reg[0]"
+            addr_arg = "int addr" if n_items else ""
+            hook_addr = ", addr" if n_items else ""
+
+            if "W" in row.mode:
+                waddr_arg = f", {addr_arg}" if addr_arg else ""
+                fsw.write(
+                    f"void {core_prefix}set_{name}({sw_type} value{waddr_arg}) {{\n"
+                )
+                if fifo and name == f"{fifo}_data":
+                    fsw.write(f"  fifo_push(&{fifo}_fifo, value);\n")
+                elif write_action == "oneToClear":
+                    fsw.write(f"  {reg} &= ~value;\n")
+                elif write_action == "oneToSet":
+                    fsw.write(f"  {reg} |= value;\n")
+                elif write_action == "oneToToggle":
+                    fsw.write(f"  {reg} ^= value;\n")
+                else:
+                    fsw.write(f"  {reg} = value;\n")
+                fsw.write(f"  {core_prefix}emul_write_{name}(value{hook_addr});\n")
+                if write_action == "clear":
+                    fsw.write(f"  {reg} = 0;\n")
+                fsw.write("}\n\n")
+            if "R" in row.mode:
+                fsw.write(f"{sw_type} {core_prefix}get_{name}({addr_arg}) {{\n")
+                if fifo and name == f"{fifo}_data":
+                    fsw.write("  uint32_t value = 0;\n")
+                    fsw.write(f"  fifo_pop(&{fifo}_fifo, &value);\n")
+                    fsw.write(
+                        f"  return {core_prefix}emul_read_{name}(value{hook_addr});\n"
+                    )
+                else:
+                    if fifo and name == f"{fifo}_level":
+                        fsw.write(f"  {reg} = {fifo}_fifo.level;\n")
+                    elif fifo and name == f"{fifo}_empty":
+                        fsw.write(f"  {reg} = ({fifo}_fifo.level == 0);\n")
+                    elif fifo and name == f"{fifo}_full":
+                        fsw.write(
+                            f"  {reg} = ({fifo}_fifo.level == {core_prefix_upper}EMUL_FIFO_DEPTH);\n"
+                        )
+                    fsw.write(
+                        f"  {sw_type} value = {core_prefix}emul_read_{name}({reg}{hook_addr});\n"
+                    )
+                    if read_action == "clear":
+                        fsw.write(f"  {reg} = 0;\n")
+                    fsw.write("  return value;\n")
+                fsw.write("}\n\n")
+        fsw.close()
+
     # check if address is aligned
     @staticmethod
     def check_alignment(addr, addr_w):
@@ -1465,8 +1806,7 @@ not have any effect.
         csrs_file.write(csrs_intro)
 
         # Fix \hhline colors
-        csrs_file.write(
-            r"""
+        csrs_file.write(r"""
 % Since \cline and \hhline dont work well with colored tables, we use this workaround to partially change colors of \hhline to match table's background.
 \newcommand{\customcsrshhline}{%
   \hhline{|%
@@ -1487,8 +1827,7 @@ not have any effect.
   }%
   \arrayrulecolor{black}% reset
 }
-"""
-        )
+""")
 
         for doc_conf, doc_table in doc_tables.items():
             if create_subsections:
@@ -2,9 +2,6 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
-from sqlite3 import connect
-
-from matplotlib.pylab import f
 from csr_classes import fail_with_msg
 
 
@@ -19,6 +19,7 @@ interrupt_csrs = [
         "n_bits": 32,
         "rst_val": 0,
         "log2n_items": 0,
+        "descr": "Interrupts mask: enable (1), disable (0) for each interrupt.",
     },
     {
         "name": "clear",
@@ -32,32 +33,23 @@ interrupt_csrs = [
 
 
 def find_and_update_interrupt_csrs(csrs_dict):
-    """Given a dictionary of CSRs, find the interrupt CSRs group and update the dictionary
-    accordingly.
-    User should provide a CSR of type "INTERRUPT". This CSR will be replaced by interrupt_csrs.
+    """Given a dictionary of CSRs, find the interrupt CSRs groups and update the
+    dictionary accordingly.
+    User should provide a CSR of type "INTERRUPT" for each group of interrupts. Each
+    of these CSRs will be replaced by its own set of interrupt_csrs.
     """
-    csr_group_ref = None
-    csr_ref = None
     for csr_group in csrs_dict:
-        for csr in csr_group["regs"]:
-            if csr.get("type", "") == "INTERRUPT":
-                csr_group_ref = csr_group
-                csr_ref = csr
-                break
-        if csr_ref:
-            break
-
-    if not csr_ref:
-        return
-
-    _interrupt_csrs = deepcopy(interrupt_csrs)
-    for csr in _interrupt_csrs:
-        # Update name of csrs to include original csr name as a prefix
-        csr["name"] = f"{csr_ref['name']}_{csr['name']}"
-        csr_ref["optional_comment"] = f"For use with interrupt: {csr_ref['name']}"
-
-    # Add interrupt_csrs to group
-    csr_group_ref["regs"] += _interrupt_csrs
-
-    # Remove original csr from csr_group
-    csr_group_ref["regs"].remove(csr_ref)
+        for csr_ref in [
+            csr for csr in csr_group["regs"] if csr.get("type", "") == "INTERRUPT"
+        ]:
+            _interrupt_csrs = deepcopy(interrupt_csrs)
+            for csr in _interrupt_csrs:
+                # Update name of csrs to include original csr name as a prefix
+                csr["name"] = f"{csr_ref['name']}_{csr['name']}"
+                csr["optional_comment"] = f"For use with interrupt: {csr_ref['name']}"
+
+            # Add interrupt_csrs to group
+            csr_group["regs"] += _interrupt_csrs
+
+            # Remove original csr from csr_group
+            csr_group["regs"].remove(csr_ref)
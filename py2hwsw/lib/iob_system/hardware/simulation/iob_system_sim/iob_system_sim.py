@@ -361,6 +361,13 @@ def setup(py_params_dict):
                     "HEXFILE": f'"{params["name"]}_firmware"',
                 }
             )
+        elif params["sim_backdoor_load"]:
+            # Memory images listed in '<name>_mem.config' are loaded at time 0
+            attributes_dict["subblocks"][-1]["parameters"].update(
+                {
+                    "HEXFILE": f'"{params["name"]}_backdoor"',
+                }
+            )
     if params["use_ethernet"]:
         attributes_dict["subblocks"] += [
             {
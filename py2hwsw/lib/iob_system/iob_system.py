@@ -36,6 +36,14 @@ def setup(py_params: dict):
             True,
             "If should instantiate the CLINT peripheral and wire its outputs (msip/mtip, mtime) to the CPU's interrupt_i/timebase_i ports. Set to False for CPUs with no timer/software-interrupt input wired.",
         ),
+        "use_irq_ctrl": (
+            False,
+            "If should instantiate the iob_irq_ctrl interrupt controller, connected to every peripheral interrupt output, and wire its output to the CPU's machine external interrupt. Replaces the PLIC (requires use_plic=False).",
+        ),
+        "pack_peripherals": (
+            True,
+            "If should pack peripherals in the address space according to their CSRs address width (aligned buddy allocation). Set to False to give every peripheral an equal slice of the peripherals region.",
+        ),
         "addr_w": (32, "CPU address width"),
         "data_w": (32, "CPU data width"),
         "mem_addr_w": (
@@ -45,6 +53,18 @@ def setup(py_params: dict):
         "bootrom_addr_w": (12, "Bootrom address width"),
         "fw_baseaddr": (0, "Firmware base address"),
         "fw_addr_w": (15, "Firmware address width"),
+        "uart_tx_fifo_depth": (
+            0,
+            "Depth of UART0 TX FIFO (0 for no FIFO). Allows firmware to send up to this number of bytes without waiting.",
+        ),
+        "uart_rx_fifo_depth": (
+            0,
+            "Depth of UART0 RX FIFO (0 for no FIFO). Allows firmware to receive up to this number of bytes per status read.",
+        ),
+        "sim_backdoor_load": (
+            False,
+            "If should load firmware into the testbench external memory at the start of simulation (requires init_mem=False and use_extmem=True). The bootloader skips the firmware transfer in simulation.",
+        ),
         "include_tester": (True, "If should include a tester system"),
         "include_snippet": (True, "If should include default system snippet"),
         # See notes at the end of this file for more info about custom CPU integration and available CPUs
@@ -75,6 +95,14 @@ def setup(py_params: dict):
         params["use_extmem"] = False
         params["use_bootrom"] = False
 
+    if params["use_irq_ctrl"]:
+        assert not params["use_plic"], "use_irq_ctrl requires use_plic=False"
+
+    if params["sim_backdoor_load"]:
+        assert (
+            not params["init_mem"] and params["use_extmem"]
+        ), "sim_backdoor_load requires init_mem=False and use_extmem=True"
+
     # Disable software trap handler and fence.i for uncompatible CPUs
     if params["cpu"] == "iob_picorv32":
         sw_trap_fenci = False
@@ -89,6 +117,10 @@ def setup(py_params: dict):
     interrupt_signals = ["timer0_interrupt"]
     if params["use_ethernet"]:
         interrupt_signals += ["eth0_interrupt"]
+    use_uart_fifo = params["uart_tx_fifo_depth"] or params["uart_rx_fifo_depth"]
+    if use_uart_fifo:
+        # Signals listed first get the highest interrupt numbers
+        interrupt_signals = ["uart0_interrupt"] + interrupt_signals
 
     attributes_dict = {
         "name": params["name"],
@@ -281,6 +313,17 @@ def setup(py_params: dict):
             },
         ],
     }
+    if params["sim_backdoor_load"]:
+        attributes_dict["confs"] += [
+            {  # Needed for software
+                "name": "SIM_BACKDOOR_LOAD",
+                "descr": "Firmware is loaded into memory by the testbench. Bootloader skips firmware transfer in simulation.",
+                "type": "M",
+                "val": True,
+                "min": "0",
+                "max": "1",
+            },
+        ]
     attributes_dict["ports"] = [
         {
             "name": "clk_en_rst_s",
@@ -581,6 +624,16 @@ def setup(py_params: dict):
                     ],
                 },
             ]
+        if params["use_irq_ctrl"]:
+            attributes_dict["wires"] += [
+                {
+                    "name": "irq_ctrl_interrupt",
+                    "descr": "Connect interrupt controller output to CPU",
+                    "signals": [
+                        {"name": "riscv_meip"},
+                    ],
+                },
+            ]
         if params["use_clint"]:
             attributes_dict["wires"] += [
                 {
@@ -869,6 +922,14 @@ def setup(py_params: dict):
             },
             # NOTE: Instantiate other peripherals here, using the 'is_peripheral' flag
         ]
+        if use_uart_fifo:
+            uart = next(
+                b for b in attributes_dict["subblocks"] if b["instance_name"] == "UART0"
+            )
+            uart["tx_fifo_depth"] = params["uart_tx_fifo_depth"]
+            uart["rx_fifo_depth"] = params["uart_rx_fifo_depth"]
+            uart["connect"]["interrupt_o"] = "uart0_interrupt"
+            uart["plic_source_id"] = len(interrupt_signals)
         if params["use_plic"]:
             attributes_dict["subblocks"] += [
                 {
@@ -884,6 +945,20 @@ def setup(py_params: dict):
                     },
                 },
             ]
+        if params["use_irq_ctrl"]:
+            attributes_dict["subblocks"] += [
+                {
+                    "core_name": "iob_irq_ctrl",
+                    "instance_name": "IRQ_CTRL0",
+                    "instance_description": "Interrupt controller",
+                    "is_peripheral": True,
+                    "connect": {
+                        "clk_en_rst_s": "clk_en_rst_s",
+                        # Cbus and interrupt sources connected automatically
+                        "interrupt_o": "irq_ctrl_interrupt",
+                    },
+                },
+            ]
         if params["use_clint"]:
             attributes_dict["subblocks"] += [
                 {
@@ -998,9 +1073,11 @@ def setup(py_params: dict):
         and params["include_snippet"]
     ):
         tie_off_code = ""
+        if not params["use_plic"] and not params["use_irq_ctrl"]:
+            tie_off_code += """
+   assign riscv_meip = 1'b0;"""
         if not params["use_plic"]:
             tie_off_code += """
-   assign riscv_meip = 1'b0;
    assign riscv_seip = 1'b0;"""
         if not params["use_clint"]:
             tie_off_code += """
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import sys
+import copy
+import json
+import hashlib
+
+from py2hwsw_version import PY2HWSW_VERSION
+from iob_base import import_python_module, debug
+from iob_core import find_module_setup_dir
+from iob_block import create_block
+
+#
+# Peripheral address planner for iob_system.
+# Packs peripherals in the peripherals region according to their real CSR address
+# width, using buddy allocation (every peripheral is aligned to its own size).
+# Plans are cached in memory and in the `<name>_mmap.json` file of the build dir.
+#
+
+# In-memory cache of plans. Format: {config_hash: plan}
+plan_cache = {}
+
+# Target given to peripheral setup functions when querying their CSR width.
+# Any value other than "setup" prevents them from creating files.
+QUERY_TARGET = "address_plan"
+
+
+def get_config_hash(peripherals, region_w):
+    """Compute hash of peripherals configuration. Used as the key of cached plans.
+    Includes modification times of peripheral setup files, to detect CSR changes.
+    :param list peripherals: list of peripheral subblocks
+    :param int region_w: address width of peripherals region
+    :returns str: hexadecimal digest
+    """
+    sources = {}
+    for peripheral in peripherals:
+        try:
+            core_dir, file_ext = find_module_setup_dir(peripheral["core_name"])
+        except ModuleNotFoundError:
+            continue
+        core_file = os.path.join(core_dir, peripheral["core_name"] + file_ext)
+        sources[core_file] = os.path.getmtime(core_file)
+    config = {
+        "py2hwsw_version": PY2HWSW_VERSION,
+        "region_w": region_w,
+        "peripherals": peripherals,
+        "sources": sources,
+    }
+    return hashlib.sha1(
+        json.dumps(config, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def load_core_attributes(core_name, py_params):
+    """Obtain attributes dictionary of a core, without elaborating it.
+    :param str core_name: name of the core
+    :param dict py_params: python parameters given to the core's setup function
+    :returns dict: attributes dictionary of the core
+    """
+    core_dir, file_ext = find_module_setup_dir(core_name)
+    if file_ext == ".json":
+        with open(os.path.join(core_dir, core_name + file_ext)) as f:
+            return json.load(f)
+    import_python_module(os.path.join(core_dir, core_name + file_ext))
+    return sys.modules[core_name].setup(py_params)
+
+
+def query_peripheral_addr_w(peripheral, system_attributes, py_params):
+    """Find address width of peripheral's CSRs.
+    Runs the peripheral's setup function, and the one of its iob_csrs subblock,
+    without creating any files.
+    :param dict peripheral: peripheral subblock
+    :param dict system_attributes: iob_system attributes
+    :param dict py_params: iob_system argument python parameters
+    :returns int: address width of peripheral's cbus. None if unknown.
+    """
+    common_params = {
+        "build_dir": system_attributes.get("build_dir", ""),
+        "py2hwsw_target": QUERY_TARGET,
+        "py2hwsw_version": py_params.get("py2hwsw_version", PY2HWSW_VERSION),
+        "top_module": py_params.get("top_module", system_attributes["name"]),
+        "dest_dir": "hardware/src",
+    }
+    peripheral_params = copy.deepcopy(peripheral)
+    core_name = peripheral_params.pop("core_name")
+    try:
+        attributes = load_core_attributes(
+            core_name,
+            common_params | {"issuer": system_attributes} | peripheral_params,
+        )
+    except Exception as e:
+        debug(f"Failed to query CSRs of '{core_name}' peripheral: {e}", 1)
+        return None
+    # Core name is the default name of the core (like in iob_core)
+    attributes = {"name": core_name} | attributes
+
+    # Find iob_csrs subblock, given in dictionary or string format
+    csrs_block = None
+    for block in attributes.get("subblocks", []):
+        blocks = create_block.parse_str(block) if isinstance(block, str) else [block]
+        for b in blocks:
+            if b.get("core_name") == "iob_csrs":
+                csrs_block = b
+    if csrs_block:
+        csrs_params = {k: v for k, v in csrs_block.items() if k != "core_name"}
+        try:
+            csrs_attributes = load_core_attributes(
+                "iob_csrs",
+                common_params | {"issuer": attributes} | csrs_params,
+            )
+            return max(1, int(csrs_attributes["confs"][0]["val"]))
+        except Exception as e:
+            debug(f"Failed to query CSRs of '{core_name}' peripheral: {e}", 1)
+
+    # Peripheral without iob_csrs subblock: use width of its cbus port, if fixed
+    for port in attributes.get("ports", []):
+        if port.get("name") == "csrs_cbus_s" and isinstance(port["signals"], dict):
+            addr_w = port["signals"].get("ADDR_W")
+            if isinstance(addr_w, int) or str(addr_w).isdigit():
+                return max(1, int(addr_w))
+    return None
+
+
+def buddy_allocate(addr_widths, region_w):
+    """Allocate aligned power-of-two blocks in the region.
+    Blocks are placed from largest to smallest, so each one is naturally aligned to
+    its size and no space is wasted between them.
+    :param list addr_widths: address width of each block
+    :param int region_w: address width of the region
+    :returns list: base offset of each block, in the same order as given
+    """
+    bases = [0] * len(addr_widths)
+    offset = 0
+    # Stable sort keeps original order between blocks of the same size
+    for idx in sorted(range(len(addr_widths)), key=lambda i: -addr_widths[i]):
+        bases[idx] = offset
+        offset += 1 << addr_widths[idx]
+    assert offset <= 1 << region_w, (
+        f"Peripherals need {offset:#x} bytes of address space, "
+        f"but peripherals region only has {1 << region_w:#x} bytes!"
+    )
+    return bases
+
+
+def load_plan_file(plan_file, config_hash):
+    """Load plan from JSON memory map of a previous setup, if it has the same configuration.
+    :param str plan_file: path of JSON memory map file
+    :param str config_hash: hash of current configuration
+    :returns dict: plan, or None if file does not exist or is outdated
+    """
+    try:
+        with open(plan_file) as f:
+            mmap = json.load(f)
+    except (OSError, ValueError):
+        return None
+    plan = mmap.get("peripherals_plan")
+    if not plan or plan.get("config_hash") != config_hash:
+        return None
+    return plan
+
+
+def plan_peripheral_addresses(
+    system_attributes, peripherals, region_w, py_params, plan_file=""
+):
+    """Plan base address and address width of each peripheral.
+    :param dict system_attributes: iob_system attributes
+    :param list peripherals: list of peripheral subblocks
+    :param int region_w: address width of peripherals region
+    :param dict py_params: iob_system argument python parameters
+    :param str plan_file: JSON memory map of a previous setup, to reuse its plan
+    :returns dict: plan. Format:
+        {
+            "config_hash": str,
+            "region_w": int,
+            "used_w": int,  # Address bits required to decode all peripherals
+            "peripherals": [{"instance_name": str, "base": int, "addr_w": int}, ...],
+        }
+    """
+    config_hash = get_config_hash(peripherals, region_w)
+    if config_hash in plan_cache:
+        return plan_cache[config_hash]
+
+    plan = load_plan_file(plan_file, config_hash) if plan_file else None
+    if plan:
+        debug(f"Reusing peripherals address plan from '{plan_file}'", 1)
+    else:
+        # Legacy slot width, used for peripherals with unknown CSR width
+        default_w = region_w - (len(peripherals) - 1).bit_length()
+        addr_widths = []
+        for peripheral in peripherals:
+            addr_w = query_peripheral_addr_w(peripheral, system_attributes, py_params)
+            addr_widths.append(addr_w if addr_w is not None else default_w)
+        bases = buddy_allocate(addr_widths, region_w)
+        plan = {
+            "config_hash": config_hash,
+            "region_w": region_w,
+            "used_w": (sum(1 << w for w in addr_widths) - 1).bit_length(),
+            "peripherals": [
+                {
+                    "instance_name": peripheral["instance_name"],
+                    "base": base,
+                    "addr_w": addr_w,
+                }
+                for peripheral, base, addr_w in zip(peripherals, bases, addr_widths)
+            ],
+        }
+
+    plan_cache[config_hash] = plan
+    return plan
+
+
+def get_decode_table(plan):
+    """Get decode table for iob_split from the plan.
+    :param dict plan: peripherals plan
+    :returns list: [base, addr_w] of each split manager
+    """
+    return [[p["base"], p["addr_w"]] for p in plan["peripherals"]]
@@ -3,6 +3,14 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import os
+import json
+
+from iob_core import iob_core
+from address_planner import plan_peripheral_addresses, get_decode_table
+
+# Memory maps already generated in this run. Avoids printing the same map multiple times.
+# Format: {(out_file, config_hash), ...}
+generated_memory_maps = set()
 
 #
 # Functions for iob_system.py
@@ -59,8 +67,9 @@ def iob_system_scripts(attributes_dict, params, py_params):
     append_board_wrappers(attributes_dict, params)
     set_build_dir(attributes_dict, py_params)
     peripherals = get_iob_system_peripherals_list(attributes_dict)
-    connect_peripherals_cbus(attributes_dict, peripherals, params)
-    generate_memory_map(attributes_dict, peripherals, params, py_params)
+    connect_irq_ctrl(attributes_dict, peripherals, py_params)
+    plan = connect_peripherals_cbus(attributes_dict, peripherals, params, py_params)
+    generate_memory_map(attributes_dict, peripherals, params, py_params, plan)
     generate_makefile_segments(attributes_dict, peripherals, params, py_params)
 
 
@@ -99,7 +108,8 @@ def append_board_wrappers(attributes_dict, params):
         "iob_basys3": "vivado",
         "iob_zcu104": "vivado",
     }
-    for board in attributes_dict.get("board_list", []):
+    # Only boards selected with `--board` (if any)
+    for board in iob_core.filter_boards(attributes_dict.get("board_list", [])):
         tool = tools[board]
         attributes_dict["superblocks"].append(
             {
@@ -188,17 +198,130 @@ def get_iob_system_peripherals_list(attributes_dict):
     return peripherals
 
 
-def connect_peripherals_cbus(attributes_dict, peripherals, params):
+def connect_irq_ctrl(attributes_dict, peripherals, py_params):
+    """Connect interrupt outputs of peripherals to the iob_irq_ctrl interrupt controller, if there is one.
+    Source IDs are given in peripherals order, starting at 1.
+    Also generates C header and source with the source IDs and the default interrupt handler table.
+    :param dict attributes_dict: iob_system attributes
+    :param list peripherals: list of peripheral subblocks
+    :param dict py_params: iob_system argument python parameters
+    """
+    irq_ctrl = None
+    for peripheral in peripherals:
+        if peripheral["core_name"] == "iob_irq_ctrl":
+            irq_ctrl = peripheral
+    if not irq_ctrl:
+        return
+
+    # Find signal of each peripheral interrupt output
+    wire_signals = {}
+    for wire in attributes_dict["wires"]:
+        if isinstance(wire["signals"], list) and len(wire["signals"]) == 1:
+            wire_signals[wire["name"]] = wire["signals"][0]["name"]
+    sources = []
+    for peripheral in peripherals:
+        if peripheral["core_name"] in ["iob_irq_ctrl", "iob_plic", "iob_clint"]:
+            continue
+        for port in ["interrupt_o", "inta_o"]:
+            if port in peripheral["connect"]:
+                wire_name = peripheral["connect"][port]
+                sources.append(
+                    (
+                        peripheral["instance_name"],
+                        wire_signals.get(wire_name, wire_name),
+                    )
+                )
+    assert (
+        1 <= len(sources) <= 32
+    ), f"iob_irq_ctrl supports 1 to 32 interrupt sources. Found {len(sources)}."
+
+    # Connect sources. Source ID 1 is bit 0.
+    attributes_dict["wires"].append(
+        {
+            "name": "irq_ctrl_sources",
+            "descr": "Interrupt controller sources",
+            "signals": [
+                {"name": "irq_ctrl_sources", "width": len(sources)},
+            ],
+        },
+    )
+    sources_str = ", ".join(signal for _, signal in reversed(sources))
+    attributes_dict["snippets"].append(
+        {
+            "verilog_code": f"""
+   assign irq_ctrl_sources = {{{sources_str}}};
+""",
+        },
+    )
+    irq_ctrl.setdefault("parameters", {})["N_SOURCES"] = len(sources)
+    irq_ctrl["connect"]["interrupt_i"] = "irq_ctrl_sources"
+
+    # Don't create files for other targets (like clean)
+    if "py2hwsw_target" not in py_params or py_params["py2hwsw_target"] != "setup":
+        return
+
+    name = attributes_dict["name"]
+    build_dir = attributes_dict["build_dir"]
+    os.makedirs(f"{build_dir}/software/src", exist_ok=True)
+    with open(f"{build_dir}/software/src/{name}_irq.h", "w") as file:
+        file.write("// This file was auto generated by iob_system_utils.py\n")
+        file.write(f"#ifndef H_{name.upper()}_IRQ_H\n")
+        file.write(f"#define H_{name.upper()}_IRQ_H\n\n")
+        file.write('#include "iob_irq_ctrl.h"\n\n')
+        file.write("// Interrupt source IDs\n")
+        for idx, (instance_name, _) in enumerate(sources):
+            file.write(
+                f"#define {name.upper()}_IRQ_{instance_name.upper()} {idx + 1}\n"
+            )
+        file.write(f"#define {name.upper()}_IRQ_N_SOURCES {len(sources)}\n\n")
+        file.write("// Interrupt handlers. Override to handle each source.\n")
+        for instance_name, _ in sources:
+            file.write(f"void {instance_name.lower()}_irq_handler(void);\n")
+        file.write("\n// Handler table, indexed by source ID\n")
+        file.write(f"extern const irq_handler_t {name}_irq_table[];\n\n")
+        file.write(f"#endif // H_{name.upper()}_IRQ_H\n")
+    with open(f"{build_dir}/software/src/{name}_irq.c", "w") as file:
+        file.write("// This file was auto generated by iob_system_utils.py\n")
+        file.write(f'#include "{name}_irq.h"\n\n')
+        for instance_name, _ in sources:
+            file.write(
+                f"__attribute__((weak)) void {instance_name.lower()}_irq_handler(void) {{\n}}\n"
+            )
+        file.write(f"\nconst irq_handler_t {name}_irq_table[] = {{\n")
+        file.write("    0, // No source\n")
+        for instance_name, _ in sources:
+            file.write(f"    {instance_name.lower()}_irq_handler,\n")
+        file.write("};\n")
+
+
+def get_mmap_file(attributes_dict, extension):
+    """Get path of memory map file of the system.
+    :param dict attributes_dict: iob_system attributes
+    :param str extension: file extension (like ".h" or ".json")
+    :returns str: path of memory map file
+    """
+    return os.path.join(
+        attributes_dict["build_dir"],
+        "software/src",
+        f"{attributes_dict['name']}_mmap{extension}",
+    )
+
+
+def connect_peripherals_cbus(attributes_dict, peripherals, params, py_params):
     """Update given attributes_dict to connect peripherals cbus to system's pbus_split.
     :param dict attributes_dict: iob_system attributes
     :param list peripherals: list of peripheral subblocks
     :param dict params: iob_system python parameters
+    :param dict py_params: iob_system argument python parameters
+    :returns dict: peripherals address plan. None if peripherals use equal slices.
     """
     # Find pbus_split
     pbus_split = None
     for block in attributes_dict["subblocks"]:
         if block["instance_name"] == "iob_pbus_split":
             pbus_split = block
+    if not pbus_split:
+        return None
 
     # Number of peripherals = peripherals
     num_peripherals = len(peripherals)
@@ -207,6 +330,18 @@ def connect_peripherals_cbus(attributes_dict, peripherals, params):
     # Configure number of connections to pbus_split
     pbus_split["num_managers"] = num_peripherals
 
+    plan = None
+    if params["pack_peripherals"] and num_peripherals > 1:
+        # Pack peripherals based on their CSRs address width
+        plan = plan_peripheral_addresses(
+            attributes_dict,
+            peripherals,
+            pbus_split["addr_w"],
+            py_params,
+            get_mmap_file(attributes_dict, ".json"),
+        )
+        pbus_split["addr_map"] = get_decode_table(plan)
+
     for idx, peripheral in enumerate(peripherals):
         peripheral_name = peripheral["instance_name"].lower()
         # Add peripheral cbus wire
@@ -217,7 +352,11 @@ def connect_peripherals_cbus(attributes_dict, peripherals, params):
                 "signals": {
                     "type": "iob",
                     "prefix": f"{peripheral_name}_cbus_",
-                    "ADDR_W": peripheral_addr_w,
+                    "ADDR_W": (
+                        plan["peripherals"][idx]["addr_w"]
+                        if plan
+                        else peripheral_addr_w
+                    ),
                 },
             },
         )
@@ -226,13 +365,16 @@ def connect_peripherals_cbus(attributes_dict, peripherals, params):
         # Connect cbus to peripheral
         peripheral["connect"]["csrs_cbus_s"] = f"{peripheral_name}_cbus"
 
+    return plan
 
-def generate_memory_map(attributes_dict, peripherals_list, params, py_params):
-    """Create C header file containing system memory map.
+
+def generate_memory_map(attributes_dict, peripherals_list, params, py_params, plan):
+    """Create C header and JSON files containing system memory map.
     :param dict attributes_dict: iob_system attributes
     :param list peripherals_list: list of peripheral subblocks
     :param dict params: iob_system python parameters
     :param dict py_params: iob_system argument python parameters
+    :param dict plan: peripherals address plan. None if peripherals use equal slices.
     """
 
     # Don't create files for other targets (like clean)
@@ -256,60 +398,109 @@ def generate_memory_map(attributes_dict, peripherals_list, params, py_params):
     num_sel_bits = (num_memory_regions - 1).bit_length()
     assert num_memory_regions, "No memory regions defined"
     region_width = params["addr_w"] - num_sel_bits
-    print("------------------------------------------------------")
-    print(f"Memory map for {attributes_dict['name']} (iob_system):")
     for region_name in memory_map.keys():
         memory_map[region_name] = memory_map[region_name] << (
             params["addr_w"] - num_sel_bits
         )
-        region_size = 1 << region_width
-        print(
-            f"[{memory_map[region_name]:#0{2+(params['addr_w']>>2)}x}-{memory_map[region_name]+region_size-1:#0{2+(params['addr_w']>>2)}x}]: {region_name} ({region_width} bits)"
-        )
-    print("------------------------------------------------------")
+    memory_map_regions = list(memory_map)
+    # Address width of each entry in memory map
+    memory_map_widths = {region_name: region_width for region_name in memory_map}
 
     if params["use_peripherals"]:
-        memory_map |= generate_peripheral_base_addresses(
+        peripherals_map = generate_peripheral_base_addresses(
             attributes_dict,
             peripherals_list,
             params,
             py_params,
             memory_map["peripherals"],
             region_width,
+            plan,
         )
+        memory_map |= peripherals_map
+        for idx, instance_name in enumerate(peripherals_map):
+            memory_map_widths[instance_name] = (
+                plan["peripherals"][idx]["addr_w"]
+                if plan
+                else region_width - (len(peripherals_list) - 1).bit_length()
+            )
 
-    out_file = os.path.join(
-        attributes_dict["build_dir"],
-        "software/src",
-        f"{attributes_dict['name']}_mmap.h",
-    )
+    out_file = get_mmap_file(attributes_dict, ".h")
+    json_file = get_mmap_file(attributes_dict, ".json")
+
+    # Only print and write each memory map once per run
+    config_hash = plan["config_hash"] if plan else None
+    if (out_file, config_hash) in generated_memory_maps:
+        update_cpu_memory_map(attributes_dict, params, memory_map, region_width)
+        return
+    generated_memory_maps.add((out_file, config_hash))
+
+    addr_digits = 2 + (params["addr_w"] >> 2)
+    print("------------------------------------------------------")
+    print(f"Memory map for {attributes_dict['name']} (iob_system):")
+    for region_name, base_address in memory_map.items():
+        addr_w = memory_map_widths[region_name]
+        # Indent peripherals
+        indent = "  " if region_name not in memory_map_regions else ""
+        print(
+            f"{indent}[{base_address:#0{addr_digits}x}-{base_address+(1 << addr_w)-1:#0{addr_digits}x}]: {region_name} ({addr_w} bits)"
+        )
+    print("------------------------------------------------------")
 
     os.makedirs(os.path.dirname(out_file), exist_ok=True)
     with open(out_file, "w") as f:
         for region_name, base_address in memory_map.items():
             f.write(f"#define {region_name.upper()}_BASE {hex(base_address)}\n")
+    with open(json_file, "w") as f:
+        json.dump(
+            {
+                "name": attributes_dict["name"],
+                "addr_w": params["addr_w"],
+                "regions": {
+                    region_name: {
+                        "base": base_address,
+                        "addr_w": memory_map_widths[region_name],
+                        "size": 1 << memory_map_widths[region_name],
+                    }
+                    for region_name, base_address in memory_map.items()
+                },
+                "peripherals_plan": plan,
+            },
+            f,
+            indent=4,
+        )
     print(f"See '{out_file}' for complete list of memory regions.")
 
-    if params["cpu"] != "none":
-        # Find CPU subblock
-        cpu_subblock = None
-        for subblock in attributes_dict["subblocks"]:
-            if subblock["instance_name"] == "cpu":
-                cpu_subblock = subblock
-                break
+    update_cpu_memory_map(attributes_dict, params, memory_map, region_width)
+
+
+def update_cpu_memory_map(attributes_dict, params, memory_map, region_width):
+    """Update reset address and uncached region passed via python parameters to the CPU.
+    :param dict attributes_dict: iob_system attributes
+    :param dict params: iob_system python parameters
+    :param dict memory_map: base addresses. Format: {region_name: address}
+    :param int region_width: width of each memory region
+    """
+    if params["cpu"] == "none":
+        return
+
+    # Find CPU subblock
+    cpu_subblock = None
+    for subblock in attributes_dict["subblocks"]:
+        if subblock["instance_name"] == "cpu":
+            cpu_subblock = subblock
+            break
 
-        # Update reset address and uncached region passed via python parameters to the CPU
-        bootrom_addr = memory_map.get("bootrom", None)
-        if bootrom_addr is not None:
-            cpu_subblock["reset_addr"] = bootrom_addr
-        peripherals_addr = memory_map.get("peripherals", None)
-        if peripherals_addr is not None:
-            cpu_subblock["uncached_start_addr"] = peripherals_addr
-            cpu_subblock["uncached_size"] = 2**region_width
+    bootrom_addr = memory_map.get("bootrom", None)
+    if bootrom_addr is not None:
+        cpu_subblock["reset_addr"] = bootrom_addr
+    peripherals_addr = memory_map.get("peripherals", None)
+    if peripherals_addr is not None:
+        cpu_subblock["uncached_start_addr"] = peripherals_addr
+        cpu_subblock["uncached_size"] = 2**region_width
 
 
 def generate_peripheral_base_addresses(
-    attributes_dict, peripherals_list, params, py_params, pbus_base, region_width
+    attributes_dict, peripherals_list, params, py_params, pbus_base, region_width, plan
 ):
     """Create C header file containing peripheral base addresses.
     :param dict attributes_dict: iob_system attributes
@@ -317,6 +508,7 @@ def generate_peripheral_base_addresses(
     :param dict params: iob_system python parameters
     :param dict py_params: iob_system argument python parameters
     :param int region_width: width of the peripheral region
+    :param dict plan: peripherals address plan. None if peripherals use equal slices.
     :returns dict: peripheral base addresses. Format: {peripheral_name: address}
     """
 
@@ -325,9 +517,14 @@ def generate_peripheral_base_addresses(
     peripherals_base_addresses = {}
     for idx, instance in enumerate(peripherals_list):
         instance_name = instance["instance_name"]
-        peripherals_base_addresses[instance_name] = pbus_base + (
-            idx << (region_width - n_subordinates_w)
-        )
+        if plan:
+            peripherals_base_addresses[instance_name] = (
+                pbus_base + plan["peripherals"][idx]["base"]
+            )
+        else:
+            peripherals_base_addresses[instance_name] = pbus_base + (
+                idx << (region_width - n_subordinates_w)
+            )
     return peripherals_base_addresses
 
 
@@ -477,6 +674,24 @@ virtual-network-if:
 	fi
 
 .PHONY: virtual-network-if
+"""
+            )
+        if params["sim_backdoor_load"]:
+            # Create target to build hex files for testbench memory backdoor load
+            name = params["name"]
+            fw_baseaddr = f"{params['fw_baseaddr']:x}"
+            file.write(
+                f"""
+# Memory images to load into testbench memory at time 0.
+# Linux systems list them in '{name}_mem.config'. Otherwise, only the firmware is loaded.
+BACKDOOR_MEM_CONFIG ?=$(firstword $(wildcard ../{name}_mem.config) {name}_backdoor.config)
+BUILD_DEPS+={name}_backdoor.hex
+
+{name}_backdoor.config: {name}_firmware.bin
+	echo "$< {fw_baseaddr}" > $@
+
+{name}_backdoor.hex: $(BACKDOOR_MEM_CONFIG)
+	../../scripts/makehex.py --split --config $< {params["mem_addr_w"]} $@
 """
             )
         if attributes_dict.get("is_tester", False):
@@ -50,6 +50,8 @@ DRIVERS=$(addprefix src/,$(addsuffix .c,$(PERIPHERALS)))
 # Only add driver files if they exist
 IOB_SYSTEM_FW_SRC+=$(foreach file,$(DRIVERS),$(wildcard $(file)*))
 IOB_SYSTEM_FW_SRC+=$(addprefix src/,$(addsuffix _csrs.c,$(PERIPHERALS)))
+# Interrupt handler table (generated when using iob_irq_ctrl)
+IOB_SYSTEM_FW_SRC+=$(wildcard src/iob_system_irq.c)
 
 # BOOTLOADER SOURCES
 IOB_SYSTEM_BOOT_SRC+=src/iob_system_boot.S
@@ -57,6 +59,12 @@ IOB_SYSTEM_BOOT_SRC+=src/iob_system_boot.c
 IOB_SYSTEM_BOOT_SRC+=src/iob_uart.c
 IOB_SYSTEM_BOOT_SRC+=src/iob_uart_csrs.c
 
+# Receive firmware in compressed, CRC checked blocks (requires console with FRXZ support)
+BOOT_COMPRESS ?=0
+ifeq ($(BOOT_COMPRESS),1)
+IOB_SYSTEM_BOOT_CFLAGS=-DBOOT_COMPRESS
+endif
+
 # PREBOOT SOURCES
 IOB_SYSTEM_PREBOOT_SRC=src/iob_system_preboot.S
 
@@ -77,7 +85,7 @@ iob_system_firmware: iob_bsp
 	make $@.elf INCLUDES="$(IOB_SYSTEM_INCLUDES)" LFLAGS="$(IOB_SYSTEM_LFLAGS) -Wl,-Map,$@.map" SRC="$(IOB_SYSTEM_FW_SRC)" TEMPLATE_LDS="$(TEMPLATE_LDS)"
 
 iob_system_boot: iob_bsp
-	make $@.elf INCLUDES="$(IOB_SYSTEM_INCLUDES)" LFLAGS="$(IOB_SYSTEM_LFLAGS) -Wl,-Map,$@.map" SRC="$(IOB_SYSTEM_BOOT_SRC)" TEMPLATE_LDS="$(TEMPLATE_LDS)"
+	make $@.elf INCLUDES="$(IOB_SYSTEM_INCLUDES)" LFLAGS="$(IOB_SYSTEM_LFLAGS) -Wl,-Map,$@.map" SRC="$(IOB_SYSTEM_BOOT_SRC)" TEMPLATE_LDS="$(TEMPLATE_LDS)" USER_CFLAGS="$(USER_CFLAGS) $(IOB_SYSTEM_BOOT_CFLAGS)"
 
 iob_system_preboot:
 	make $@.elf INCLUDES="$(IOB_SYSTEM_INCLUDES)" LFLAGS="$(IOB_SYSTEM_LFLAGS) -Wl,-Map,$@.map" SRC="$(IOB_SYSTEM_PREBOOT_SRC)" TEMPLATE_LDS="$(TEMPLATE_LDS)" NO_HW_DRIVER=1
@@ -97,7 +105,8 @@ EMUL_SRC+=src/iob_printf.c
 
 # PERIPHERAL SOURCES
 EMUL_SRC+=$(addprefix src/,$(addsuffix .c,$(PERIPHERALS)))
-EMUL_SRC+=$(addprefix src/,$(addsuffix _csrs_pc_emul.c,$(PERIPHERALS)))
+# Use hand-written CSR models if they exist. Otherwise, use generated ones.
+EMUL_SRC+=$(foreach p,$(PERIPHERALS),$(firstword $(wildcard src/$(p)_csrs_pc_emul.c) src/$(p)_csrs_emul.c))
 
 # include software build segment of child systems
 # child systems can add their own child_sw_build.mk without having to override this one.
@@ -19,3 +19,34 @@ uint32_t iob_axis_read(uint32_t *value) {
     return 1;
   }
 }
+
+// Read FIFO level once, then read that many words (up to n)
+uint32_t iob_axis_read_burst(uint32_t *buf, uint32_t n) {
+  uint32_t level = iob_axistream_in_csrs_get_fifo_level();
+  if (level < n)
+    n = level;
+
+  uint32_t i = 0;
+  for (; i + 4 <= n; i += 4) {
+    buf[i] = iob_axistream_in_csrs_get_data();
+    buf[i + 1] = iob_axistream_in_csrs_get_data();
+    buf[i + 2] = iob_axistream_in_csrs_get_data();
+    buf[i + 3] = iob_axistream_in_csrs_get_data();
+  }
+  for (; i < n; i++)
+    buf[i] = iob_axistream_in_csrs_get_data();
+  return n;
+}
+
+#ifdef IOB_AXIS_USE_DMA
+// Stream words to the DMA, which writes them to memory in bursts of threshold
+// words. The FIFO interrupt is set when threshold words are waiting.
+void iob_axis_read_dma(uint32_t phys_addr, uint32_t n, uint32_t threshold) {
+  iob_axistream_in_csrs_set_fifo_threshold(threshold);
+  iob_dma_csrs_set_w_burstlen(threshold - 1);
+  iob_axistream_in_csrs_set_mode(1);
+  dma_write_transfer(phys_addr, n);
+}
+
+uint8_t iob_axis_read_dma_busy() { return dma_write_busy(); }
+#endif
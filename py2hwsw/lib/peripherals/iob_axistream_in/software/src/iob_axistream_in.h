@@ -9,3 +9,18 @@
 void iob_axis_in_reset();
 
 uint32_t iob_axis_read(uint32_t *value);
+
+// Read up to n words available in the FIFO, returns number of words read
+uint32_t iob_axis_read_burst(uint32_t *buf, uint32_t n);
+
+#ifdef IOB_AXIS_USE_DMA
+// Define IOB_AXIS_USE_DMA if an iob_dma, initialized with dma_init(), receives
+// the system AXI-Stream output of this peripheral
+#include "iob_dma.h"
+
+// Transfer n words to memory with the DMA
+void iob_axis_read_dma(uint32_t phys_addr, uint32_t n, uint32_t threshold);
+
+// Check if the DMA transfer is still running
+uint8_t iob_axis_read_dma_busy();
+#endif
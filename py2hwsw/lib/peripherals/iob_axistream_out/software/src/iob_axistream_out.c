@@ -19,3 +19,37 @@ uint32_t iob_axis_write(uint32_t value) {
     return 1;
   }
 }
+
+// Read FIFO level once, then write as many words as fit (up to n)
+uint32_t iob_axis_write_burst(const uint32_t *buf, uint32_t n) {
+  uint32_t room =
+      IOB_AXIS_OUT_FIFO_WORDS - iob_axistream_out_csrs_get_fifo_level();
+  if (room < n)
+    n = room;
+
+  uint32_t i = 0;
+  for (; i + 4 <= n; i += 4) {
+    iob_axistream_out_csrs_set_data(buf[i]);
+    iob_axistream_out_csrs_set_data(buf[i + 1]);
+    iob_axistream_out_csrs_set_data(buf[i + 2]);
+    iob_axistream_out_csrs_set_data(buf[i + 3]);
+  }
+  for (; i < n; i++)
+    iob_axistream_out_csrs_set_data(buf[i]);
+  return n;
+}
+
+#ifdef IOB_AXIS_USE_DMA
+// Stream words from the DMA, which reads them from memory in bursts of
+// threshold words. The FIFO interrupt is set when threshold or less words are
+// waiting.
+void iob_axis_write_dma(uint32_t phys_addr, uint32_t n, uint32_t threshold) {
+  iob_axistream_out_csrs_set_fifo_threshold(threshold);
+  iob_dma_csrs_set_r_burstlen(threshold - 1);
+  iob_axistream_out_csrs_set_nwords(n);
+  iob_axistream_out_csrs_set_mode(1);
+  dma_read_transfer(phys_addr, n);
+}
+
+uint8_t iob_axis_write_dma_busy() { return dma_read_busy(); }
+#endif
@@ -4,8 +4,36 @@
  * SPDX-License-Identifier: GPL-3.0-only
  */
 
+#include "iob_axistream_out_conf.h"
 #include "iob_axistream_out_csrs.h"
 
+// Number of DATA_W words of the FIFO. Computed for the default parameters of
+// the core, define it if the instance uses other parameters.
+#ifndef IOB_AXIS_OUT_FIFO_WORDS
+#if IOB_AXISTREAM_OUT_DATA_W > IOB_AXISTREAM_OUT_TDATA_W
+#define IOB_AXIS_OUT_FIFO_WORDS                                                \
+  ((1 << IOB_AXISTREAM_OUT_FIFO_ADDR_W) /                                     \
+   (IOB_AXISTREAM_OUT_DATA_W / IOB_AXISTREAM_OUT_TDATA_W))
+#else
+#define IOB_AXIS_OUT_FIFO_WORDS (1 << IOB_AXISTREAM_OUT_FIFO_ADDR_W)
+#endif
+#endif
+
 void iob_axis_out_reset();
 
 uint32_t iob_axis_write(uint32_t value);
+
+// Write up to n words that fit in the FIFO, returns number of words written
+uint32_t iob_axis_write_burst(const uint32_t *buf, uint32_t n);
+
+#ifdef IOB_AXIS_USE_DMA
+// Define IOB_AXIS_USE_DMA if an iob_dma, initialized with dma_init(), drives
+// the system AXI-Stream input of this peripheral
+#include "iob_dma.h"
+
+// Transfer n words from memory with the DMA
+void iob_axis_write_dma(uint32_t phys_addr, uint32_t n, uint32_t threshold);
+
+// Check if the DMA transfer is still running
+uint8_t iob_axis_write_dma_busy();
+#endif
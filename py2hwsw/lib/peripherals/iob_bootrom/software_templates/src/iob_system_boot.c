@@ -89,11 +89,20 @@ int main() {
     uart_puts(": Waiting for Console ACK.\n");
   }
 
-#ifndef IOB_SYSTEM_INIT_MEM
+#if defined(IOB_SYSTEM_SIM_BACKDOOR_LOAD) && defined(IOB_BSP_SIMULATION)
+  // firmware was loaded into memory by the testbench
+  uart_puts(PROGNAME);
+  uart_puts(": Firmware preloaded by testbench.\n");
+#elif !defined(IOB_SYSTEM_INIT_MEM)
   // receive firmware from host
   int file_size = 0;
   char r_fw[] = "iob_system_firmware.bin";
+#ifdef BOOT_COMPRESS
+  // firmware is sent in LZ4 compressed, CRC checked blocks
+  file_size = uart_recvfile_lz(r_fw, prog_start_addr);
+#else
   file_size = uart_recvfile(r_fw, prog_start_addr);
+#endif
   uart_puts(PROGNAME);
   uart_puts(": Loading firmware...\n");
 
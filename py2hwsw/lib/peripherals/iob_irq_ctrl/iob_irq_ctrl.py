@@ -0,0 +1,316 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# Interrupt controller.
+#
+# Collects up to 32 level sensitive interrupt sources. A source becomes pending
+# when its input is asserted. Software reads the 'claim' CSR to get the ID of
+# the enabled pending source with the highest priority (lowest ID), which stops
+# being pending until software writes its ID to the 'complete' CSR. Source IDs
+# start at 1 (interrupt_i[0]); ID 0 means no pending source.
+
+
+def setup(py_params_dict):
+    attributes_dict = {
+        "generate_hw": True,
+        "confs": [
+            {
+                "name": "N_SOURCES",
+                "type": "P",
+                "val": "32",
+                "min": "1",
+                "max": "32",
+                "descr": "Number of interrupt sources",
+            },
+        ],
+        "ports": [
+            {
+                "name": "clk_en_rst_s",
+                "signals": {
+                    "type": "iob_clk",
+                },
+                "descr": "Clock, clock enable and reset",
+            },
+            {
+                "name": "interrupt_i",
+                "descr": "Interrupt sources",
+                "signals": [
+                    {
+                        "name": "interrupt_i",
+                        "width": "N_SOURCES",
+                        "descr": "Interrupt source inputs. Bit 0 has ID 1.",
+                    },
+                ],
+            },
+            {
+                "name": "interrupt_o",
+                "descr": "Interrupt output",
+                "signals": [
+                    {
+                        "name": "interrupt_o",
+                        "width": 1,
+                        "descr": "Asserted while an enabled source is pending",
+                    },
+                ],
+            },
+        ],
+        "wires": [
+            # Register wires
+            {
+                "name": "enable",
+                "descr": "",
+                "signals": [
+                    {"name": "enable_wr", "width": 32},
+                ],
+            },
+            {
+                "name": "pending",
+                "descr": "",
+                "signals": [
+                    {"name": "pending_rd", "width": 32},
+                ],
+            },
+            {
+                "name": "claim",
+                "descr": "",
+                "signals": [
+                    {"name": "claim_valid_rd", "width": 1},
+                    {"name": "claim_rdata_rd", "width": 8},
+                    {"name": "claim_ready_rd", "width": 1},
+                    {"name": "claim_rvalid_rd", "width": 1},
+                ],
+            },
+            {
+                "name": "complete",
+                "descr": "",
+                "signals": [
+                    {"name": "complete_valid_wr", "width": 1},
+                    {"name": "complete_wdata_wr", "width": 8},
+                    {"name": "complete_wstrb_wr", "width": 1},
+                    {"name": "complete_ready_wr", "width": 1},
+                ],
+            },
+            # Internal wires
+            {
+                "name": "claimable",
+                "descr": "Enabled pending sources",
+                "signals": [
+                    {"name": "claimable", "width": "N_SOURCES"},
+                ],
+            },
+            {
+                "name": "claim_enc",
+                "descr": "Index of claimable source with highest priority (N_SOURCES if none)",
+                "signals": [
+                    {"name": "claim_enc", "width": "$clog2(N_SOURCES+1)"},
+                ],
+            },
+            {
+                "name": "pending_reg_data_i",
+                "descr": "",
+                "signals": [
+                    {"name": "pending_nxt", "width": "N_SOURCES"},
+                ],
+            },
+            {
+                "name": "pending_reg_data_o",
+                "descr": "",
+                "signals": [
+                    {"name": "pending", "width": "N_SOURCES"},
+                ],
+            },
+            {
+                "name": "in_service_reg_data_i",
+                "descr": "",
+                "signals": [
+                    {"name": "in_service_nxt", "width": "N_SOURCES"},
+                ],
+            },
+            {
+                "name": "in_service_reg_data_o",
+                "descr": "",
+                "signals": [
+                    {"name": "in_service", "width": "N_SOURCES"},
+                ],
+            },
+            {
+                "name": "claim_rdata_reg_data_i",
+                "descr": "",
+                "signals": [
+                    {"name": "claim_id", "width": 8},
+                ],
+            },
+            {
+                "name": "claim_rdata_reg_data_o",
+                "descr": "",
+                "signals": [
+                    {"name": "claim_rdata_rd"},
+                ],
+            },
+            {
+                "name": "claim_rvalid_reg_data_i",
+                "descr": "",
+                "signals": [
+                    {"name": "claim_valid_rd"},
+                ],
+            },
+            {
+                "name": "claim_rvalid_reg_data_o",
+                "descr": "",
+                "signals": [
+                    {"name": "claim_rvalid_rd"},
+                ],
+            },
+        ],
+        "subblocks": [
+            {
+                "core_name": "iob_csrs",
+                "instance_name": "csrs",
+                "instance_description": "Control/Status Registers",
+                "csrs": [
+                    {
+                        "name": "enable",
+                        "mode": "W",
+                        "n_bits": 32,
+                        "rst_val": 0,
+                        "log2n_items": 0,
+                        "descr": "Enable (1) or disable (0) each interrupt source. Bit 0 is source ID 1.",
+                    },
+                    {
+                        "name": "pending",
+                        "mode": "R",
+                        "n_bits": 32,
+                        "rst_val": 0,
+                        "log2n_items": 0,
+                        "descr": "Pending (1) interrupt sources: asserted and not claimed. Bit 0 is source ID 1.",
+                    },
+                    {
+                        "name": "claim",
+                        "type": "NOAUTO",
+                        "mode": "R",
+                        "n_bits": 8,
+                        "rst_val": 0,
+                        "log2n_items": 0,
+                        "descr": "Claim enabled pending source with highest priority (lowest ID). Returns its ID, or 0 if there is none. The source is not pending until its service is complete.",
+                    },
+                    {
+                        "name": "complete",
+                        "type": "NOAUTO",
+                        "mode": "W",
+                        "n_bits": 8,
+                        "rst_val": 0,
+                        "log2n_items": 0,
+                        "descr": "Write ID of claimed source when its service is complete.",
+                    },
+                ],
+                "csr_if": "iob",
+                "connect": {
+                    "clk_en_rst_s": "clk_en_rst_s",
+                    # 'control_if_m' port connected automatically
+                    # Register interfaces
+                    "enable_o": "enable",
+                    "pending_i": "pending",
+                    "claim_io": "claim",
+                    "complete_io": "complete",
+                },
+            },
+            {
+                "core_name": "iob_prio_enc",
+                "instance_name": "claim_enc_inst",
+                "instance_description": "Select claimable source with lowest ID",
+                "parameters": {
+                    "W": "N_SOURCES",
+                    "MODE": '"LOW"',
+                },
+                "connect": {
+                    "unencoded_i": "claimable",
+                    "encoded_o": "claim_enc",
+                },
+            },
+            {
+                "core_name": "iob_reg",
+                "instance_name": "pending_reg",
+                "instance_description": "Pending sources",
+                "parameters": {
+                    "DATA_W": "N_SOURCES",
+                    "RST_VAL": "{N_SOURCES{1'b0}}",
+                },
+                "connect": {
+                    "clk_en_rst_s": "clk_en_rst_s",
+                    "data_i": "pending_reg_data_i",
+                    "data_o": "pending_reg_data_o",
+                },
+            },
+            {
+                "core_name": "iob_reg",
+                "instance_name": "in_service_reg",
+                "instance_description": "Claimed sources, until their service is complete",
+                "parameters": {
+                    "DATA_W": "N_SOURCES",
+                    "RST_VAL": "{N_SOURCES{1'b0}}",
+                },
+                "connect": {
+                    "clk_en_rst_s": "clk_en_rst_s",
+                    "data_i": "in_service_reg_data_i",
+                    "data_o": "in_service_reg_data_o",
+                },
+            },
+            {
+                "core_name": "iob_reg",
+                "instance_name": "claim_rdata_reg",
+                "instance_description": "Register for claim rdata",
+                "parameters": {
+                    "DATA_W": 8,
+                    "RST_VAL": "8'd0",
+                },
+                "connect": {
+                    "clk_en_rst_s": "clk_en_rst_s",
+                    "data_i": "claim_rdata_reg_data_i",
+                    "data_o": "claim_rdata_reg_data_o",
+                },
+            },
+            {
+                "core_name": "iob_reg",
+                "instance_name": "claim_rvalid_reg",
+                "instance_description": "Register for claim rvalid",
+                "parameters": {
+                    "DATA_W": 1,
+                    "RST_VAL": "1'b0",
+                },
+                "connect": {
+                    "clk_en_rst_s": "clk_en_rst_s",
+                    "data_i": "claim_rvalid_reg_data_i",
+                    "data_o": "claim_rvalid_reg_data_o",
+                },
+            },
+        ],
+        "snippets": [
+            {
+                "verilog_code": """
+    localparam [N_SOURCES-1:0] ONE = 1;
+
+    wire                 claim_hit = claim_valid_rd & (claim_enc != N_SOURCES);
+    wire [N_SOURCES-1:0] claim_mask = claim_hit ? (ONE << claim_enc) : {N_SOURCES{1'b0}};
+    wire                 complete_en = complete_valid_wr & complete_wstrb_wr & (complete_wdata_wr != 8'd0);
+    wire [N_SOURCES-1:0] complete_mask = complete_en ? (ONE << (complete_wdata_wr - 8'd1)) : {N_SOURCES{1'b0}};
+
+    // Sources become pending when asserted, unless in service
+    assign pending_nxt    = (pending | (interrupt_i & ~in_service)) & ~claim_mask;
+    assign in_service_nxt = (in_service | claim_mask) & ~complete_mask;
+
+    assign claimable = pending & enable_wr[N_SOURCES-1:0];
+    assign claim_id  = claim_hit ? claim_enc + 8'd1 : 8'd0;
+
+    wire [32+N_SOURCES-1:0] pending_ext = {32'd0, pending};
+    assign pending_rd        = pending_ext[31:0];
+    assign claim_ready_rd    = 1'b1;
+    assign complete_ready_wr = 1'b1;
+
+    assign interrupt_o = |claimable;
+""",
+            },
+        ],
+    }
+
+    return attributes_dict
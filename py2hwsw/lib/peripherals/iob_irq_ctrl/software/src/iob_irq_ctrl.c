@@ -0,0 +1,43 @@
+/*
+ * SPDX-FileCopyrightText: 2026 IObundle
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+#include "iob_irq_ctrl.h"
+
+// Enable CSR is write only: keep a copy
+static uint32_t enabled;
+
+void irq_ctrl_init(uint32_t base_address) {
+  iob_irq_ctrl_csrs_init_baseaddr(base_address);
+  enabled = 0;
+  iob_irq_ctrl_csrs_set_enable(enabled);
+}
+
+void irq_ctrl_enable(uint8_t id) {
+  enabled |= 1u << (id - 1);
+  iob_irq_ctrl_csrs_set_enable(enabled);
+}
+
+void irq_ctrl_disable(uint8_t id) {
+  enabled &= ~(1u << (id - 1));
+  iob_irq_ctrl_csrs_set_enable(enabled);
+}
+
+uint8_t irq_ctrl_claim() { return iob_irq_ctrl_csrs_get_claim(); }
+
+void irq_ctrl_complete(uint8_t id) { iob_irq_ctrl_csrs_set_complete(id); }
+
+int irq_ctrl_dispatch(const irq_handler_t *table, uint8_t n_sources) {
+  int serviced = 0;
+  uint8_t id;
+
+  while ((id = irq_ctrl_claim()) != 0) {
+    if (id <= n_sources && table[id])
+      table[id]();
+    irq_ctrl_complete(id);
+    serviced++;
+  }
+  return serviced;
+}
@@ -0,0 +1,64 @@
+/*
+ * SPDX-FileCopyrightText: 2026 IObundle
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+#pragma once
+#include "iob_irq_ctrl_csrs.h"
+
+/** @brief Interrupt handler. */
+typedef void (*irq_handler_t)(void);
+
+// Functions
+
+/**
+ * @brief Initializes the interrupt controller.
+ *
+ * This function sets the base address and disables all interrupt sources.
+ *
+ * @param base_address The base memory address of the interrupt controller.
+ */
+void irq_ctrl_init(uint32_t base_address);
+
+/**
+ * @brief Enables interrupt source.
+ *
+ * @param id Source ID (1 to 32).
+ */
+void irq_ctrl_enable(uint8_t id);
+
+/**
+ * @brief Disables interrupt source.
+ *
+ * @param id Source ID (1 to 32).
+ */
+void irq_ctrl_disable(uint8_t id);
+
+/**
+ * @brief Claims the enabled pending source with highest priority.
+ *
+ * The claimed source is not pending until irq_ctrl_complete() is called.
+ *
+ * @return uint8_t Source ID, or 0 if there is no enabled pending source.
+ */
+uint8_t irq_ctrl_claim();
+
+/**
+ * @brief Signals that the service of a claimed source is complete.
+ *
+ * @param id Source ID returned by irq_ctrl_claim().
+ */
+void irq_ctrl_complete(uint8_t id);
+
+/**
+ * @brief Services all enabled pending sources.
+ *
+ * Claims each enabled pending source, in priority order, calls its handler in
+ * the dispatch table and completes it.
+ *
+ * @param table Dispatch table, indexed by source ID. Entries may be NULL.
+ * @param n_sources Number of sources in table (excluding entry 0).
+ * @return int Number of serviced sources.
+ */
+int irq_ctrl_dispatch(const irq_handler_t *table, uint8_t n_sources);
@@ -6,6 +6,29 @@
 def setup(py_params_dict):
     CSR_IF = py_params_dict["csr_if"] if "csr_if" in py_params_dict else "iob"
     NAME = py_params_dict["name"] if "name" in py_params_dict else "iob_uart"
+    # Depth of TX and RX FIFOs. Without FIFO (depth 0), the txdata and rxdata
+    # registers hold a single byte. Up to 128, so FIFO levels fit a byte register.
+    TX_FIFO_DEPTH = int(py_params_dict.get("tx_fifo_depth", 0))
+    RX_FIFO_DEPTH = int(py_params_dict.get("rx_fifo_depth", 0))
+    for depth in [TX_FIFO_DEPTH, RX_FIFO_DEPTH]:
+        assert depth == 0 or (
+            depth & (depth - 1) == 0 and 2 <= depth <= 128
+        ), f"UART FIFO depth must be 0 or a power of 2 between 2 and 128, not {depth}."
+
+    # FIFO level and threshold registers and their connections to the CSRs block
+    fifo_csrs = ""
+    fifo_csrs_connect = ""
+    for fifo, depth, addr in [("tx", TX_FIFO_DEPTH, 8), ("rx", RX_FIFO_DEPTH, 10)]:
+        if not depth:
+            continue
+        level_w = depth.bit_length()
+        fifo_csrs += f"""
+                        -r {fifo}level:{level_w}  -m R -d '{fifo.upper()} FIFO level (number of bytes in FIFO).' --rst_val 0 --addr {addr} --log2n_items 0
+                        -r {fifo}thresh:{level_w} -m W -d '{fifo.upper()} FIFO interrupt threshold (0 disables interrupt).' --rst_val 0 --addr {addr} --log2n_items 0"""
+        fifo_csrs_connect += f"""
+                    "{fifo}level_i":"{fifo}level"
+                    "{fifo}thresh_o":"{fifo}thresh\""""
+
     attributes_dict = {
         "name": NAME,
         "generate_hw": True,
@@ -131,12 +154,12 @@ def setup(py_params_dict):
                     {"name": "softreset_wr"},
                     {"name": "txen_wr"},
                     {"name": "rxen_wr"},
-                    {"name": "txready_rd"},
-                    {"name": "rxready_rd"},
-                    {"name": "txdata_wdata_wr"},
-                    {"name": "rxdata_rdata_rd"},
-                    {"name": "txdata_wen_wr"},
-                    {"name": "rxdata_valid_rd"},
+                    {"name": "core_txready" if TX_FIFO_DEPTH else "txready_rd"},
+                    {"name": "core_rxready" if RX_FIFO_DEPTH else "rxready_rd"},
+                    {"name": "tx_fifo_r_data" if TX_FIFO_DEPTH else "txdata_wdata_wr"},
+                    {"name": "core_rxdata" if RX_FIFO_DEPTH else "rxdata_rdata_rd"},
+                    {"name": "core_txdata_wen" if TX_FIFO_DEPTH else "txdata_wen_wr"},
+                    {"name": "rx_fifo_w_en" if RX_FIFO_DEPTH else "rxdata_valid_rd"},
                     {"name": "div_wr"},
                 ],
             },
@@ -156,7 +179,7 @@ def setup(py_params_dict):
                     "txready_i":"txready"
                     "rxen_o":"rxen"
                     "rxready_i":"rxready"
-                    "rxdata_io":"rxdata"
+                    "rxdata_io":"rxdata"{fifo_csrs_connect}
                 --csr_if {CSR_IF}
                 --csr-group uart
                     -d 'UART software accessible registers'
@@ -167,7 +190,7 @@ def setup(py_params_dict):
                         -r rxen:1             -m W -d 'RX enable.'                           --rst_val 0 --addr 6 --log2n_items 0
                         -r txready:1          -m R -d 'TX ready to receive data.'            --rst_val 0 --addr 0 --log2n_items 0
                         -r rxready:1          -m R -d 'RX ready to be read.'                 --rst_val 0 --addr 1 --log2n_items 0
-                        -r rxdata:8 -t NOAUTO -m R -d 'RX data.'                             --rst_val 0 --addr 4 --log2n_items 0
+                        -r rxdata:8 -t NOAUTO -m R -d 'RX data.'                             --rst_val 0 --addr 4 --log2n_items 0{fifo_csrs}
             """,
             {
                 "core_name": "iob_reg",
@@ -228,4 +251,300 @@ def setup(py_params_dict):
         ],
     }
 
+    if TX_FIFO_DEPTH or RX_FIFO_DEPTH:
+        add_fifos(attributes_dict, TX_FIFO_DEPTH, RX_FIFO_DEPTH)
+
     return attributes_dict
+
+
+def add_fifos(attributes_dict, tx_fifo_depth, rx_fifo_depth):
+    """Add TX and RX FIFOs between the CSRs and the UART core.
+    With TX FIFO, txready means 'TX FIFO not full'. With RX FIFO, rxready means
+    'RX FIFO not empty'. An interrupt is generated when the TX FIFO level is below
+    txthresh, or when the RX FIFO level reaches rxthresh.
+    """
+    fifo_wires = []
+    interrupt_terms = []
+    snippet = ""
+    for fifo, depth in [("tx", tx_fifo_depth), ("rx", rx_fifo_depth)]:
+        if not depth:
+            continue
+        addr_w = depth.bit_length() - 1
+        attributes_dict["confs"].append(
+            {
+                "name": f"{fifo.upper()}_FIFO_DEPTH",
+                "type": "C",
+                "val": str(depth),
+                "min": "NA",
+                "max": "NA",
+                "descr": f"{fifo.upper()} FIFO depth (bytes).",
+            },
+        )
+        fifo_wires += [
+            {
+                "name": f"{fifo}level",
+                "descr": f"{fifo.upper()} FIFO level",
+                "signals": [
+                    {"name": f"{fifo}level_rd", "width": addr_w + 1},
+                ],
+            },
+            {
+                "name": f"{fifo}thresh",
+                "descr": f"{fifo.upper()} FIFO interrupt threshold",
+                "signals": [
+                    {"name": f"{fifo}thresh_wr", "width": addr_w + 1},
+                ],
+            },
+            {
+                "name": f"{fifo}_fifo_ext_mem",
+                "descr": f"{fifo.upper()} FIFO memory",
+                "signals": {
+                    "type": "ram_t2p",
+                    "prefix": f"{fifo}_fifo_ext_mem_",
+                    "ADDR_W": addr_w,
+                    "DATA_W": 8,
+                },
+            },
+        ]
+        attributes_dict["subblocks"] += [
+            {
+                "core_name": "iob_ram_t2p",
+                "instance_name": f"{fifo}_fifo_memory",
+                "instance_description": f"{fifo.upper()} FIFO RAM",
+                "parameters": {
+                    "ADDR_W": addr_w,
+                    "DATA_W": 8,
+                },
+                "connect": {
+                    "ram_t2p_s": f"{fifo}_fifo_ext_mem",
+                },
+            },
+        ]
+
+    if tx_fifo_depth:
+        fifo_wires += [
+            {
+                "name": "tx_fifo_w_en",
+                "descr": "",
+                "signals": [
+                    {"name": "txdata_wen_wr", "width": 1},
+                ],
+            },
+            {
+                "name": "tx_fifo_w_data",
+                "descr": "",
+                "signals": [
+                    {"name": "txdata_wdata_wr"},
+                ],
+            },
+            {
+                "name": "tx_fifo_full",
+                "descr": "",
+                "signals": [
+                    {"name": "tx_fifo_full", "width": 1},
+                ],
+            },
+            {
+                "name": "tx_fifo_r_en",
+                "descr": "",
+                "signals": [
+                    {"name": "tx_fifo_r_en", "width": 1},
+                ],
+            },
+            {
+                "name": "tx_fifo_r_data",
+                "descr": "",
+                "signals": [
+                    {"name": "tx_fifo_r_data", "width": 8},
+                ],
+            },
+            {
+                "name": "tx_fifo_empty",
+                "descr": "",
+                "signals": [
+                    {"name": "tx_fifo_empty", "width": 1},
+                ],
+            },
+            {
+                "name": "core_txready",
+                "descr": "",
+                "signals": [
+                    {"name": "core_txready", "width": 1},
+                ],
+            },
+            {
+                "name": "core_txdata_wen",
+                "descr": "",
+                "signals": [
+                    {"name": "core_txdata_wen", "width": 1},
+                ],
+            },
+        ]
+        attributes_dict["subblocks"] += [
+            {
+                "core_name": "iob_fifo_sync",
+                "instance_name": "tx_fifo",
+                "instance_description": "TX FIFO",
+                "parameters": {
+                    "W_DATA_W": 8,
+                    "R_DATA_W": 8,
+                    "ADDR_W": tx_fifo_depth.bit_length() - 1,
+                },
+                "connect": {
+                    "clk_en_rst_s": (
+                        "clk_en_rst_s",
+                        [
+                            "rst_i: softreset_wr",
+                        ],
+                    ),
+                    "w_en_i": "tx_fifo_w_en",
+                    "w_data_i": "tx_fifo_w_data",
+                    "w_full_o": "tx_fifo_full",
+                    "r_en_i": "tx_fifo_r_en",
+                    "r_data_o": "tx_fifo_r_data",
+                    "r_empty_o": "tx_fifo_empty",
+                    "extmem_io": "tx_fifo_ext_mem",
+                    "level_o": "txlevel",
+                },
+            },
+            {
+                "core_name": "iob_reg",
+                "instance_name": "tx_fifo_rvalid_reg",
+                "instance_description": "TX FIFO read data valid (write enable of UART core)",
+                "port_params": {
+                    "clk_en_rst_s": "c_a_r",
+                },
+                "parameters": {
+                    "DATA_W": 1,
+                    "RST_VAL": "1'b0",
+                },
+                "connect": {
+                    "clk_en_rst_s": (
+                        "clk_en_rst_s",
+                        [
+                            "rst_i: softreset_wr",
+                        ],
+                    ),
+                    "data_i": "tx_fifo_r_en",
+                    "data_o": "core_txdata_wen",
+                },
+            },
+        ]
+        snippet += """
+    // TX FIFO: read next byte when UART core is ready, and write it to the core
+    // in the next cycle (FIFO read data valid)
+    assign tx_fifo_r_en = core_txready & txen_wr & (~tx_fifo_empty) & (~core_txdata_wen);
+    assign txready_rd = ~tx_fifo_full;
+"""
+        interrupt_terms.append("(txlevel_rd < txthresh_wr)")
+
+    if rx_fifo_depth:
+        fifo_wires += [
+            {
+                "name": "rx_fifo_w_en",
+                "descr": "",
+                "signals": [
+                    {"name": "rx_fifo_w_en", "width": 1},
+                ],
+            },
+            {
+                "name": "core_rxdata",
+                "descr": "",
+                "signals": [
+                    {"name": "core_rxdata", "width": 8},
+                ],
+            },
+            {
+                "name": "rx_fifo_full",
+                "descr": "",
+                "signals": [
+                    {"name": "rx_fifo_full", "width": 1},
+                ],
+            },
+            {
+                "name": "rx_fifo_r_en",
+                "descr": "",
+                "signals": [
+                    {"name": "rxdata_valid_rd"},
+                ],
+            },
+            {
+                "name": "rx_fifo_r_data",
+                "descr": "",
+                "signals": [
+                    {"name": "rxdata_rdata_rd"},
+                ],
+            },
+            {
+                "name": "rx_fifo_empty",
+                "descr": "",
+                "signals": [
+                    {"name": "rx_fifo_empty", "width": 1},
+                ],
+            },
+            {
+                "name": "core_rxready",
+                "descr": "",
+                "signals": [
+                    {"name": "core_rxready", "width": 1},
+                ],
+            },
+        ]
+        attributes_dict["subblocks"] += [
+            {
+                "core_name": "iob_fifo_sync",
+                "instance_name": "rx_fifo",
+                "instance_description": "RX FIFO",
+                "parameters": {
+                    "W_DATA_W": 8,
+                    "R_DATA_W": 8,
+                    "ADDR_W": rx_fifo_depth.bit_length() - 1,
+                },
+                "connect": {
+                    "clk_en_rst_s": (
+                        "clk_en_rst_s",
+                        [
+                            "rst_i: softreset_wr",
+                        ],
+                    ),
+                    "w_en_i": "rx_fifo_w_en",
+                    "w_data_i": "core_rxdata",
+                    "w_full_o": "rx_fifo_full",
+                    "r_en_i": "rx_fifo_r_en",
+                    "r_data_o": "rx_fifo_r_data",
+                    "r_empty_o": "rx_fifo_empty",
+                    "extmem_io": "rx_fifo_ext_mem",
+                    "level_o": "rxlevel",
+                },
+            },
+        ]
+        snippet += """
+    // RX FIFO: store bytes received by UART core (clears core rx ready)
+    assign rx_fifo_w_en = core_rxready & (~rx_fifo_full);
+    assign rxready_rd = ~rx_fifo_empty;
+"""
+        interrupt_terms.append("((|rxthresh_wr) & (rxlevel_rd >= rxthresh_wr))")
+
+    # FIFO wires must be declared before the UART core interface that uses them
+    wires = attributes_dict["wires"]
+    idx = [w["name"] for w in wires].index("iob_uart_core_reg_interface")
+    wires[idx:idx] = fifo_wires
+
+    attributes_dict["ports"].append(
+        {
+            "name": "interrupt_o",
+            "descr": "Interrupt signal",
+            "signals": [
+                {
+                    "name": "interrupt_o",
+                    "width": "1",
+                    "descr": "FIFO threshold interrupt signal",
+                },
+            ],
+        },
+    )
+    snippet += f"""
+    // FIFO threshold interrupt
+    assign interrupt_o = {" | ".join(interrupt_terms)};
+"""
+    attributes_dict["snippets"].append({"verilog_code": snippet})
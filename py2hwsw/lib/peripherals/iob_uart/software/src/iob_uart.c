@@ -5,6 +5,7 @@
  */
 
 #include "iob_uart.h"
+#include "iob_uart_conf.h"
 #include <stdint.h>
 
 // TX FUNCTIONS
@@ -31,6 +32,50 @@ uint8_t uart_getc() {
   return iob_uart_csrs_get_rxdata();
 }
 
+// BUFFERED FUNCTIONS
+
+// Number of bytes that can be written to TX without waiting
+static uint32_t uart_txroom() {
+#ifdef IOB_UART_TX_FIFO_DEPTH
+  return IOB_UART_TX_FIFO_DEPTH - iob_uart_csrs_get_txlevel();
+#else
+  return iob_uart_csrs_get_txready();
+#endif
+}
+
+// Number of bytes that can be read from RX without waiting
+static uint32_t uart_rxavail() {
+#ifdef IOB_UART_RX_FIFO_DEPTH
+  return iob_uart_csrs_get_rxlevel();
+#else
+  return iob_uart_csrs_get_rxready();
+#endif
+}
+
+void uart_write(const char *buf, uint32_t n) {
+  while (n) {
+    // fill free TX FIFO positions with a single status read
+    uint32_t room = uart_txroom();
+    if (room > n)
+      room = n;
+    n -= room;
+    for (; room; room--)
+      iob_uart_csrs_set_txdata(*buf++);
+  }
+}
+
+void uart_read(char *buf, uint32_t n) {
+  while (n) {
+    // drain available RX FIFO bytes with a single status read
+    uint32_t avail = uart_rxavail();
+    if (avail > n)
+      avail = n;
+    n -= avail;
+    for (; avail; avail--)
+      *buf++ = iob_uart_csrs_get_rxdata();
+  }
+}
+
 // UART basic functions
 void uart_init(int base_address, uint16_t div) {
   // capture base address for good
@@ -58,8 +103,10 @@ void uart_finish() {
 
 // Print string, excluding end of string (0)
 void uart_puts(const char *s) {
-  while (*s)
-    uart_putc(*s++);
+  uint32_t n = 0;
+  while (s[n])
+    n++;
+  uart_write(s, n);
 }
 
 // Sends the name of the file to use, including end of string (0)
@@ -92,9 +139,7 @@ uint32_t uart_recvfile(char *file_name, char *mem) {
   uart_putc(ACK);
 
   // write file to memory
-  for (uint32_t i = 0; i < file_size; i++) {
-    mem[i] = uart_getc();
-  }
+  uart_read(mem, file_size);
 
   uart_puts(UART_PROGNAME);
   uart_puts(": file received\n");
@@ -121,9 +166,154 @@ void uart_sendfile(char *file_name, int file_size, char *mem) {
   uart_putc((char)((file_size & 0x0ff000000) >> 24));
 
   // send file contents
-  for (int i = 0; i < file_size; i++)
-    uart_putc(mem[i]);
+  uart_write(mem, file_size);
 
   uart_puts(UART_PROGNAME);
   uart_puts(": file sent\n");
 }
+
+// Compressed file transfer
+
+// CRC-32 (same as zlib's crc32)
+static uint32_t uart_crc32(const char *data, uint32_t len) {
+  uint32_t crc = 0xFFFFFFFF;
+  for (uint32_t i = 0; i < len; i++) {
+    crc ^= (uint8_t)data[i];
+    for (int k = 0; k < 8; k++)
+      crc = (crc >> 1) ^ (0xEDB88320 & -(crc & 1));
+  }
+  return ~crc;
+}
+
+// Receive little endian word of nbytes bytes
+static uint32_t uart_getw(int nbytes) {
+  uint32_t word = 0;
+  for (int i = 0; i < nbytes; i++)
+    word |= ((uint32_t)uart_getc()) << (8 * i);
+  return word;
+}
+
+// Receive byte of compressed block, or return 0 if all src_len bytes were
+// already received
+static uint8_t uart_lz4_getc(uint32_t *in, uint32_t src_len) {
+  if (*in >= src_len)
+    return 0;
+  (*in)++;
+  return uart_getc();
+}
+
+// Receive extra bytes of saturated (15) LZ4 length
+static uint32_t uart_lz4_len(uint32_t len, uint32_t *in, uint32_t src_len) {
+  uint8_t byte;
+  if (len == 15) {
+    do {
+      byte = uart_lz4_getc(in, src_len);
+      len += byte;
+    } while (byte == 255);
+  }
+  return len;
+}
+
+// Receive LZ4 block of src_len bytes and decompress it to dst.
+// All src_len bytes are received, even if the block is corrupted.
+// Returns size of decompressed block, or -1 if block is corrupted.
+static int32_t uart_lz4_recv(char *dst, uint32_t dst_len, uint32_t src_len) {
+  uint32_t in = 0, out = 0, len, offset;
+  int error = 0;
+
+  while (in < src_len && !error) {
+    uint8_t token = uart_lz4_getc(&in, src_len);
+
+    // copy literals
+    len = uart_lz4_len(token >> 4, &in, src_len);
+    for (; len; len--) {
+      if (in >= src_len || out >= dst_len) {
+        error = 1;
+        break;
+      }
+      dst[out++] = uart_lz4_getc(&in, src_len);
+    }
+
+    // last sequence has no match
+    if (error || in >= src_len)
+      break;
+
+    // copy match
+    offset = uart_lz4_getc(&in, src_len);
+    offset |= ((uint32_t)uart_lz4_getc(&in, src_len)) << 8;
+    if (offset == 0 || offset > out) {
+      error = 1;
+      break;
+    }
+    len = uart_lz4_len(token & 15, &in, src_len) + 4;
+    for (; len; len--) {
+      if (out >= dst_len) {
+        error = 1;
+        break;
+      }
+      dst[out] = dst[out - offset];
+      out++;
+    }
+  }
+
+  // discard rest of corrupted block
+  while (in < src_len)
+    uart_lz4_getc(&in, src_len);
+
+  return error ? -1 : (int32_t)out;
+}
+
+// Receives compressed file into mem
+uint32_t uart_recvfile_lz(char *file_name, char *mem) {
+
+  uart_puts(UART_PROGNAME);
+  uart_puts(": requesting to receive compressed file\n");
+
+  // send compressed file receive request
+  uart_putc(FRXZ);
+
+  // send file name
+  uart_sendstr(file_name);
+
+  // receive file size
+  uint32_t file_size = uart_getw(4);
+
+  // send ACK before receiving file
+  uart_putc(ACK);
+
+  // receive blocks, requesting corrupted ones again
+  uint32_t pos = 0;
+  while (pos < file_size) {
+    uint32_t block_size = file_size - pos;
+    if (block_size > UART_BLOCK_SIZE)
+      block_size = UART_BLOCK_SIZE;
+
+    uint32_t len = uart_getw(2);
+    uint32_t crc = uart_getw(4);
+    int32_t received;
+    if (len & UART_BLOCK_STORED) {
+      len &= ~UART_BLOCK_STORED;
+      received = len;
+      for (uint32_t i = 0; i < len; i++) {
+        char c = uart_getc();
+        if (i < block_size)
+          mem[pos + i] = c;
+      }
+    } else {
+      received = uart_lz4_recv(mem + pos, block_size, len);
+    }
+
+    if (received == (int32_t)block_size &&
+        uart_crc32(mem + pos, block_size) == crc) {
+      pos += block_size;
+      uart_putc(ACK);
+    } else {
+      uart_putc(NAK);
+    }
+  }
+
+  uart_puts(UART_PROGNAME);
+  uart_puts(": file received\n");
+
+  return file_size;
+}
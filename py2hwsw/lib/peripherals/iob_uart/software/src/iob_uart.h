@@ -14,6 +14,7 @@
  *      - initialization and setup
  *      - basic control functions
  *      - single character send and receive functions
+ *      - buffered multi byte send and receive functions
  *      - simple protocol for multi byte transfers
  *
  */
@@ -72,6 +73,18 @@
  * @brief File reception.
  * Signal file reception request.
  */
+/**
+ * @def FRXZ
+ *
+ * @brief Compressed file reception.
+ * Signal reception request of file in CRC checked, LZ4 compressed blocks.
+ */
+/**
+ * @def NAK
+ *
+ * @brief Negative acknowledge.
+ * Signal corrupted incomming block, requesting its retransmission.
+ */
 #define STX 2 // start text
 #define ETX 3 // end text
 #define EOT 4 // end of transission
@@ -79,6 +92,20 @@
 #define ACK 6 // acklowledge
 #define FTX 7 // transmit file
 #define FRX 8 // receive file
+#define FRXZ 14 // receive compressed file
+#define NAK 21  // negative acknowledge
+
+// Compressed file transfer
+/**
+ * @def UART_BLOCK_SIZE
+ * @brief Maximum size of uncompressed block of compressed file transfers.
+ */
+#define UART_BLOCK_SIZE 4096
+/**
+ * @def UART_BLOCK_STORED
+ * @brief Flag of block length, set if block is not compressed.
+ */
+#define UART_BLOCK_STORED 0x8000
 
 // UART functions
 
@@ -132,6 +159,17 @@ void uart_putc(char c);
  */
 void uart_puts(const char *s);
 
+/** @brief Write buffer.
+ *
+ * Send n bytes via UART. If the core has a TX FIFO, each TX status read is
+ * followed by as many writes as there are free FIFO positions.
+ *
+ * @param buf Pointer to bytes to send.
+ * @param n Number of bytes to send.
+ * @return void.
+ */
+void uart_write(const char *buf, uint32_t n);
+
 /** @brief Send file.
  *
  * Send variable size file via UART.
@@ -164,6 +202,17 @@ void uart_rxwait();
  */
 uint8_t uart_getc();
 
+/** @brief Read buffer.
+ *
+ * Active wait and receive n bytes from UART. If the core has an RX FIFO, each
+ * RX status read is followed by as many reads as there are bytes in the FIFO.
+ *
+ * @param buf Pointer in memory to store received bytes.
+ * @param n Number of bytes to receive.
+ * @return void.
+ */
+void uart_read(char *buf, uint32_t n);
+
 /** @brief Receive file.
  *
  * Request variable size file via UART.
@@ -181,3 +230,26 @@ uint8_t uart_getc();
  * @return Size of received file.
  */
 uint32_t uart_recvfile(char *file_name, char *mem);
+
+/** @brief Receive compressed file.
+ *
+ * Request variable size file via UART, transferred in blocks of up to
+ * UART_BLOCK_SIZE bytes, each LZ4 compressed and checked with a CRC-32.
+ * Order of commands:
+ *  1. Send compressed file receive (FRXZ) command.
+ *  2. Send file_name.
+ *  3. Receive file_size (in little endian format).
+ *  4. Send ACK command.
+ *  5. For each block:
+ *     - Receive payload length (2 bytes, bit 15 set if block is not
+ *       compressed) and CRC-32 of the uncompressed block (4 bytes), in little
+ *       endian format.
+ *     - Receive payload and decompress it to its final location in memory.
+ *     - Send ACK command if CRC matches, or NAK command to request the block
+ *       again.
+ *
+ * @param file_name Pointer to file name string.
+ * @param mem Pointer in memory to store incomming file.
+ * @return Size of received file.
+ */
+uint32_t uart_recvfile_lz(char *file_name, char *mem);
@@ -10,6 +10,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 
+#include "iob_uart_conf.h"
 #include "iob_uart_csrs.h"
 
 static uint16_t div_value;
@@ -86,3 +87,17 @@ uint8_t iob_uart_csrs_get_rxdata() {
 }
 
 uint8_t iob_uart_csrs_get_rxready() { return 1; }
+
+#ifdef IOB_UART_TX_FIFO_DEPTH
+// Bytes are sent to console immediately, so TX FIFO is always empty
+uint8_t iob_uart_csrs_get_txlevel() { return 0; }
+
+void iob_uart_csrs_set_txthresh(uint8_t value) { return; }
+#endif
+
+#ifdef IOB_UART_RX_FIFO_DEPTH
+// get_rxdata() waits for the console, so report one byte at a time
+uint8_t iob_uart_csrs_get_rxlevel() { return 1; }
+
+void iob_uart_csrs_set_rxthresh(uint8_t value) { return; }
+#endif
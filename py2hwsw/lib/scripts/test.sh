@@ -41,10 +41,11 @@ for i in $TB_DIRS; do MODULES+=" `basename $(builtin cd $i/../../..; pwd)`" ; do
 
 #test first argument is "clean", run make clean for all modules and exit
 if [ "$1" == "clean" ]; then
-    for i in $MODULES; do 
-        DEFAULT_BUILD_DIR=`py2hwsw $i print_build_dir`
-        make clean CORE=$i BUILD_DIR=../../${DEFAULT_BUILD_DIR}
-    done
+    # Find build directories (../../../<module>_V<version>) by their marker
+    # file, without elaborating each module
+    CLEAN_CORES=""
+    for i in $MODULES; do CLEAN_CORES+=" --clean_core $i"; done
+    py2hwsw --clean_all ../../.. --clean_depth 1 $CLEAN_CORES
     exit 0
 fi
 
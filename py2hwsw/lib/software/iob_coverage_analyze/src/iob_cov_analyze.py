@@ -5,9 +5,21 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+import hashlib
+import json
+import os
 from pathlib import Path
 import re
+import time
+import xml.etree.ElementTree as ET
+
+# Line coverage status, ordered from worst to best.
+# When merging annotation sets, each line keeps the best status.
+UNCOVERED = 0
+MIXED = 1
+COVERED = 2
 
 
 def parse_arguments():
@@ -19,8 +31,9 @@ def parse_arguments():
     )
     parser.add_argument(
         "annotations",
-        default=".",
-        help="Path to verilator coverage annotations.",
+        nargs="+",
+        help="Path to verilator coverage annotations. "
+        "Give multiple paths to merge coverage of multiple simulations.",
     )
     parser.add_argument(
         "-E",
@@ -40,7 +53,8 @@ def parse_arguments():
         "-T",
         "--waived-tag",
         action="store_true",
-        help="Tag waived lines in verilog coverage annotations. Replaces annotation with `%waived`",
+        help="Tag waived lines in verilog coverage annotations. Replaces annotation with `%waived`. "
+        "Only supported with a single annotations path.",
     )
     parser.add_argument(
         "-o",
@@ -48,7 +62,40 @@ def parse_arguments():
         default="coverage.rpt",
         help="Output report file.",
     )
+    parser.add_argument(
+        "--json",
+        default="",
+        help="Output JSON summary file.",
+    )
+    parser.add_argument(
+        "--cobertura",
+        default="",
+        help="Output Cobertura XML file.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of parallel jobs used to process annotation files.",
+    )
+    parser.add_argument(
+        "-C",
+        "--cache",
+        default=None,
+        help="Cache file with processed annotation files. Only files whose hash "
+        "changed are processed again. Default: <output>.cache.json",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the cache file.",
+    )
     args = parser.parse_args()
+    if args.waived_tag and len(args.annotations) > 1:
+        parser.error("--waived-tag is only supported with a single annotations path")
+    if args.cache is None:
+        args.cache = os.path.splitext(args.output)[0] + ".cache.json"
     return args
 
 
@@ -86,9 +133,70 @@ def create_waive_rule(line: str) -> WaiveRule:
     return WaiveRule(file, line_start, line_end, reason)
 
 
+def get_waived_intervals(rules: list[WaiveRule]) -> list[tuple[int, int]]:
+    """Merge line ranges of waive rules into sorted, non-overlapping intervals.
+    Args:
+        rules list[WaiveRule]: List of waive rules.
+    Returns:
+        list[tuple[int, int]]: List of (line_start, line_end) intervals.
+    """
+    intervals: list[tuple[int, int]] = []
+    for start, end in sorted((r.line_start, r.line_end) for r in rules):
+        if intervals and start <= intervals[-1][1] + 1:
+            intervals[-1] = (intervals[-1][0], max(intervals[-1][1], end))
+        else:
+            intervals.append((start, end))
+    return intervals
+
+
+def parse_annotation_lines(lines: list[str]) -> dict[int, tuple[int, int]]:
+    """Parse lines of a coverage annotation file.
+    Check: https://verilator.org/guide/latest/exe_verilator_coverage.html for
+    more details.
+    Args:
+        lines list[str]: Lines of the annotation file.
+    Returns:
+        dict[int, tuple[int, int]]: Status and hit count of each annotated line.
+            Format: {line_number: (status, hits)}
+    """
+    annotated: dict[int, tuple[int, int]] = {}
+    for lnum, line in enumerate(lines, start=1):
+        tokens = line.split(maxsplit=1)
+        if not tokens:
+            continue  # skip empty lines
+        annotation = tokens[0]
+        if annotation.isdigit():
+            annotated[lnum] = (COVERED, int(annotation))
+        elif annotation[0] in "%~":
+            hits = int(annotation[1:]) if annotation[1:].isdigit() else 0
+            annotated[lnum] = (UNCOVERED if annotation[0] == "%" else MIXED, hits)
+    return annotated
+
+
+def process_annotation_file(job: tuple[str, str]) -> tuple[str, str, list]:
+    """Hash and parse a coverage annotation file. Runs in a worker process.
+    Args:
+        job tuple[str, str]: Path of the file and hash of its cached version.
+    Returns:
+        tuple[str, str, list]: Path, hash, and list of [line_number, status, hits].
+            The list is None if the hash did not change.
+    """
+    path, cached_hash = job
+    with open(path, "rb") as file:
+        content = file.read()
+    file_hash = hashlib.sha1(content).hexdigest()
+    if file_hash == cached_hash:
+        return path, file_hash, None
+    lines = content.decode(errors="replace").splitlines()
+    annotated = parse_annotation_lines(lines)
+    return path, file_hash, [[lnum, *status] for lnum, status in annotated.items()]
+
+
 @dataclass
 class CovFile:
-    """Represent a Verilator coverage annotation file"""
+    """Represent a Verilator coverage annotation file.
+    May merge annotations of the same file from multiple annotation sets.
+    """
 
     path: str = ""
     covered_lines: int = 0
@@ -96,6 +204,10 @@ class CovFile:
     uncovered_lines: int = 0
     mixed_lines: int = 0
     waive_rules: list[WaiveRule] = field(default_factory=list)
+    # Paths of the annotation files of this file (one per annotation set)
+    sources: list[str] = field(default_factory=list)
+    # Merged status of annotated lines. Format: {line_number: (status, hits)}
+    annotated: dict[int, tuple[int, int]] = field(default_factory=dict)
 
     @property
     def total_lines(self) -> int:
@@ -121,96 +233,99 @@ class CovFile:
         return self.path.split("/")[-1]
 
     @property
-    def waived_line_numbers(self) -> list[int]:
+    def waived_intervals(self) -> list[tuple[int, int]]:
         """
         Returns:
-            list[str]: List of line number to waive.
+            list[tuple[int, int]]: Sorted, non-overlapping intervals of waived lines.
         """
-        excluded_lines = []
-        # get all waived lines
-        for rule in self.waive_rules:
-            excluded_lines += list(range(rule.line_start, rule.line_end + 1))
-        # remove repeated lines
-        return list(set(excluded_lines))
+        return get_waived_intervals(self.waive_rules)
 
-    def process(self) -> None:
-        """Read and process coverage annotation file.
-        Update the coverage data structures with information about coverage.
-        Check: https://verilator.org/guide/latest/exe_verilator_coverage.html for
-        more details.
+    @property
+    def waived_line_numbers(self) -> set[int]:
         """
-        # read file lines
-        with open(self.path, "r") as file:
-            lines = self.exclude_waives(file.readlines())
-            for line in lines:
-                tokens = line.split()
-                if not tokens:
-                    continue  # skip empty lines
-                annotation = tokens[0]
-                if annotation.isdigit():
-                    self.covered_lines += 1
-                elif annotation.startswith("%"):
-                    self.uncovered_lines += 1
-                elif annotation.startswith("~"):
-                    self.mixed_lines += 1
-
-    def tag_waived_lines(self) -> None:
-        """Read and process coverage annotation file.
-        Update the coverage data structures with information about coverage.
-        Check: https://verilator.org/guide/latest/exe_verilator_coverage.html for
-        more details.
+        Returns:
+            set[int]: Set of line numbers to waive.
         """
-        # read file lines
-        lines = []
-        with open(self.path, "r") as file:
-            lines = file.readlines()
-        waived_line_numbers = self.waived_line_numbers
-        for lnum in waived_line_numbers:
-            # replace waived line annotation with %waived
-            lines[lnum - 1] = re.sub(
-                r"[%~]([0-9]+)", "%waived", lines[lnum - 1], count=1
-            )
-        with open(self.path, "w") as file:
-            file.writelines(lines)
-
-    def exclude_waives(self, lines: list[str]) -> list[str]:
-        """Exclude waived lines from coverage analysis.
+        return {
+            lnum
+            for start, end in self.waived_intervals
+            for lnum in range(start, end + 1)
+        }
+
+    def merge(self, annotated: dict[int, tuple[int, int]]) -> None:
+        """Merge annotated lines of one annotation set into this file.
+        Each line keeps its best status, and the sum of hits of all sets.
         Args:
-            lines list[str]:
-        Returns:
-            list[str]: List of lines excluding waived lines.
+            annotated dict[int, tuple[int, int]]: Status and hits of annotated lines.
         """
-        excluded_lines = self.waived_line_numbers
-        # exclude waived lines
-        filtered_lines = [
-            line
-            for lnum, line in enumerate(lines, start=1)
-            if lnum not in excluded_lines
-        ]
-        # update waived lines count
-        self.waived_lines = len(excluded_lines)
-        return filtered_lines
+        for lnum, (status, hits) in annotated.items():
+            if lnum in self.annotated:
+                old_status, old_hits = self.annotated[lnum]
+                self.annotated[lnum] = (max(old_status, status), old_hits + hits)
+            else:
+                self.annotated[lnum] = (status, hits)
 
+    def process(self) -> None:
+        """Update the coverage counters from the merged annotated lines,
+        excluding waived lines.
+        """
+        waived = self.waived_line_numbers
+        self.covered_lines = self.uncovered_lines = self.mixed_lines = 0
+        for lnum, (status, _) in self.annotated.items():
+            if lnum in waived:
+                continue
+            if status == COVERED:
+                self.covered_lines += 1
+            elif status == UNCOVERED:
+                self.uncovered_lines += 1
+            else:
+                self.mixed_lines += 1
+        # update waived lines count
+        self.waived_lines = len(waived)
 
-def get_annotated_files(path: str, exclude: list[str]) -> list[CovFile]:
-    """Get all verilog coverage annotation file in path.
+    def tag_waived_lines(self) -> bool:
+        """Replace annotations of waived lines with `%waived`, in the annotation file.
+        The file is only rewritten if any line changed.
+        Returns:
+            bool: True if the file changed.
+        """
+        with open(self.path, "r") as file:
+            lines = file.readlines()
+        changed = False
+        for start, end in self.waived_intervals:
+            for lnum in range(start, min(end, len(lines)) + 1):
+                # replace waived line annotation with %waived
+                new_line = re.sub(r"[%~]([0-9]+)", "%waived", lines[lnum - 1], count=1)
+                if new_line != lines[lnum - 1]:
+                    lines[lnum - 1] = new_line
+                    changed = True
+        if changed:
+            with open(self.path, "w") as file:
+                file.writelines(lines)
+        return changed
+
+
+def get_annotated_files(paths: list[str], exclude: list[str]) -> list[CovFile]:
+    """Get all verilog coverage annotation files in paths.
+    Files with the same relative path in different annotation sets are merged.
     Args:
-        path str: Path to search for coverage annotation files.
+        paths list[str]: Paths to search for coverage annotation files.
         exclude list[str]: List of files to exclude from coverage.
     Returns:
         list[CovFile]: List of Coverage Files.
     """
-    files = list(Path(path).rglob("*.v"))
-    cov_files: list[CovFile] = []
-    for f in files:
-        if str(f.name) in exclude:
-            continue  # skip excluded files
-        cov_files.append(
-            CovFile(
-                path=str(f),
-            )
-        )
-    return cov_files
+    cov_files: dict[str, CovFile] = {}
+    for path in paths:
+        for f in sorted(Path(path).rglob("*.v")):
+            if str(f.name) in exclude:
+                continue  # skip excluded files
+            rel_path = str(f.relative_to(path))
+            if rel_path not in cov_files:
+                cov_files[rel_path] = CovFile(
+                    path=str(f) if len(paths) == 1 else rel_path,
+                )
+            cov_files[rel_path].sources.append(str(f))
+    return list(cov_files.values())
 
 
 def add_waive_rules(cov_files: list[CovFile], waive_files: list[str]):
@@ -228,27 +343,91 @@ def add_waive_rules(cov_files: list[CovFile], waive_files: list[str]):
                 if line.startswith("waive"):
                     rules.append(create_waive_rule(line))
     # attach rules to specific coverage files
+    files_by_name: dict[str, list[CovFile]] = {}
+    for cov_file in cov_files:
+        files_by_name.setdefault(cov_file.filename, []).append(cov_file)
     for rule in rules:
-        for cov_file in cov_files:
-            if cov_file.filename == rule.file:
-                cov_file.waive_rules.append(rule)
-                break
+        for cov_file in files_by_name.get(rule.file, []):
+            cov_file.waive_rules.append(rule)
     return rules
 
 
-def process_annotated_files(files: list[CovFile], waived_tag: bool) -> None:
+def load_cache(cache_file: str) -> dict:
+    """Load cache of processed annotation files.
+    Args:
+        cache_file str: Path of the cache file. Empty to disable cache.
+    Returns:
+        dict: Format: {annotation_file_path: {"hash": str, "lines": list}}
+    """
+    if not cache_file or not os.path.isfile(cache_file):
+        return {}
+    try:
+        with open(cache_file, "r") as file:
+            return json.load(file)
+    except ValueError:
+        return {}
+
+
+def save_cache(cache_file: str, cache: dict) -> None:
+    """Save cache of processed annotation files.
+    Args:
+        cache_file str: Path of the cache file. Empty to disable cache.
+        cache dict: Cache to save.
+    """
+    if not cache_file:
+        return
+    with open(cache_file, "w") as file:
+        json.dump(cache, file)
+
+
+def process_annotated_files(
+    files: list[CovFile], waived_tag: bool, jobs: int = 1, cache_file: str = ""
+) -> None:
     """Read and process coverage annotation files.
     Update the coverage data structures with information about coverage.
+    Annotation files are hashed and parsed in parallel. Files with the same hash
+    as in the cache are not parsed again.
     Check: https://verilator.org/guide/latest/exe_verilator_coverage.html for
     more details.
     Args:
         files list[CovFile]: List of coverage files to process.
         waived_tag bool: Tag waived lines in verilog coverage annotations.
+        jobs int: Number of parallel jobs.
+        cache_file str: Path of the cache file. Empty to disable cache.
     """
+    cache = load_cache(cache_file)
+    abs_path = {s: os.path.abspath(s) for f in files for s in f.sources}
+    work = [(s, cache.get(abs_path[s], {}).get("hash", "")) for s in abs_path]
+
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(
+                    process_annotation_file,
+                    work,
+                    chunksize=max(1, len(work) // (jobs * 4)),
+                )
+            )
+    else:
+        results = [process_annotation_file(w) for w in work]
+
+    new_cache = {}
+    parsed = {}
+    for path, file_hash, lines in results:
+        if lines is None:
+            lines = cache[abs_path[path]]["lines"]
+        new_cache[abs_path[path]] = {"hash": file_hash, "lines": lines}
+        parsed[path] = {lnum: (status, hits) for lnum, status, hits in lines}
+
     for f in files:
+        for source in f.sources:
+            f.merge(parsed[source])
         f.process()
-        if waived_tag:
-            f.tag_waived_lines()
+        if waived_tag and f.tag_waived_lines():
+            # Tagged file changed, so it will be parsed again in next run
+            new_cache.pop(abs_path[f.path], None)
+
+    save_cache(cache_file, new_cache)
 
 
 def report_results(files: list[CovFile], output: str) -> None:
@@ -261,26 +440,16 @@ def report_results(files: list[CovFile], output: str) -> None:
         rpt.write("==========================\n")
         rpt.write("Verilator Coverage Summary\n")
         rpt.write("==========================\n")
-        total_files = len(files)
-        covered_files = 0
-        total_lines = 0
-        covered_lines = 0
-        waived_lines = 0
-        for f in files:
-            total_lines += f.total_lines
-            covered_lines += f.covered_lines
-            waived_lines += f.waived_lines
-            if f.is_covered():
-                covered_files += 1
+        summary = get_summary(files)
+        total_files = summary["total_files"]
+        covered_files = summary["covered_files"]
         rpt.write(f"Total Files: {total_files}\n")
         rpt.write(f"Covered Files: {covered_files}\n")
         rpt.write(f"Files Missing Coverage: {total_files - covered_files}\n\n")
-        rpt.write(f"[Covered/Total] Lines: [{covered_lines}/{total_lines}]\n\n")
-        if total_lines == 0:
-            global_coverage = 100.0
-        else:
-            global_coverage = ((covered_lines + waived_lines) / total_lines) * 100
-        rpt.write(f"Global Coverage: {global_coverage:.2f} %\n\n")
+        rpt.write(
+            f"[Covered/Total] Lines: [{summary['covered_lines']}/{summary['total_lines']}]\n\n"
+        )
+        rpt.write(f"Global Coverage: {summary['coverage']:.2f} %\n\n")
         rpt.write("=================\n")
         rpt.write("Covered File List\n")
         rpt.write("=================\n")
@@ -292,6 +461,124 @@ def report_results(files: list[CovFile], output: str) -> None:
             )
 
 
+def get_summary(files: list[CovFile]) -> dict:
+    """Get coverage summary of the processed coverage files.
+    Args:
+        files list[CovFile]: List of processed coverage files.
+    Returns:
+        dict: Coverage summary.
+    """
+    total_lines = sum(f.total_lines for f in files)
+    covered_lines = sum(f.covered_lines for f in files)
+    waived_lines = sum(f.waived_lines for f in files)
+    if total_lines == 0:
+        global_coverage = 100.0
+    else:
+        global_coverage = ((covered_lines + waived_lines) / total_lines) * 100
+    return {
+        "total_files": len(files),
+        "covered_files": sum(1 for f in files if f.is_covered()),
+        "total_lines": total_lines,
+        "covered_lines": covered_lines,
+        "waived_lines": waived_lines,
+        "uncovered_lines": sum(f.uncovered_lines for f in files),
+        "mixed_lines": sum(f.mixed_lines for f in files),
+        "coverage": global_coverage,
+    }
+
+
+def report_json(files: list[CovFile], output: str, annotations: list[str]) -> None:
+    """Generate a JSON coverage summary from the processed coverage files.
+    Args:
+        files list[CovFile]: List of coverage files to report on.
+        output str: Output JSON file path.
+        annotations list[str]: Paths of merged annotation sets.
+    """
+    summary = get_summary(files)
+    summary["annotations"] = annotations
+    summary["files"] = [
+        {
+            "path": f.path,
+            "sources": f.sources,
+            "covered_lines": f.covered_lines,
+            "waived_lines": f.waived_lines,
+            "uncovered_lines": f.uncovered_lines,
+            "mixed_lines": f.mixed_lines,
+            "total_lines": f.total_lines,
+            "coverage": f.coverage_level,
+            "waived_intervals": f.waived_intervals,
+        }
+        for f in files
+    ]
+    with open(output, "w") as file:
+        json.dump(summary, file, indent=4)
+
+
+def report_cobertura(files: list[CovFile], output: str) -> None:
+    """Generate a Cobertura XML coverage report from the processed coverage files.
+    Waived lines are not listed. Mixed lines are reported as partially covered branches.
+    Args:
+        files list[CovFile]: List of coverage files to report on.
+        output str: Output XML file path.
+    """
+    summary = get_summary(files)
+    coverage = ET.Element(
+        "coverage",
+        {
+            "line-rate": f"{summary['coverage'] / 100:.4f}",
+            "branch-rate": "0",
+            "lines-covered": str(summary["covered_lines"] + summary["waived_lines"]),
+            "lines-valid": str(summary["total_lines"]),
+            "branches-covered": "0",
+            "branches-valid": "0",
+            "complexity": "0",
+            "version": "iob_cov_analyze",
+            "timestamp": str(int(time.time())),
+        },
+    )
+    ET.SubElement(ET.SubElement(coverage, "sources"), "source").text = "."
+    package = ET.SubElement(
+        ET.SubElement(coverage, "packages"),
+        "package",
+        {
+            "name": "verilog",
+            "line-rate": f"{summary['coverage'] / 100:.4f}",
+            "branch-rate": "0",
+            "complexity": "0",
+        },
+    )
+    classes = ET.SubElement(package, "classes")
+    for f in files:
+        cov_class = ET.SubElement(
+            classes,
+            "class",
+            {
+                "name": f.filename,
+                "filename": f.path,
+                "line-rate": f"{f.coverage_level / 100:.4f}",
+                "branch-rate": "0",
+                "complexity": "0",
+            },
+        )
+        ET.SubElement(cov_class, "methods")
+        lines = ET.SubElement(cov_class, "lines")
+        waived = f.waived_line_numbers
+        for lnum in sorted(f.annotated):
+            if lnum in waived:
+                continue
+            status, hits = f.annotated[lnum]
+            attributes = {
+                "number": str(lnum),
+                "hits": str(hits if status != UNCOVERED else 0),
+            }
+            if status == MIXED:
+                attributes["branch"] = "true"
+                attributes["condition-coverage"] = "50% (1/2)"
+            ET.SubElement(lines, "line", attributes)
+    ET.indent(coverage)
+    ET.ElementTree(coverage).write(output, encoding="utf-8", xml_declaration=True)
+
+
 if __name__ == "__main__":
     print("==============================")
     print("Running Coverage Analysis Tool")
@@ -304,6 +591,15 @@ if __name__ == "__main__":
     # 2. Add waive rules to coverage files
     add_waive_rules(cov_files, args.waive)
     # 3. Process annotation files
-    process_annotated_files(cov_files, args.waived_tag)
+    process_annotated_files(
+        cov_files,
+        args.waived_tag,
+        args.jobs,
+        "" if args.no_cache else args.cache,
+    )
     # 4. Report Results
     report_results(cov_files, args.output)
+    if args.json:
+        report_json(cov_files, args.json, args.annotations)
+    if args.cobertura:
+        report_cobertura(cov_files, args.cobertura)
@@ -1239,7 +1239,17 @@ def generate_device_drivers(
     for csr_element in grouped_csrs_list:
         # If csr_element is a group of CSRs, extract them
         if "regs" in csr_element:
-            csrs_list += csr_element["regs"]
+            for csr in csr_element["regs"]:
+                # Interrupt CSRs are replaced by status, mask and clear CSRs
+                # (see interrupts.py of iob_csrs)
+                if csr.get("type", "") == "INTERRUPT":
+                    csrs_list += [
+                        {"name": f"{csr['name']}_status", "mode": "R", "n_bits": 32},
+                        {"name": f"{csr['name']}_mask", "mode": "W", "n_bits": 32},
+                        {"name": f"{csr['name']}_clear", "mode": "W", "n_bits": 32},
+                    ]
+                else:
+                    csrs_list.append(csr)
         else:
             csrs_list.append(csr_element)
 
@@ -29,11 +29,15 @@ DEBUG = False
 # Must match the server's
 HOST = "localhost"  # Use the loopback interface
 PORT = 50007  # Use the same port as the server
-VERSION = "V0.2"
+VERSION = "V0.3"
 
 # user and duration board is needed
 USER = os.environ["USER"]
 DURATION = "15"  # Default duration is 5 seconds
+# Type of board to grab. Empty selects the server's default type.
+BOARD_TYPE = ""
+# Priority in the server's wait queue (higher is served first)
+PRIORITY = 0
 
 # List of processes to kill when terminating board_client
 proc_list: List = []
@@ -51,11 +55,12 @@ CPREFIX = "[board_client]: "
 def perror():
     print(
         f"""
-Usage: ./{sys.argv[0]} [grab [duration in seconds] -c [console launch command] [-p [fpga program command] | -s [simulator run command]] | release]
+Usage: ./{sys.argv[0]} [grab [duration in seconds] [-b board type] [--priority priority] -c [console launch command] [-p [fpga program command] | -s [simulator run command]] | renew [duration in seconds] | release | query | stats]
     If -p is given then -c is required. If -s is given then -c is optional.
     On fpga program (-p) mode, it will launch the fpga program command first, wait for it to finish, and then launch the console command.
         In this mode, it will try to contact the `board_server` first to reserve/grab the board to avoid collisions on shared machines/boards.
         If the `board_server` is not available, it prints a warning and runs normally.
+        If all boards are busy, it waits in the server's queue until a board is assigned to it.
     On simulator run (-s) mode, it will run the simulator command and the console command in parallel.
         In this mode, the grab duration specifies the timeout for the simulation. The `board_server` is not used in simulation mode.
 """
@@ -67,12 +72,16 @@ Usage: ./{sys.argv[0]} [grab [duration in seconds] -c [console launch command] [
 def form_request(command):
     request = ""
     if command == "grab":
-        request += f"{command} {USER} {DURATION} {VERSION}"
-    elif command == "release":
-        request += f"{command} {USER} {VERSION}"
+        request += f"{command} {USER} {DURATION} {BOARD_TYPE} {VERSION}"
+    elif command == "wait":
+        request += f"{command} {USER} {DURATION} {BOARD_TYPE} {PRIORITY} {VERSION}"
+    elif command in ["release", "renew"]:
+        request += f"{command} {USER} {DURATION if command == 'renew' else ''} {VERSION}"
     elif command == "query":
+        request += f"{command} {BOARD_TYPE} {VERSION}"
+    elif command == "stats":
         request += f"{command} {VERSION}"
-    return request
+    return " ".join(request.split())
 
 
 # Function to send the request
@@ -81,6 +90,8 @@ def send_request(request):
         # Create a socket
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.settimeout(10)
+        # Server only replies to `wait` once a board is assigned
+        wait_request = request.startswith("wait")
 
         # Connect with the server
         try:
@@ -93,9 +104,12 @@ def send_request(request):
 
         # Send the request to the server
         s.sendall(request.encode("utf-8"))
+        if wait_request:
+            print(f"{CPREFIX}{iob_colors.INFO}Waiting for a board{iob_colors.ENDC}")
+            s.settimeout(None)
 
         # Receive the response from the server
-        response = s.recv(1024).decode()
+        response = s.recv(65536).decode()
         s.close()
         print(CPREFIX + "Server response: " + response)
 
@@ -103,6 +117,10 @@ def send_request(request):
         if "ERROR" in response:
             sys.exit(1)
 
+        # Make the name of the grabbed board available to the launched commands
+        if "Success: board" in response and "grabbed" in response:
+            os.environ["IOB_BOARD_NAME"] = response.split()[2]
+
         if "grab" in request and "Failure" in response:
             time_remaining = float(response.split(" ")[-2])
             print(
@@ -177,7 +195,7 @@ if __name__ == "__main__":
         "command",
         nargs="?",
         default="query",
-        help='Command to send to server. Can be "grab", "release" or "query".',
+        help='Command to send to server. Can be "grab", "renew", "release", "query" or "stats".',
     )
 
     # Add optional duration argument only available if command=grab
@@ -185,7 +203,23 @@ if __name__ == "__main__":
         "duration",
         nargs="?",
         default=DURATION,
-        help="Duration in seconds to grab the board.",
+        help="Duration in seconds to grab (or renew) the board.",
+    )
+
+    # Add -b argument
+    parser.add_argument(
+        "-b",
+        "--board_type",
+        default=BOARD_TYPE,
+        help="Type of board to grab. Uses the server's default type if not given.",
+    )
+
+    # Add --priority argument
+    parser.add_argument(
+        "--priority",
+        type=int,
+        default=PRIORITY,
+        help="Priority in the server's wait queue. Higher priorities are served first.",
     )
 
     # Add -c argument
@@ -212,6 +246,8 @@ if __name__ == "__main__":
     # Assign arguments to variables
     command = parser.parse_args().command
     DURATION = parser.parse_args().duration
+    BOARD_TYPE = parser.parse_args().board_type
+    PRIORITY = parser.parse_args().priority
     console_command = parser.parse_args().console
     fpga_prog_command = parser.parse_args().program
     simulator_run_command = parser.parse_args().simulate
@@ -226,7 +262,8 @@ if __name__ == "__main__":
         not fpga_prog_command or console_command
     ), f"{iob_colors.FAIL}Argument `-c` must be present with `-p`.{iob_colors.ENDC}"
 
-    request = form_request(command)
+    # Block in the server's queue instead of polling
+    request = form_request("wait" if command == "grab" else command)
     if DEBUG:
         print(
             f'{CPREFIX}{iob_colors.OKBLUE}DEBUG: Request is "{request}"{iob_colors.ENDC}'
@@ -4,16 +4,23 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
+import os
+import sys
 import time
-import socket
+import json
+import heapq
+import asyncio
+import argparse
+import itertools
 
 
 DEBUG = False
 
 
-# This is a simple server that will listen for connections on port 50007 from clients that want to use an FPGA board.
+# This is a server that will listen for connections on port 50007 from clients that want to use an FPGA board.
+# It manages a pool of named boards, grouped by board type, and a priority wait queue for each board type.
 # To install and run this server, do the following:
-# 1. Install Python 3.6 or later, and move to the lib directory
+# 1. Install Python 3.7 or later, and move to the lib directory
 #         > cd py2hwsw/lib
 #
 # 2. Run the following command from the root of this repository:
@@ -24,95 +31,375 @@ DEBUG = False
 #
 # To check if the server is running, run:
 #        > sudo make board_server_status
+#
+# The boards available are described by a JSON file (default: /etc/board_server.json) that maps each board type
+# to the list of names of the boards of that type. For example:
+#   {
+#       "AMD_VCU118": ["vcu118_0", "vcu118_1"],
+#       "iob_cyclonev_gt_dk": ["cyclonev_0"]
+#   }
+# If the file does not exist, a single board of type "default" is managed.
+#
+# Requests are single lines of space separated tokens, terminated by the client version:
+#   query [board_type] <version>
+#   grab <user> <duration> [board_type] <version>
+#   wait <user> <duration> [board_type] [priority] <version>
+#   renew <user> [duration] <version>
+#   release <user> <version>
+#   stats <version>
+# The `grab` request fails immediately if no board is idle. The `wait` request keeps the connection open until a board
+# is assigned to the client. Waiting clients are served by priority (higher first) and then in arrival order.
+# Leases expire after their duration, releasing the board automatically.
 
 # Define the server's IP, port, and version
 # Must match the client's IP and port
 
 HOST = "localhost"  # Listen on all available interfaces
 PORT = 50007  # Use a non-privileged port
-VERSION = "V0.2"
+VERSION = "V0.3"
+# Versions of the client that the server can still talk to
+SUPPORTED_VERSIONS = ["V0.2", VERSION]
 
-# user and duration board are needed
-USER = ""
+CONFIG_FILE = "/etc/board_server.json"
+DEFAULT_BOARD_TYPE = "default"
+
+# Default duration of a lease, in seconds
 DURATION = "300"  # 5 minutes
 
-# Init board status
-board_status = "idle"
+# Interval between checks for expired leases, in seconds
+EXPIRE_CHECK_INTERVAL = 0.5
+
+
+class Board:
+    """Lease state and usage statistics of a single FPGA board"""
+
+    def __init__(self, name, board_type):
+        self.name = name
+        self.board_type = board_type
+        self.user = ""
+        self.grab_time = 0.0
+        self.lease_end = 0.0
+        # Statistics
+        self.grab_count = 0
+        self.busy_time = 0.0
+
+    def is_idle(self):
+        return not self.user
+
+    def get_remaining_time(self):
+        return max(self.lease_end - time.time(), 0.0)
+
+    def grab(self, user, duration):
+        self.user = user
+        self.grab_time = time.time()
+        self.lease_end = self.grab_time + duration
+        self.grab_count += 1
+
+    def renew(self, duration):
+        self.lease_end = time.time() + duration
+
+    def release(self):
+        self.busy_time += time.time() - self.grab_time
+        self.user = ""
+        self.lease_end = 0.0
+
+    def get_busy_time(self):
+        """Return total time this board was grabbed, including the current lease"""
+        if self.is_idle():
+            return self.busy_time
+        return self.busy_time + time.time() - self.grab_time
+
+
+class Waiter:
+    """Client blocked in a `wait` request"""
+
+    def __init__(self, user, duration, priority):
+        self.user = user
+        self.duration = duration
+        self.priority = priority
+        self.enqueue_time = time.time()
+        self.future = asyncio.get_running_loop().create_future()
+        self.cancelled = False
+
+
+class BoardPool:
+    """Pool of boards grouped by type, with a wait queue per type"""
+
+    def __init__(self, board_dict):
+        self.start_time = time.time()
+        self.boards = {}
+        self.queues = {}
+        for board_type, names in board_dict.items():
+            self.boards[board_type] = [Board(name, board_type) for name in names]
+            self.queues[board_type] = []
+        # Tie breaker for waiters with the same priority (FIFO order)
+        self.counter = itertools.count()
+        # Statistics
+        self.total_wait_time = 0.0
+        self.served_waiters = 0
+
+    def check_board_type(self, board_type):
+        if board_type not in self.boards:
+            raise ValueError(
+                f"ERROR: unknown board type '{board_type}'. Available types: {', '.join(self.boards)}"
+            )
+
+    def find_user_board(self, user):
+        for board in itertools.chain(*self.boards.values()):
+            if board.user == user:
+                return board
+        return None
+
+    def find_idle_board(self, board_type):
+        for board in self.boards[board_type]:
+            if board.is_idle():
+                return board
+        return None
+
+    def queue_depth(self, board_type):
+        return sum(not w.cancelled for _, _, w in self.queues[board_type])
+
+    def expire_leases(self):
+        """Release boards whose lease has expired and hand them to waiting clients"""
+        for board in itertools.chain(*self.boards.values()):
+            if not board.is_idle() and board.get_remaining_time() <= 0.1:
+                if DEBUG:
+                    print(f"Board {board.name} released due to timeout")
+                board.release()
+                self.dispatch(board.board_type)
+
+    def dispatch(self, board_type):
+        """Assign idle boards of given type to the waiters at the front of the queue"""
+        queue = self.queues[board_type]
+        while queue:
+            board = self.find_idle_board(board_type)
+            if not board:
+                return
+            _, _, waiter = heapq.heappop(queue)
+            if waiter.cancelled:
+                continue
+            board.grab(waiter.user, waiter.duration)
+            self.total_wait_time += time.time() - waiter.enqueue_time
+            self.served_waiters += 1
+            waiter.future.set_result(board)
+
+    def enqueue(self, board_type, waiter):
+        heapq.heappush(
+            self.queues[board_type],
+            (-waiter.priority, next(self.counter), waiter),
+        )
+        self.dispatch(board_type)
+
+    def cancel(self, board_type, waiter):
+        """Remove a waiter whose client went away. Release board if one was already assigned."""
+        waiter.cancelled = True
+        if waiter.future.done():
+            waiter.future.result().release()
+            self.dispatch(board_type)
+        else:
+            waiter.future.cancel()
+
+    def get_stats(self):
+        """Return dictionary with queue depth and utilisation of every board type"""
+        uptime = max(time.time() - self.start_time, 1e-6)
+        stats = {
+            "uptime": round(uptime, 1),
+            "served_waiters": self.served_waiters,
+            "average_wait_time": round(
+                self.total_wait_time / max(self.served_waiters, 1), 1
+            ),
+            "board_types": {},
+        }
+        for board_type, boards in self.boards.items():
+            stats["board_types"][board_type] = {
+                "queue_depth": self.queue_depth(board_type),
+                "busy_boards": sum(not b.is_idle() for b in boards),
+                "utilisation": round(
+                    sum(b.get_busy_time() for b in boards) / (uptime * len(boards)), 3
+                ),
+                "boards": {
+                    b.name: {
+                        "user": b.user,
+                        "remaining_time": round(b.get_remaining_time(), 1),
+                        "grab_count": b.grab_count,
+                        "utilisation": round(b.get_busy_time() / uptime, 3),
+                    }
+                    for b in boards
+                },
+            }
+        return stats
 
 
-def get_remaining_time():
-    global DURATION
-    return str(int(DURATION) - (time.time() - grab_time))
+def get_board_type(args, pool):
+    """Return board type given in request arguments, or the default one"""
+    if args and not args[0].lstrip("-").isdigit():
+        board_type = args[0]
+    elif DEFAULT_BOARD_TYPE in pool.boards:
+        board_type = DEFAULT_BOARD_TYPE
+    else:
+        # Use first board type if there is no default
+        board_type = next(iter(pool.boards))
+    pool.check_board_type(board_type)
+    return board_type
 
 
-def get_response(request):
-    global board_status
-    global grab_time
-    global USER
-    global DURATION
+def get_response(request, pool):
+    """Process a non-blocking request and return the response string"""
+    tokens = request.split()
 
     # check client's version
-    if VERSION not in request:
+    if not tokens or tokens[-1] not in SUPPORTED_VERSIONS:
         return "ERROR: Wrong version"
+    command, args = tokens[0], tokens[1:-1]
 
-    if get_remaining_time() <= "0.1":
-        board_status = "idle"
-        USER = ""
-        if DEBUG:
-            print("Board released due to timeout")
+    pool.expire_leases()
 
-    if request.startswith("query"):
-        if board_status == "idle":
+    if command == "query":
+        board_type = get_board_type(args, pool)
+        busy = [b for b in pool.boards[board_type] if not b.is_idle()]
+        if len(busy) < len(pool.boards[board_type]):
             response = "Board is idle"
         else:
-            time_remaining = get_remaining_time()
-            response = f"Board is grabbed by user {USER} for {time_remaining} seconds"
-
-    elif request.startswith("grab"):
-        if board_status == "idle":
-            board_status = "grabbed"
-            grab_time = time.time()
-            USER = request.split()[1]
-            DURATION = request.split()[2]
-            response = f"Success: board grabbed by {USER} for {DURATION} seconds."
+            time_remaining = min(b.get_remaining_time() for b in busy)
+            users = ", ".join(b.user for b in busy)
+            response = f"Board is grabbed by user {users} for {time_remaining} seconds"
+        response += f" (queue depth {pool.queue_depth(board_type)})"
+
+    elif command == "grab":
+        user, duration = args[0], float(args[1])
+        board_type = get_board_type(args[2:], pool)
+        board = pool.find_idle_board(board_type)
+        if board and not pool.queue_depth(board_type):
+            board.grab(user, duration)
+            response = f"Success: board {board.name} grabbed by {user} for {args[1]} seconds."
+        else:
+            busy = pool.boards[board_type]
+            board = min(busy, key=lambda b: b.get_remaining_time())
+            time_remaining = board.get_remaining_time()
+            response = f"Failure: board grabbed by {board.user} for {time_remaining} seconds."
+
+    elif command == "renew":
+        user = args[0]
+        board = pool.find_user_board(user)
+        if not board:
+            response = f"ERROR: no board grabbed by {user}."
         else:
-            time_remaining = get_remaining_time()
-            response = f"Failure: board grabbed by {USER} for {time_remaining} seconds."
+            duration = float(args[1]) if len(args) > 1 else float(DURATION)
+            board.renew(duration)
+            response = f"Success: board {board.name} renewed by {user} for {duration} seconds."
 
-    elif request.startswith("release"):
-        if board_status == "idle":
+    elif command == "release":
+        user = args[0]
+        board = pool.find_user_board(user)
+        if not board:
             response = "ERROR: board already idle."
-        elif board_status == "grabbed":
-            requesting_user = request.split()[1]
-            if requesting_user == USER:
-                board_status = "idle"
-                USER = ""
-                response = "Success: board released."
-            else:
-                response = (
-                    f"ERROR: cannot release board in use by another user ({USER})"
-                )
+        else:
+            board.release()
+            pool.dispatch(board.board_type)
+            response = f"Success: board {board.name} released."
+
+    elif command == "stats":
+        response = json.dumps(pool.get_stats())
+
+    else:
+        response = f"ERROR: unknown command '{command}'"
 
     if DEBUG:
         print(f'Returning response: "{response}"')
     return response
 
 
-if __name__ == "__main__":
-    grab_time = time.time()
+async def wait_for_board(request, pool, reader):
+    """Process a `wait` request. Blocks until a board is assigned or the client disconnects."""
+    tokens = request.split()
+    user, duration = tokens[1], float(tokens[2])
+    args = tokens[3:-1]
+    board_type = get_board_type(args, pool)
+    priority = int(args[-1]) if args and args[-1].lstrip("-").isdigit() else 0
 
-    # Create a TCP/IP socket
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.bind((HOST, PORT))
-    s.listen()
+    pool.expire_leases()
+    waiter = Waiter(user, duration, priority)
+    pool.enqueue(board_type, waiter)
 
-    # Loop forever
-    while True:
-        conn, addr = s.accept()
-        request = conn.recv(1024).decode("utf-8")
+    # Wait for board assignment, but stop waiting if the client closes the connection
+    eof_task = asyncio.ensure_future(reader.read(1))
+    done, _ = await asyncio.wait(
+        [waiter.future, eof_task], return_when=asyncio.FIRST_COMPLETED
+    )
+    if waiter.future not in done or eof_task in done:
         if DEBUG:
-            print(f"Received request: {request}")
-            response = get_response(request)
-        if DEBUG:
-            print(f"Got response: {response}")
-            conn.sendall(response.encode("utf-8"))
+            print(f"Client {user} stopped waiting for a {board_type} board")
+        pool.cancel(board_type, waiter)
+        eof_task.cancel()
+        return None
+    eof_task.cancel()
+
+    board = waiter.future.result()
+    return f"Success: board {board.name} grabbed by {user} for {tokens[2]} seconds."
+
+
+async def handle_client(reader, writer, pool):
+    request = (await reader.read(1024)).decode("utf-8")
+    if DEBUG:
+        print(f"Received request: {request}")
+    try:
+        if request.startswith("wait") and request.split()[-1] == VERSION:
+            response = await wait_for_board(request, pool, reader)
+        else:
+            response = get_response(request, pool)
+    except (ValueError, IndexError) as e:
+        response = str(e) if str(e).startswith("ERROR") else f"ERROR: {e}"
+    if DEBUG:
+        print(f"Got response: {response}")
+    if response is not None:
+        writer.write(response.encode("utf-8"))
+        await writer.drain()
+    writer.close()
+
+
+async def expire_leases_periodically(pool):
+    while True:
+        pool.expire_leases()
+        await asyncio.sleep(EXPIRE_CHECK_INTERVAL)
+
+
+def load_boards(config_file):
+    """Return dictionary of board names per board type, read from given JSON file"""
+    if not os.path.isfile(config_file):
+        return {DEFAULT_BOARD_TYPE: ["board0"]}
+    with open(config_file) as f:
+        board_dict = json.load(f)
+    if not board_dict or not all(board_dict.values()):
+        print(f"ERROR: {config_file} must list at least one board for each type")
+        sys.exit(1)
+    return board_dict
+
+
+async def main(config_file):
+    pool = BoardPool(load_boards(config_file))
+    server = await asyncio.start_server(
+        lambda r, w: handle_client(r, w, pool), HOST, PORT
+    )
+    asyncio.ensure_future(expire_leases_periodically(pool))
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="board_server.py",
+        description="Server to share pools of FPGA boards between multiple clients.",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=CONFIG_FILE,
+        help="JSON file with list of board names per board type.",
+    )
+    parser.add_argument(
+        "-d", "--debug", action="store_true", help="Print requests and responses."
+    )
+    args = parser.parse_args()
+    DEBUG = DEBUG or args.debug
+
+    asyncio.run(main(args.config))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# This module removes build directories without elaborating their cores.
+# Every setup writes a JSON dependency file (see dep_gen.py) to the build
+# directory, with the name of the core. That file marks the directory as a py2hwsw
+# build directory, so no core `setup()` function needs to run to find it.
+
+import os
+import json
+import glob
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import iob_colors
+from dep_gen import JSON_DEPFILE_NAME
+
+
+def read_marker(build_dir):
+    """Return contents of the marker file of a build directory, or None if it is not
+    a py2hwsw build directory.
+    """
+    try:
+        with open(os.path.join(build_dir, JSON_DEPFILE_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_build_dir(build_dir, core_names=[]):
+    """Check if directory is a py2hwsw build directory (of one of the given cores)"""
+    marker = read_marker(build_dir)
+    if marker is None:
+        return False
+    return not core_names or marker.get("core") in core_names
+
+
+def find_build_dirs(root, core_names=[], max_depth=None):
+    """Find py2hwsw build directories inside given root directory
+    :param str root: Directory to search
+    :param list core_names: Only find build directories of these cores (default: all)
+    :param int max_depth: Maximum depth of build directories below root (default: any)
+    :returns: Sorted list of build directories
+    """
+    build_dirs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if JSON_DEPFILE_NAME in filenames and is_build_dir(dirpath, core_names):
+            build_dirs.append(dirpath)
+            # Nested build directories are removed with this one
+            dirnames.clear()
+            continue
+        relpath = os.path.relpath(dirpath, root)
+        depth = 0 if relpath == "." else relpath.count(os.sep) + 1
+        if max_depth is not None and depth >= max_depth:
+            dirnames.clear()
+            continue
+        # Skip hidden directories (like .git)
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+    return sorted(build_dirs)
+
+
+def find_core_build_dirs(core_name, build_dir=""):
+    """Find build directories of a core, like iob_core.clean_build_dir, without
+    elaborating it.
+    :param str core_name: Name of the core
+    :param str build_dir: Build directory given by the user. If empty, search the
+                          default build directories ('../<core_name>_V<version>').
+    """
+    candidates = [build_dir] if build_dir else glob.glob(f"../{core_name}_V*")
+    return [d for d in candidates if is_build_dir(d, [core_name])]
+
+
+def remove_build_dirs(build_dirs, jobs=None):
+    """Remove build directories in parallel
+    :param list build_dirs: Directories to remove
+    :param int jobs: Number of parallel workers (default: one per CPU, up to 8)
+    :returns: Number of directories removed
+    """
+    if not build_dirs:
+        print(f"{iob_colors.INFO}No build directories to clean.{iob_colors.ENDC}")
+        return 0
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    failed = []
+
+    def remove(build_dir):
+        print(
+            f"{iob_colors.INFO}Cleaning build directory: '{build_dir}'.{iob_colors.ENDC}"
+        )
+        shutil.rmtree(build_dir, onerror=lambda *args: failed.append(args[1]))
+
+    # rmtree is bound by filesystem calls, which release the GIL
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(remove, build_dirs))
+
+    for path in failed:
+        print(f"{iob_colors.WARNING}Could not remove '{path}'.{iob_colors.ENDC}")
+    print(
+        f"{iob_colors.INFO}Cleaning complete. Removed {len(build_dirs)} build directories.{iob_colors.ENDC}"
+    )
+    return len(build_dirs)
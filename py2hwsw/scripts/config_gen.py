@@ -143,6 +143,23 @@ endif
     file2create.close()
 
 
+def board_setup_config_build_mk(boards, setup_cmd, build_dir):
+    """Append boards set up in the build directory to the config_build.mk.
+    The fpga makefile uses the setup command to setup other boards on demand.
+    :param list boards: boards set up in the build directory
+    :param str setup_cmd: shell command used to setup the build directory
+    :param str build_dir: build directory
+    """
+    append_str_config_build_mk(
+        f"""
+# Build directory set up only for the following boards (py2hwsw --board)
+SETUP_BOARDS={' '.join(boards)}
+PY2HWSW_SETUP_CMD={setup_cmd.replace('$', '$$')}
+""",
+        build_dir,
+    )
+
+
 # Append a string to the config_build.mk
 def append_str_config_build_mk(str_2_append, build_dir):
     file = open(f"{build_dir}/config_build.mk", "a")
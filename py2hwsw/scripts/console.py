@@ -13,10 +13,13 @@ import select
 from threading import Thread
 import subprocess
 
+from uart_lz4 import encode_file
+
 # Global variables
 debug = False
 ser = None
 SerialFlag = True
+CompressFlag = True
 tb_read = None
 PROGNAME = "IOb-Console"
 EOT = b"\x04"  # End of Transmission in Hexadecimal
@@ -24,7 +27,10 @@ ENQ = b"\x05"  # Enquiry in Hexadecimal
 ACK = b"\x06"  # Acknowledgement in Hexadecimal
 FTX = b"\x07"  # Receive file request
 FRX = b"\x08"  # Send file request
+FRXZ = b"\x0e"  # Send compressed file request
+NAK = b"\x15"  # Negative acknowledgement in Hexadecimal
 DC1 = b"\x11"  # Device Control 1 <-> Receive request to disable iob-soc exclusive message identifiers
+MAX_RETRIES = 8  # Retransmissions of a block of a compressed file
 
 
 def tb_write(data, number_of_bytes=1, is_file=False):
@@ -112,6 +118,7 @@ def cnsl_sendfile():
     file_size = os.path.getsize(name)
     print(PROGNAME, end="")
     print(": file of size {0} bytes".format(file_size))
+    start = time.time()
     if SerialFlag:
         ser.write(file_size.to_bytes(4, byteorder="little"))  # send file size
         while ser.read() != ACK:
@@ -124,7 +131,57 @@ def cnsl_sendfile():
         tb_write(f.read(), file_size, True)
     f.close()
     print(PROGNAME, end="")
-    print(": file sent")
+    print(": file sent in {0:.3f} s".format(time.time() - start))
+
+
+# Send file to target in CRC checked (and compressed) blocks
+def cnsl_sendfile_lz():
+    # receive file name
+    name = cnsl_recvstr()
+
+    with open(name, "rb") as f:
+        data = f.read()
+    file_size = len(data)
+    blocks = encode_file(data, CompressFlag)
+    transfer_size = sum(len(block) for block in blocks)
+    print(PROGNAME, end="")
+    print(
+        ": file of size {0} bytes, {1} bytes to transfer".format(
+            file_size, transfer_size
+        )
+    )
+
+    start = time.time()
+    if SerialFlag:
+        ser.write(file_size.to_bytes(4, byteorder="little"))  # send file size
+        while ser.read() != ACK:
+            pass
+    else:
+        tb_write(file_size.to_bytes(4, byteorder="little"), 4)
+        while tb_read.read(1) != ACK:
+            pass
+
+    send_percentage = 0
+    for i, block in enumerate(blocks):
+        for _ in range(MAX_RETRIES + 1):
+            if SerialFlag:
+                ser.write(block)
+                reply = ser.read()
+            else:
+                tb_write(block, len(block))
+                reply = tb_read.read(1)
+            if reply == ACK:
+                break
+            print(PROGNAME, end="")
+            print(": block {0} rejected by target, retransmitting".format(i))
+        else:
+            cnsl_perror("too many retransmissions of block {0}".format(i))
+        new_percentage = int(100 * (i + 1) / len(blocks)) // 10 * 10
+        if send_percentage != new_percentage:
+            send_percentage = new_percentage
+            print("%3d %c" % (send_percentage, "%"))
+    print(PROGNAME, end="")
+    print(": file sent in {0:.3f} s".format(time.time() - start))
 
 
 def cnsl_recvfile():
@@ -169,15 +226,18 @@ def endFileTransfer():
     global DC1
     global FTX
     global FRX
+    global FRXZ
     DC1 = None
     FTX = None
     FRX = None
+    FRXZ = None
 
 
 def usage(message):
     print(
         "{}:{}".format(
-            PROGNAME, "usage: ./console.py -s <serial port> [ -f ] [ -L/--local ]"
+            PROGNAME,
+            "usage: ./console.py -s <serial port> [ -f ] [ -L/--local ] [ --no_compress ]",
         )
     )
     cnsl_perror(message)
@@ -275,6 +335,7 @@ def init_files():
 
 def init_console():
     global SerialFlag
+    global CompressFlag
     global ser
     global debug
 
@@ -304,6 +365,9 @@ def init_console():
     if "-d" in sys.argv:
         debug = True
 
+    if "--no_compress" in sys.argv:
+        CompressFlag = False
+
     init_print()
 
 
@@ -352,6 +416,9 @@ def main():
         elif byte == FRX:
             print(f"{PROGNAME}: got file send request")
             cnsl_sendfile()
+        elif byte == FRXZ:
+            print(f"{PROGNAME}: got compressed file send request")
+            cnsl_sendfile_lz()
         elif byte == DC1:
             print(f"{PROGNAME}: disabling IOB-SOC exclusive identifiers")
             endFileTransfer()
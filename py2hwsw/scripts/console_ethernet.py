@@ -174,6 +174,9 @@ def main():
         elif byte == FRX:
             print(f"{PROGNAME}: got file send request")
             cnsl_sendfile()
+        elif byte == FRXZ:
+            print(f"{PROGNAME}: got compressed file send request")
+            cnsl_sendfile_lz()
         elif byte == EFTX:
             print(f"{PROGNAME}: got file receive by ethernet request")
             cnsl_recvfile_ethernet()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# Compare area and logic depth of the CSR read decoders generated by iob_csrs.
+# For each peripheral, sets up its CSRs with every read decoder ("compare", "case",
+# "tree", and their pipelined variants) and synthesizes the '<name>_csrs' module with
+# Yosys, reporting the number of generic cells and the longest combinational path.
+#
+# Usage: ./csr_decoder_compare.py [-o <work_dir>] [<peripheral> ...]
+
+import os
+import re
+import sys
+import shutil
+import argparse
+import subprocess
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib")
+PY2HWSW = os.path.join(os.path.dirname(os.path.abspath(__file__)), "py2hwsw.py")
+
+# (read_decoder, read_pipeline) variants to compare
+VARIANTS = [
+    ("compare", False),
+    ("case", False),
+    ("tree", False),
+    ("case", True),
+    ("tree", True),
+]
+
+# Setup module of the wrapper core. Runs the peripheral's setup and selects the
+# read decoder of its iob_csrs subblock.
+WRAPPER_TEMPLATE = """\
+import os
+import sys
+
+from iob_base import import_python_module
+from iob_core import find_module_setup_dir
+from iob_block import create_block
+
+
+def setup(py_params_dict):
+    core_dir, file_ext = find_module_setup_dir("{core_name}")
+    import_python_module(os.path.join(core_dir, "{core_name}" + file_ext))
+    attributes = sys.modules["{core_name}"].setup(py_params_dict)
+    attributes["name"] = "{core_name}"
+    # Testers are not needed to synthesize the CSRs
+    attributes.pop("superblocks", None)
+    subblocks = []
+    for block in attributes.get("subblocks", []):
+        blocks = create_block.parse_str(block) if isinstance(block, str) else [block]
+        for b in blocks:
+            if b.get("core_name") == "iob_csrs":
+                b["read_decoder"] = "{read_decoder}"
+                b["read_pipeline"] = {read_pipeline}
+            subblocks.append(b)
+    attributes["subblocks"] = subblocks
+    return attributes
+"""
+
+
+def find_peripherals():
+    """Find lib cores with an iob_csrs subblock"""
+    peripherals = []
+    peripherals_dir = os.path.join(LIB_DIR, "peripherals")
+    for core_name in sorted(os.listdir(peripherals_dir)):
+        core_file = os.path.join(peripherals_dir, core_name, core_name + ".py")
+        if os.path.isfile(core_file) and "iob_csrs" in open(core_file).read():
+            peripherals.append(core_name)
+    return peripherals
+
+
+def setup_variant(core_name, read_decoder, read_pipeline, work_dir):
+    """Setup peripheral with given read decoder
+    :returns str: directory with generated verilog sources
+    """
+    variant = f"{read_decoder}{'_pipe' if read_pipeline else ''}"
+    wrapper_name = f"{core_name}_{variant}_wrapper"
+    project_dir = os.path.join(work_dir, "cores")
+    os.makedirs(os.path.join(project_dir, wrapper_name), exist_ok=True)
+    with open(os.path.join(project_dir, wrapper_name, wrapper_name + ".py"), "w") as f:
+        f.write(
+            WRAPPER_TEMPLATE.format(
+                core_name=core_name,
+                read_decoder=read_decoder,
+                read_pipeline=read_pipeline,
+            )
+        )
+    build_dir = os.path.join(work_dir, f"{core_name}_{variant}")
+    shutil.rmtree(build_dir, ignore_errors=True)
+    subprocess.run(
+        [
+            sys.executable,
+            PY2HWSW,
+            wrapper_name,
+            "setup",
+            "--build_dir",
+            build_dir,
+            "--project_root",
+            project_dir,
+            "--no_verilog_lint",
+            "--no_verilog_format",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return os.path.join(build_dir, "hardware", "src")
+
+
+def synthesize(src_dir, top):
+    """Synthesize module with Yosys
+    :returns tuple: (number of cells, longest topological path)
+    """
+    sources = sorted(
+        os.path.join(src_dir, f) for f in os.listdir(src_dir) if f.endswith(".v")
+    )
+    script = (
+        f"read_verilog -sv -I{src_dir} {' '.join(sources)}; "
+        f"synth -flatten -top {top}; "
+        "opt_clean; stat; ltp -noff"
+    )
+    result = subprocess.run(
+        ["yosys", "-q", "-p", script, "-l", "/dev/stdout"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    cells = re.findall(r"Number of cells:\s+(\d+)", result.stdout)
+    depth = re.findall(r"Longest topological path .*\(length=(\d+)\)", result.stdout)
+    return (
+        int(cells[-1]) if cells else None,
+        int(depth[-1]) if depth else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare area and depth of iob_csrs read decoders with Yosys."
+    )
+    parser.add_argument(
+        "peripherals", nargs="*", help="Cores to compare (default: lib peripherals)"
+    )
+    parser.add_argument(
+        "-o",
+        "--work_dir",
+        default="csr_decoder_compare",
+        help="Directory for generated cores",
+    )
+    args = parser.parse_args()
+
+    if not shutil.which("yosys"):
+        sys.exit("Error: yosys not found in PATH.")
+
+    work_dir = os.path.abspath(args.work_dir)
+    peripherals = args.peripherals or find_peripherals()
+
+    header = f"{'core':<20}" + "".join(
+        f"{d + ('+pipe' if p else ''):>16}" for d, p in VARIANTS
+    )
+    print("cells / depth")
+    print(header)
+    for core_name in peripherals:
+        line = f"{core_name:<20}"
+        for read_decoder, read_pipeline in VARIANTS:
+            try:
+                src_dir = setup_variant(
+                    core_name, read_decoder, read_pipeline, work_dir
+                )
+                cells, depth = synthesize(src_dir, f"{core_name}_csrs")
+                line += f"{f'{cells} / {depth}':>16}"
+            except subprocess.CalledProcessError:
+                line += f"{'failed':>16}"
+        print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
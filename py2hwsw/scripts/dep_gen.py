@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# This module keeps track of the input files consulted during setup, and generates
+# dependency files for make. An outer makefile can use them to skip the setup of
+# build directories whose inputs did not change, for example:
+#
+#   $(BUILD_DIR)/.py2hwsw.d:
+#   	py2hwsw $(CORE) setup --build_dir $(BUILD_DIR)
+#   -include $(BUILD_DIR)/.py2hwsw.d
+
+import os
+import sys
+import json
+import shutil
+
+from py2hwsw_version import PY2HWSW_VERSION
+
+DEPFILE_NAME = ".py2hwsw.d"
+JSON_DEPFILE_NAME = ".py2hwsw_deps.json"
+
+# Set of absolute paths of input files and directories consulted during setup
+input_files = set()
+
+
+def add_input_file(path):
+    """Register a file (or directory) consulted during setup
+    :param str path: Path of the input file
+    """
+    if path and os.path.exists(path):
+        input_files.add(os.path.realpath(path))
+
+
+def add_input_dir(path, ignore=None):
+    """Register a directory, its subdirectories and files, consulted during setup
+    Directories are also registered, so that adding or removing files from them
+    causes a new setup.
+    :param str path: Path of the input directory
+    :param callable ignore: Function like the ones created by shutil.ignore_patterns()
+    """
+    if not os.path.isdir(path):
+        return
+    for root, dirs, files in os.walk(path):
+        ignored_names = set(ignore(root, dirs + files)) if ignore else set()
+        dirs[:] = [d for d in dirs if d not in ignored_names]
+        add_input_file(root)
+        for file in files:
+            if file not in ignored_names:
+                add_input_file(os.path.join(root, file))
+
+
+def copy2(src, dst, *args, **kwargs):
+    """Same as shutil.copy2, but registers the source file as an input of the setup.
+    Can be used as the `copy_function` argument of shutil.copytree().
+    """
+    add_input_file(src)
+    return shutil.copy2(src, dst, *args, **kwargs)
+
+
+def copytree(src, dst, **kwargs):
+    """Same as shutil.copytree, but registers the source files as inputs of the setup"""
+    add_input_dir(src, kwargs.get("ignore"))
+    return shutil.copytree(src, dst, copy_function=copy2, **kwargs)
+
+
+def add_python_modules(search_dirs):
+    """Register python modules loaded from inside the given directories.
+    This includes the py2hwsw scripts and the python setup files of the cores.
+    :param list search_dirs: List of directories to search for loaded modules
+    """
+    search_dirs = [os.path.realpath(d) + os.sep for d in search_dirs]
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            continue
+        module_file = os.path.realpath(module_file)
+        if any(module_file.startswith(d) for d in search_dirs):
+            add_input_file(module_file)
+
+
+def get_inputs(build_dir):
+    """Return sorted list of input files, excluding the ones inside the build directory"""
+    build_dir = os.path.realpath(build_dir) + os.sep
+    return sorted(f for f in input_files if not (f + os.sep).startswith(build_dir))
+
+
+def make_escape(path):
+    """Escape special make characters in a path"""
+    return path.replace("$", "$$").replace(" ", "\\ ").replace("#", "\\#")
+
+
+def generate_depfiles(core, project_root="."):
+    """Generate make and JSON dependency files of the core's build directory
+    :param iob_core core: Top module core
+    :param str project_root: Root directory of the project
+    """
+    add_python_modules([os.path.join(os.path.dirname(__file__), ".."), project_root])
+    inputs = get_inputs(core.build_dir)
+    target = os.path.join(core.build_dir, DEPFILE_NAME)
+    # Make only matches targets by name, so list both relative and absolute paths
+    targets = sorted(
+        {target, os.path.relpath(target), os.path.abspath(target)}, key=len
+    )
+
+    # Make syntax. Empty rules for every input prevent errors if an input is removed.
+    with open(target, "w") as f:
+        f.write(f"# Dependencies of '{core.name}' build directory.\n")
+        f.write(f"# File generated by py2hwsw {PY2HWSW_VERSION}. Do not edit.\n")
+        f.write(f"{' '.join(make_escape(t) for t in targets)}:")
+        for path in inputs:
+            f.write(f" \\\n  {make_escape(path)}")
+        f.write("\n\n")
+        for path in inputs:
+            f.write(f"{make_escape(path)}:\n")
+
+    # JSON variant, also including the python parameters used
+    py_params = {
+        k: v
+        for k, v in core.received_python_parameters.items()
+        if isinstance(v, (str, int, float, bool))
+    }
+    with open(os.path.join(core.build_dir, JSON_DEPFILE_NAME), "w") as f:
+        json.dump(
+            {
+                "core": core.name,
+                "version": core.version,
+                "py2hwsw_version": PY2HWSW_VERSION,
+                "py_params": py_params,
+                "target": target,
+                "inputs": inputs,
+            },
+            f,
+            indent=4,
+        )
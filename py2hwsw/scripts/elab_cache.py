@@ -0,0 +1,522 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+#
+# On-disk cache of elaborated lib cores, shared by every py2hwsw process of the
+# machine (and therefore by the setups of different top-level systems).
+#
+# Only leaf cores of the py2hwsw library (cores without subblocks, superblocks or
+# parent) are cached. Each one has two kinds of entries:
+# - 'setup' entries store the core description returned by the core's `setup()`
+#   function. They are keyed by core name, python parameters, hash of the core's
+#   setup directory and py2hwsw version (and scripts). Python parameters that
+#   depend on the context (issuer, build_dir, instance_name, ...) are only part of
+#   the key if `setup()` reads them. Each entry stores one variant per set of
+#   context values read.
+# - 'files' entries store the files generated by the core's `generate_build_dir()`,
+#   keyed by the core description used and its destination directory.
+#
+# Entries are evicted in least recently used order, once the cache exceeds its
+# maximum size.
+#
+
+import os
+import io
+import sys
+import json
+import time
+import marshal
+import hashlib
+import builtins
+import tempfile
+from contextlib import contextmanager
+
+from py2hwsw_version import PY2HWSW_VERSION
+from iob_globals import iob_globals
+from iob_log import get_logger
+import dep_gen
+
+log = get_logger("resolve")
+
+# Cache settings (set by py2hwsw.py). Disabled by default for other users of iob_core.
+enabled = False
+cache_dir = os.environ.get("PY2HWSW_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "py2hwsw",
+    "elab",
+)
+# Maximum size of the cache, in MiB
+max_size = int(os.environ.get("PY2HWSW_CACHE_SIZE", 256))
+
+# Python parameters given by iob_core or that only describe the instance of the core.
+# They are only part of the key of 'setup' entries if read by the `setup()` function.
+CONTEXT_PARAMS = [
+    "build_dir",
+    "py2hwsw_target",
+    "issuer",
+    "top_module",
+    "instance_name",
+    "instance_description",
+    "connect",
+    "parameters",
+]
+
+# Maximum number of variants (sets of context values) stored per 'setup' entry
+MAX_VARIANTS = 8
+
+# Python parameters that prevent caching (cores created as parents of other cores)
+UNCACHEABLE_PARAMS = ["is_parent", "child_attributes"]
+
+LIB_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), "../lib"))
+SCRIPTS_DIR = os.path.realpath(os.path.dirname(__file__))
+
+# Statistics of this process
+stats = {"setup_hits": 0, "files_hits": 0, "stores": 0}
+
+# Memoised hashes of setup directories. Format: {core_dir: hash}
+_dir_hashes = {}
+_scripts_hash = None
+
+
+def _hash(*items):
+    return hashlib.sha256(
+        json.dumps(items, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+def _hash_dir(path):
+    """Hash of the contents of every file in a directory (except bytecode)"""
+    if path not in _dir_hashes:
+        sha = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for file in sorted(files):
+                file_path = os.path.join(root, file)
+                sha.update(os.path.relpath(file_path, path).encode() + b"\0")
+                with open(file_path, "rb") as f:
+                    sha.update(f.read())
+        _dir_hashes[path] = sha.hexdigest()
+    return _dir_hashes[path]
+
+
+def _get_scripts_hash():
+    """Fingerprint of py2hwsw scripts (name, size and modification time).
+    Prevents reuse of entries generated by a modified py2hwsw with the same version.
+    """
+    global _scripts_hash
+    if _scripts_hash is None:
+        scripts = sorted(f for f in os.listdir(SCRIPTS_DIR) if f.endswith(".py"))
+        _scripts_hash = _hash(
+            [
+                (f, os.stat(os.path.join(SCRIPTS_DIR, f)).st_size)
+                + (os.stat(os.path.join(SCRIPTS_DIR, f)).st_mtime_ns,)
+                for f in scripts
+            ]
+        )
+    return _scripts_hash
+
+
+def _entry_path(key):
+    return os.path.join(cache_dir, key[:2], key)
+
+
+def _load(key):
+    """Load cache entry, updating its access time. Returns None if not found."""
+    path = _entry_path(key)
+    try:
+        with open(path, "rb") as f:
+            entry = marshal.load(f)
+        os.utime(path)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return entry
+
+
+def _store(key, entry):
+    """Atomically write cache entry. Concurrent processes may write the same entry."""
+    path = _entry_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.debug("Elaboration cache: could not store entry '%s': %s", key, e)
+        return
+    stats["stores"] += 1
+
+
+class _tracked_params(dict):
+    """Python parameters dictionary that records which context parameters are read
+    and if the dictionary is modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read = set()
+        self.modified = False
+
+    def _read(self, key):
+        if key in CONTEXT_PARAMS:
+            self.read.add(key)
+
+    def _read_all(self):
+        self.read.update(k for k in CONTEXT_PARAMS if k in self)
+
+    def __getitem__(self, key):
+        self._read(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._read(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self._read(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._read_all()
+        return super().__iter__()
+
+    def keys(self):
+        self._read_all()
+        return super().keys()
+
+    def values(self):
+        self._read_all()
+        return super().values()
+
+    def items(self):
+        self._read_all()
+        return super().items()
+
+    def copy(self):
+        self._read_all()
+        return dict(super().items())
+
+    def _modify(method):
+        def modify(self, *args, **kwargs):
+            self.modified = True
+            return getattr(dict, method)(self, *args, **kwargs)
+
+        return modify
+
+    __setitem__ = _modify("__setitem__")
+    __delitem__ = _modify("__delitem__")
+    pop = _modify("pop")
+    popitem = _modify("popitem")
+    setdefault = _modify("setdefault")
+    update = _modify("update")
+    clear = _modify("clear")
+
+
+class _write_watcher:
+    """Records the files written (or moved, linked, removed) while active"""
+
+    def __init__(self):
+        self.written = set()
+        # Set if files were changed in a way that can not be replayed
+        self.unsupported = False
+
+    def _open(self, file, mode="r", *args, **kwargs):
+        if isinstance(file, (str, bytes, os.PathLike)) and any(
+            c in mode for c in "wax+"
+        ):
+            path = os.path.realpath(os.fsdecode(file))
+            self.written.add(path)
+            if "a" in mode or ("+" in mode and "w" not in mode):
+                # File not truncated. Its contents depend on previous ones.
+                self.unsupported = True
+        return self._orig["open"](file, mode, *args, **kwargs)
+
+    def _rename(self, src, dst, *args, **kwargs):
+        self.written.discard(os.path.realpath(src))
+        self.written.add(os.path.realpath(dst))
+        return self._orig["rename"](src, dst, *args, **kwargs)
+
+    def _replace(self, src, dst, *args, **kwargs):
+        self.written.discard(os.path.realpath(src))
+        self.written.add(os.path.realpath(dst))
+        return self._orig["replace"](src, dst, *args, **kwargs)
+
+    def _unsupported(self, name):
+        def func(*args, **kwargs):
+            self.unsupported = True
+            return self._orig[name](*args, **kwargs)
+
+        return func
+
+    @contextmanager
+    def watch(self):
+        self._orig = {
+            "open": builtins.open,
+            "rename": os.rename,
+            "replace": os.replace,
+            "symlink": os.symlink,
+            "remove": os.remove,
+            "unlink": os.unlink,
+        }
+        builtins.open = io.open = self._open
+        os.rename = self._rename
+        os.replace = self._replace
+        for name in ["symlink", "remove", "unlink"]:
+            setattr(os, name, self._unsupported(name))
+        try:
+            yield self
+        finally:
+            builtins.open = io.open = self._orig["open"]
+            for name in ["rename", "replace", "symlink", "remove", "unlink"]:
+                setattr(os, name, self._orig[name])
+
+
+def _setup_key(core_name, core_file, py_params):
+    """Key of the 'setup' entry of a core, or None if it can not be cached"""
+    if (
+        not enabled
+        or py_params.get("py2hwsw_target") != "setup"
+        or any(p in py_params for p in UNCACHEABLE_PARAMS)
+    ):
+        return None
+    core_dir = os.path.dirname(os.path.realpath(core_file))
+    # Only cache library cores contained in a folder with their name
+    if not core_dir.startswith(LIB_DIR + os.sep) or (
+        os.path.basename(core_dir) != core_name
+    ):
+        return None
+    try:
+        explicit_params = json.dumps(
+            {k: v for k, v in py_params.items() if k not in CONTEXT_PARAMS},
+            sort_keys=True,
+        )
+    except (TypeError, ValueError):
+        # Python parameters with objects
+        return None
+    return _hash(
+        "setup",
+        core_name,
+        explicit_params,
+        _hash_dir(core_dir),
+        PY2HWSW_VERSION,
+        _get_scripts_hash(),
+        list(sys.version_info[:2]),
+        sorted(vars(iob_globals._instance).items()) if iob_globals._instance else [],
+    )
+
+
+def _context_hash(py_params, param):
+    """Hash of a context python parameter, or None if it contains objects (whose
+    representation changes between processes)
+    """
+    try:
+        return hashlib.sha256(
+            json.dumps(py_params.get(param), sort_keys=True).encode()
+        ).hexdigest()
+    except (TypeError, ValueError):
+        return None
+
+
+def setup(core_name, core_file, py_params, setup_func):
+    """Return the core description of `setup_func(py_params)`, from the cache if
+    possible.
+    :param str core_name: Name of the core
+    :param str core_file: Path to the core's python setup file
+    :param dict py_params: Python parameters given to the core's `setup()` function
+    :param callable setup_func: Function that calls the core's `setup()` function
+    :returns tuple: (core description, key of the description in the cache or None)
+    """
+    key = _setup_key(core_name, core_file, py_params)
+    if not key:
+        return setup_func(py_params), None
+
+    entry = _load(key) or {"variants": []}
+    for variant in entry["variants"]:
+        if all(
+            _context_hash(py_params, param) == value
+            for param, value in variant["context"].items()
+        ):
+            stats["setup_hits"] += 1
+            return marshal.loads(variant["core_dict"]), variant["id"]
+
+    tracked_params = _tracked_params(py_params)
+    explicit_params = _hash({k: v for k, v in py_params.items() if k != "issuer"})
+    watcher = _write_watcher()
+    with watcher.watch():
+        core_dict = setup_func(tracked_params)
+
+    # Setup changed the python parameters or wrote files: result can not be reused
+    if (
+        tracked_params.modified
+        or watcher.written
+        or watcher.unsupported
+        or _hash({k: v for k, v in py_params.items() if k != "issuer"})
+        != explicit_params
+    ):
+        return core_dict, None
+    try:
+        serialized = marshal.dumps(core_dict)
+    except ValueError:
+        # Description contains objects
+        return core_dict, None
+
+    context = {p: _context_hash(py_params, p) for p in sorted(tracked_params.read)}
+    if None in context.values():
+        return core_dict, None
+    variant_id = _hash(key, context)
+    entry["variants"] = entry["variants"][-MAX_VARIANTS + 1 :] + [
+        {"context": context, "core_dict": serialized, "id": variant_id}
+    ]
+    _store(key, entry)
+    return core_dict, variant_id
+
+
+def tag_core(core, setup_key):
+    """Mark core as cacheable, if it is a leaf core with a cached description
+    :param iob_core core: Core created from the description
+    :param str setup_key: Key returned by `setup()`
+    """
+    if (
+        setup_key
+        and not getattr(core, "abort_reason", None)
+        and not core.is_top_module
+        and not core.is_tester
+        and not core.is_superblock
+        and not core.parent_obj
+        and not core.subblocks
+        and not core.superblocks
+        and not core.sw_modules
+    ):
+        core.__dict__["_elab_cache_key"] = setup_key
+
+
+def _files_key(core, board_filter):
+    """Key of the 'files' entry of a core, or None if it can not be cached"""
+    setup_key = core.__dict__.get("_elab_cache_key")
+    if not setup_key:
+        return None
+    # The main Verilog module is not generated again if it already exists (for
+    # example, generated by another instance of the same module). Only the files of
+    # complete generations are stored and restored.
+    if core.generate_hw and os.path.exists(
+        os.path.join(core.build_dir, core.dest_dir, f"{core.name}.v")
+    ):
+        return None
+    return _hash(
+        "files",
+        setup_key,
+        core.name,
+        core.dest_dir,
+        core.generate_hw,
+        sorted(board_filter),
+    )
+
+
+def restore_build_files(core, board_filter=[]):
+    """Write files generated by an identical core to the core's build directory
+    :param iob_core core: Core being set up
+    :param list board_filter: Boards selected with `--board`
+    :returns bool: True if the files were restored from the cache
+    """
+    key = _files_key(core, board_filter)
+    if not key:
+        return False
+    entry = _load(key)
+    if not entry:
+        return False
+    for rel_path, mode, contents in entry["files"]:
+        path = os.path.join(core.build_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(contents)
+        os.chmod(path, mode)
+    for path in entry["inputs"]:
+        dep_gen.add_input_file(path)
+    stats["files_hits"] += 1
+    return True
+
+
+@contextmanager
+def record_build_files(core, board_filter=[]):
+    """Store files written to the build directory while the context is active
+    :param iob_core core: Core being set up
+    :param list board_filter: Boards selected with `--board`
+    """
+    key = _files_key(core, board_filter)
+    if not key:
+        yield
+        return
+    inputs_before = set(dep_gen.input_files)
+    watcher = _write_watcher()
+    with watcher.watch():
+        yield
+    if watcher.unsupported:
+        return
+
+    build_dir = os.path.realpath(core.build_dir)
+    files = []
+    for path in sorted(watcher.written):
+        # Skip files of this instance (their names include the id of the object)
+        if not os.path.isfile(path) or f"_{id(core)}_" in os.path.basename(path):
+            continue
+        if not path.startswith(build_dir + os.sep):
+            # Generated file outside build directory
+            return
+        with open(path, "rb") as f:
+            contents = f.read()
+        # Files that refer to the build directory can not be reused by other setups
+        if build_dir.encode() in contents or (
+            os.path.abspath(core.build_dir).encode() in contents
+        ):
+            return
+        files.append(
+            (os.path.relpath(path, build_dir), os.stat(path).st_mode & 0o7777, contents)
+        )
+    _store(
+        key,
+        {"files": files, "inputs": sorted(dep_gen.input_files - inputs_before)},
+    )
+
+
+def evict():
+    """Remove least recently used entries until cache is smaller than max_size"""
+    entries = []
+    total_size = 0
+    for root, _, files in os.walk(cache_dir):
+        for file in files:
+            path = os.path.join(root, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            # Remove temporary files left by interrupted processes
+            if file.endswith(".tmp") and time.time() - stat.st_mtime > 3600:
+                os.remove(path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+    for _, size, path in sorted(entries):
+        if total_size <= max_size * 1024 * 1024:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total_size -= size
+
+
+def finish():
+    """Report cache statistics and evict old entries (if any were stored)"""
+    if not enabled:
+        return
+    log.debug(
+        "Elaboration cache: %d core descriptions and %d generated file sets reused, "
+        "%d entries stored in '%s'",
+        stats["setup_hits"],
+        stats["files_hits"],
+        stats["stores"],
+        cache_dir,
+    )
+    if stats["stores"]:
+        evict()
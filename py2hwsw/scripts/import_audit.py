@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+#
+# Import-cost audit of lib core setup modules.
+# Imports each lib core module in a fresh python process (with `-X importtime`),
+# reports its import tree, flags third-party imports, and checks the import time
+# of each core against a budget derived from a JSON baseline.
+#
+
+import os
+import sys
+import json
+import subprocess
+
+import iob_colors
+from iob_base import get_lib_cores
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PY2HWSW_DIR = os.path.dirname(SCRIPTS_DIR)
+BASELINE_FILE = os.path.join(SCRIPTS_DIR, "import_baseline.json")
+
+# Default budget settings, used if not given in the baseline file
+DEFAULT_SETTINGS = {
+    # Budget of each core: max(baseline * tolerance, baseline + slack_ms)
+    "tolerance": 2.0,
+    "slack_ms": 50.0,
+    # Budget of cores missing from the baseline
+    "default_budget_ms": 100.0,
+    # Third-party imports slower than this are reported as heavyweight
+    "heavy_ms": 20.0,
+}
+
+# Printed by the child process right before importing the core module.
+# Separates the imports of the py2hwsw framework from the ones of the core.
+MARKER = "@@py2hwsw_import_audit@@"
+
+# Program executed by the child process.
+# Only iob_base is imported before the module, so framework modules imported by the
+# module are accounted for (the framework itself is audited as a separate entry).
+CHILD_PROGRAM = """
+import sys
+import json
+import time
+sys.path.insert(0, {scripts_dir!r})
+from iob_base import import_python_module
+before = set(sys.modules)
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+error = None
+start = time.perf_counter()
+try:
+    import_python_module({core_path!r})
+except BaseException as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+elapsed_ms = (time.perf_counter() - start) * 1000
+files = {{
+    name: getattr(sys.modules[name], "__file__", None) or ""
+    for name in set(sys.modules) - before
+    if name in sys.modules
+}}
+print(json.dumps({{"elapsed_ms": elapsed_ms, "error": error, "files": files}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse output of `python -X importtime`, after the audit marker.
+    :param str stderr: standard error of the child process
+    :returns list: import tree. Each node is {"name", "self_ms", "cumulative_ms", "children"}
+    """
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1 :]
+    # Children are printed before their parent, one indentation level deeper
+    pending = {}  # Format: {level: [nodes]}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            # Header line
+            continue
+        level = (len(name) - len(name.lstrip())) // 2
+        node = {
+            "name": name.strip(),
+            "self_ms": self_us / 1000,
+            "cumulative_ms": cumulative_us / 1000,
+            "children": pending.pop(level + 1, []),
+        }
+        pending.setdefault(level, []).append(node)
+    return [node for level in sorted(pending) for node in pending[level]]
+
+
+def get_origin(path):
+    """Classify a module according to the location of its file
+    :returns str: "py2hwsw", "third_party" or "stdlib"
+    """
+    if path and os.path.realpath(path).startswith(os.path.realpath(PY2HWSW_DIR)):
+        return "py2hwsw"
+    if "site-packages" in path or "dist-packages" in path:
+        return "third_party"
+    return "stdlib"
+
+
+def find_third_party(nodes, files, importer=""):
+    """Find third-party imports done by non third-party modules
+    :returns list: (module name, cumulative time, importer module) tuples
+    """
+    found = []
+    for node in nodes:
+        name = node["name"]
+        if get_origin(files.get(name, "")) == "third_party":
+            found.append((name, node["cumulative_ms"], importer))
+        else:
+            found += find_third_party(node["children"], files, name)
+    return found
+
+
+def audit_core(core_path):
+    """Import core module in a fresh process and measure its import cost
+    :param str core_path: path of the core's python module
+    :returns dict: audit result of the core
+    """
+    program = CHILD_PROGRAM.format(
+        scripts_dir=SCRIPTS_DIR, marker=MARKER, core_path=core_path
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", program],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(core_path),
+    )
+    try:
+        child = json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        child = {
+            "elapsed_ms": 0.0,
+            "error": f"Audit process failed: {result.stderr.strip()[-200:]}",
+            "files": {},
+        }
+    tree = parse_importtime(result.stderr)
+    return {
+        "elapsed_ms": child["elapsed_ms"],
+        "error": child["error"],
+        "tree": tree,
+        "third_party": find_third_party(tree, child["files"]),
+    }
+
+
+def print_tree(nodes, min_ms, indent="    "):
+    """Print import tree, omitting imports faster than min_ms"""
+    for node in sorted(nodes, key=lambda n: -n["cumulative_ms"]):
+        if node["cumulative_ms"] < min_ms:
+            continue
+        print(f"{indent}{node['cumulative_ms']:9.1f} ms  {node['name']}")
+        print_tree(node["children"], min_ms, indent + "  ")
+
+
+def load_baseline(baseline_file):
+    """Load baseline file
+    :returns dict: baseline with default settings for missing keys
+    """
+    baseline = {"cores": {}}
+    if os.path.isfile(baseline_file):
+        with open(baseline_file) as f:
+            baseline = json.load(f)
+    return DEFAULT_SETTINGS | baseline
+
+
+def get_budget(core_name, baseline):
+    """Import time budget of a core, in milliseconds"""
+    if core_name not in baseline["cores"]:
+        return baseline["default_budget_ms"]
+    reference = baseline["cores"][core_name]
+    return max(reference * baseline["tolerance"], reference + baseline["slack_ms"])
+
+
+def audit_imports(mode="check", baseline_file=BASELINE_FILE):
+    """Audit import cost of every lib core module.
+    :param str mode: "check" compares against the baseline; "update" rewrites it
+    :param str baseline_file: path of JSON baseline file
+    :returns bool: True if every core is within its budget
+    """
+    baseline = load_baseline(baseline_file)
+    core_paths = sorted(
+        (p for p in get_lib_cores() if p.endswith(".py")), key=os.path.basename
+    )
+
+    # The framework is imported by every setup, so audit it like a core
+    core_paths.insert(0, os.path.join(SCRIPTS_DIR, "iob_core.py"))
+
+    results = {}
+    failed = []
+    for core_path in core_paths:
+        core_name = os.path.splitext(os.path.basename(core_path))[0]
+        audit = audit_core(core_path)
+        results[core_name] = audit
+        budget = get_budget(core_name, baseline)
+        over_budget = mode == "check" and audit["elapsed_ms"] > budget
+        heavy = [t for t in audit["third_party"] if t[1] >= baseline["heavy_ms"]]
+
+        if audit["error"]:
+            status = f"{iob_colors.FAIL}import failed{iob_colors.ENDC}"
+            failed.append(core_name)
+        elif over_budget:
+            status = f"{iob_colors.FAIL}over budget ({budget:.1f} ms){iob_colors.ENDC}"
+            failed.append(core_name)
+        elif heavy:
+            status = f"{iob_colors.WARNING}heavy third-party imports{iob_colors.ENDC}"
+        else:
+            status = "ok"
+        print(f"{core_name:<32} {audit['elapsed_ms']:9.1f} ms  {status}")
+
+        if audit["error"]:
+            print(f"    {audit['error']}")
+        for name, cumulative_ms, importer in heavy:
+            print(
+                f"    third-party '{name}' imported by '{importer or core_name}': {cumulative_ms:.1f} ms"
+            )
+        if over_budget:
+            print_tree(audit["tree"], min_ms=1.0)
+
+    if mode == "update":
+        baseline["cores"] = {
+            name: round(audit["elapsed_ms"], 1)
+            for name, audit in results.items()
+            if not audit["error"]
+        }
+        with open(baseline_file, "w") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print(f"Updated import baseline '{baseline_file}'.")
+        return True
+
+    if failed:
+        print(
+            f"{iob_colors.FAIL}Import audit failed for {len(failed)} core(s): {', '.join(failed)}{iob_colors.ENDC}"
+        )
+        return False
+    print(
+        f"{iob_colors.OK}All {len(results)} cores within import budget.{iob_colors.ENDC}"
+    )
+    return True
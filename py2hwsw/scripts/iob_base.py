@@ -4,16 +4,18 @@
 
 import sys
 import os
-import shlex
+import re
 import argparse
 from dataclasses import dataclass
-import importlib
+import importlib.util
 import traceback
 from functools import wraps
 import inspect
 import shutil
+import logging
 
 import iob_colors
+from iob_log import get_logger
 
 
 class iob_base:
@@ -222,9 +224,9 @@ def fail_with_msg(msg, exception_type=Exception):
     raise exception_type(iob_colors.FAIL + msg + iob_colors.ENDC)
 
 
-def warn_with_msg(msg):
-    """Print a warning with a given message"""
-    print(iob_colors.WARNING + msg + iob_colors.ENDC)
+def warn_with_msg(msg, subsystem="elaborate"):
+    """Log a warning with a given message"""
+    get_logger(subsystem).warning(msg)
 
 
 #
@@ -242,7 +244,7 @@ def add_traceback_msg(msg):
     if not printed_traceback:
         printed_traceback = True
         traceback.print_exc()
-    print(iob_colors.FAIL + msg + iob_colors.ENDC)
+    get_logger("elaborate").error(msg)
 
 
 #
@@ -251,13 +253,58 @@ def add_traceback_msg(msg):
 debug_level = 0
 
 
-def debug(msg, level=0):
-    """Print a message if project debug_level >= level
-    :param str msg: message to print
+def debug(msg, level=0, subsystem="elaborate"):
+    """Log a message. Messages with level 0 are always shown, others only if the
+    project debug_level > 0.
+    Prefer the loggers of iob_log.get_logger(), that format messages lazily.
+    :param str msg: message to log
     :param int level: debug level
+    :param str subsystem: subsystem logger to use
     """
-    if debug_level >= level:
-        print(f"[Debug {level}]: " + msg)
+    get_logger(subsystem).log(logging.INFO if level == 0 else logging.DEBUG, msg)
+
+
+#
+# String tokenizer
+#
+
+# Token made of unquoted text, quoted text and escaped characters
+TOKEN_RE = re.compile(r"""(?:[^\s'"\\]+|"(?:[^"\\]|\\.)*"|'[^']*'|\\.)+""", re.S)
+# Parts of a token
+TOKEN_PART_RE = re.compile(r"""([^\s'"\\]+)|"((?:[^"\\]|\\.)*)"|'([^']*)'|\\(.)""", re.S)
+# Escaped characters inside double quotes
+DQUOTE_ESCAPE_RE = re.compile(r'\\([\\"])')
+WHITESPACE_RE = re.compile(r"\s*")
+
+
+def split_str(string: str) -> list:
+    """Split a string into tokens, like shlex.split(), but faster.
+    Supports single quotes, double quotes and backslash escapes (POSIX mode, no comments).
+    @param string: string to split
+    @return: list of tokens
+    """
+    tokens = []
+    pos = WHITESPACE_RE.match(string).end()
+    while pos < len(string):
+        match = TOKEN_RE.match(string, pos)
+        end = match.end() if match else pos
+        next_pos = WHITESPACE_RE.match(string, end).end()
+        if not match or (next_pos == end and end < len(string)):
+            raise ValueError("No closing quotation")
+        token = match.group()
+        # Fast path: token without quotes or escapes
+        if "'" not in token and '"' not in token and "\\" not in token:
+            tokens.append(token)
+        else:
+            parts = []
+            for unquoted, dquoted, squoted, escaped in TOKEN_PART_RE.findall(token):
+                if dquoted:
+                    parts.append(DQUOTE_ESCAPE_RE.sub(r"\1", dquoted))
+                else:
+                    parts.append(unquoted or squoted or escaped)
+            tokens.append("".join(parts))
+        pos = next_pos
+    return tokens
 
 
 #
@@ -379,7 +426,7 @@ def str_to_kwargs(attrs: list):
         The first element of the list must be the key of the parser
         The hyerarchy of the parsers is defined by the order of the elements in the list and the parser_dict
         """
-        args = ["main"] + shlex.split(string)
+        args = ["main"] + split_str(string)
         lists = []
         while args:
             key = args.pop(0)
@@ -445,19 +492,28 @@ def str_to_kwargs(attrs: list):
             return kwargs["main"][0]
         return kwargs
 
+    # Parsers are only created once, when the first string is given
+    parser_dict = {}
+
+    def parse_str(string: str) -> list:
+        """Convert a string into a list of keyword argument dictionaries (one per paragraph)"""
+        if not parser_dict:
+            parser_dict.update(create_parsers(attrs))
+        lines = [line.strip() for line in string.split("\n\n") if line.strip()]
+        return [organize_kwargs(parser_dict, line) for line in lines]
+
     def decorator(func):
         @wraps(func)
         def wrapper(core, *args, **kwargs):
             if len(args) == 1 and isinstance(args[0], str):
-                parser_dict = create_parsers(attrs)
-                lines = [line.strip() for line in args[0].split("\n\n") if line.strip()]
-                for line in lines:
-                    kwargs = organize_kwargs(parser_dict, line)
+                for kwargs in parse_str(args[0]):
                     func(core, **kwargs)
                 return None
             else:
                 return func(core, *args, **kwargs)
 
+        # Allow parsing strings without calling the decorated function
+        wrapper.parse_str = parse_str
         return wrapper
 
     return decorator
@@ -484,6 +540,24 @@ def find_file(search_directory, name_without_ext, filter_extensions=[]):
     return None
 
 
+def index_files(search_directory, filter_extensions=[]):
+    """Index files of a directory and subdirectories by name without extension.
+    Each name maps to the same file that find_file() would return.
+    param search_directory: directory to search
+    param filter_extensions: list of extensions to filter (example: [".py", ".tex"])
+    returns: dictionary with format {name_without_ext: path}
+    """
+    index = {}
+    for root, _, files in os.walk(search_directory):
+        for file in files:
+            file_name, file_ext = os.path.splitext(file)
+            if file_name not in index and (
+                filter_extensions == [] or file_ext in filter_extensions
+            ):
+                index[file_name] = os.path.join(root, file)
+    return index
+
+
 def hardcoded_find_file(name_without_ext, filter_extensions=[]):
     """Find a file in specific hardcoded directories
     param name_without_ext: name of the file without extension
@@ -6,8 +6,8 @@ from iob_base import (
     str_to_kwargs,
     fail_with_msg,
     add_traceback_msg,
-    debug,
 )
+from iob_log import get_logger
 
 
 attrs = [
@@ -17,6 +17,8 @@ attrs = [
     ["-c", "connect", {"nargs": "+"}, "pairs"],
     ["--no_autoaddr", "autoaddr", {"action": "store_false"}],
     ["--rw_overlap", "rw_overlap", {"action": "store_true"}],
+    ["--read_decoder", "read_decoder"],
+    ["--read_pipeline", "read_pipeline", {"action": "store_true"}],
     ["--no_instance", "instantiate", {"action": "store_false"}],
     ["--dest_dir", "dest_dir"],
     ["--csr_if", "csr_if"],
@@ -68,7 +70,9 @@ def create_block(
             and kwargs["dest_dir"] != "hardware/src"
         )
     ):
-        debug(f"Not setting up submodule '{core_name}' of '{core.name}' core!", 1)
+        get_logger("elaborate").debug(
+            "Not setting up submodule '%s' of '%s' core!", core_name, core.name
+        )
         return
 
     assert core_name, fail_with_msg("Missing core_name argument", ValueError)
@@ -7,6 +7,7 @@ import os
 import shutil
 import json
 import copy
+import hashlib
 from types import SimpleNamespace
 import pathlib
 
@@ -25,6 +26,8 @@ import snippet_gen
 import doc_gen
 import verilog_gen
 import ipxact_gen
+import dep_gen
+import elab_cache
 
 from py2hwsw_version import PY2HWSW_VERSION
 from iob_python_parameter import create_python_parameter_group
@@ -34,20 +37,23 @@ from iob_instance import iob_instance
 from iob_base import (
     fail_with_msg,
     find_file,
+    index_files,
     import_python_module,
     nix_permission_hack,
     add_traceback_msg,
-    debug,
     get_lib_cores,
     find_folder_by_name
 )
 from iob_license import iob_license, update_license
+from iob_log import get_logger
 import sw_tools
 import verilog_format
 import verilog_lint
 from manage_headers import generate_headers
 import fusesoc
 
+log = get_logger("generate")
+
 
 class iob_core(iob_module, iob_instance):
     """Generic class to describe how to generate a base IOb IP core"""
@@ -66,6 +72,14 @@ class iob_core(iob_module, iob_instance):
     global_clang_format_rules_filepath: str = None
     # List of callbacks to run at post setup stage
     global_post_setup_callbacks: list = []
+    # Boards to setup (given by `--board`). Empty list sets up every board in board_list.
+    global_board_filter: list = []
+    # Command used to setup the build directory. Allows setting up other boards on demand.
+    global_setup_cmd: str = ""
+    # Fingerprints of the modules generated in the current build directory
+    global_generated_modules: set = set()
+    # Number of duplicate module generations skipped in the current build directory
+    global_skipped_generations: int = 0
 
     def __init__(self, *args, **kwargs):
         """Build a core (includes module and instance attributes)
@@ -345,8 +359,15 @@ class iob_core(iob_module, iob_instance):
         # Lint and format sources
         if self.is_top_module:
             self.lint_and_format()
-        print(
-            f"{iob_colors.INFO}Setup of '{self.original_name}' core successful. Generated build directory: '{self.build_dir}'.{iob_colors.ENDC}"
+        if self.is_top_module and __class__.global_skipped_generations:
+            log.info(
+                f"{iob_colors.INFO}Skipped %d duplicate generations of modules already generated.{iob_colors.ENDC}",
+                __class__.global_skipped_generations,
+            )
+        log.info(
+            f"{iob_colors.INFO}Setup of '%s' core successful. Generated build directory: '%s'.{iob_colors.ENDC}",
+            self.original_name,
+            self.build_dir,
         )
         # Add license headers to every file in build dir
         custom_header = f"Py2HWSW Version {PY2HWSW_VERSION} has generated this code (https://github.com/IObundle/py2hwsw)."
@@ -362,6 +383,9 @@ class iob_core(iob_module, iob_instance):
             skip_existing_headers=True,
             verbose=False,
         )
+        # Generate dependency files listing the inputs of this setup
+        if self.is_top_module:
+            dep_gen.generate_depfiles(self, __class__.global_project_root)
 
     def create_python_parameter_group(self, *args, **kwargs):
         create_python_parameter_group(self, *args, **kwargs)
@@ -443,7 +467,63 @@ class iob_core(iob_module, iob_instance):
             self.parent_obj.copy_files_current_and_parent_setup_dir()
         setup_srcs.copy_rename_setup_directory(self)
 
+    def get_module_fingerprint(self):
+        """Fingerprint of the resolved module description of this core.
+        Instances with the same fingerprint generate the same files.
+        returns: Fingerprint string, or None if the description contains objects
+        """
+        instance_keys = ["instance_name", "instance_description"]
+        py_params_keys = instance_keys + [
+            "attributes",
+            "issuer",
+            "connect",
+            "parameters",
+        ]
+        description = [
+            self.name,
+            self.build_dir,
+            self.dest_dir,
+            self.setup_dir,
+            self.generate_hw,
+            {k: v for k, v in self.attributes_dict.items() if k not in instance_keys},
+            {
+                k: v
+                for k, v in self.received_python_parameters.items()
+                if k not in py_params_keys
+            },
+        ]
+        try:
+            return hashlib.sha256(
+                json.dumps(description, sort_keys=True).encode()
+            ).hexdigest()
+        except (TypeError, ValueError):
+            return None
+
     def generate_build_dir(self, **kwargs):
+        if self.is_top_module:
+            __class__.global_generated_modules = set()
+            __class__.global_skipped_generations = 0
+        elif not (self.is_tester or self.is_superblock):
+            # Generate each unique module only once per build directory
+            fingerprint = self.get_module_fingerprint()
+            if fingerprint in __class__.global_generated_modules:
+                __class__.global_skipped_generations += 1
+                log.debug(
+                    "Skipping generation of '%s' instance. Module '%s' already generated.",
+                    self.instance_name,
+                    self.name,
+                )
+                return
+            if fingerprint:
+                __class__.global_generated_modules.add(fingerprint)
+
+        # Lib leaf cores may reuse the files generated by an identical core
+        if elab_cache.restore_build_files(self, __class__.global_board_filter):
+            return
+        with elab_cache.record_build_files(self, __class__.global_board_filter):
+            self.__generate_build_dir(**kwargs)
+
+    def __generate_build_dir(self, **kwargs):
 
         if self.is_top_module or self.is_tester:
             self.__create_build_dir()
@@ -477,6 +557,12 @@ class iob_core(iob_module, iob_instance):
         # Generate config_build.mk
         if self.is_top_module or self.is_tester:
             config_gen.config_build_mk(self, __class__.global_top_module)
+            if __class__.global_board_filter and self.board_list:
+                config_gen.board_setup_config_build_mk(
+                    self.get_setup_boards(),
+                    __class__.global_setup_cmd,
+                    self.build_dir,
+                )
 
         # Generate configuration files
         config_gen.generate_confs(self)
@@ -557,7 +643,9 @@ class iob_core(iob_module, iob_instance):
                 # Find object and override it
                 for idx, obj in enumerate(parent_attributes[child_attribute_name]):
                     if obj[identifier] == child_obj[identifier]:
-                        debug(f"Overriding {child_obj[identifier]}", 1)
+                        get_logger("elaborate").debug(
+                            "Overriding %s", child_obj[identifier]
+                        )
                         parent_attributes[child_attribute_name][idx] = child_obj
                         break
                 else:
@@ -602,6 +690,15 @@ class iob_core(iob_module, iob_instance):
                     and portmap.e_connect
                 ):
                     port_width = portmap.port.interface.addr_w
+                    wire_width = getattr(portmap.e_connect.interface, "addr_w", None)
+                    if (
+                        isinstance(port_width, int)
+                        and isinstance(wire_width, int)
+                        and port_width > wire_width
+                    ):
+                        fail_with_msg(
+                            f"Cbus port of '{subblock.instance_name}' has {port_width} address bits, but only {wire_width} bits were allocated in the memory map!"
+                        )
                     external_wire_prefix = portmap.e_connect.interface.prefix
                     portmap.e_connect_bit_slices = [
                         f"{external_wire_prefix}iob_addr[{port_width}-1:0]"
@@ -627,11 +724,26 @@ class iob_core(iob_module, iob_instance):
         os.makedirs(f"{self.build_dir}/document", exist_ok=True)
         os.makedirs(f"{self.build_dir}/document/tsrc", exist_ok=True)
 
+        dep_gen.add_input_file(f"{setup_srcs.get_lib_dir()}/build.mk")
         shutil.copyfile(
             f"{setup_srcs.get_lib_dir()}/build.mk", f"{self.build_dir}/Makefile"
         )
         nix_permission_hack(f"{self.build_dir}/Makefile")
 
+    @staticmethod
+    def filter_boards(board_list):
+        """Select boards to setup from the given list, based on the global board filter.
+        :param list board_list: list of board names
+        :returns list: boards of board_list present in the filter (all if filter is empty)
+        """
+        if not __class__.global_board_filter:
+            return board_list
+        return [b for b in board_list if b in __class__.global_board_filter]
+
+    def get_setup_boards(self):
+        """Get boards of this core's board_list to setup"""
+        return __class__.filter_boards(self.board_list)
+
     def _remove_duplicate_sources(self, subfolders: dict = {}):
         """Remove duplicate sources in the build directory from subfolders.
         Args:
@@ -655,7 +767,7 @@ class iob_core(iob_module, iob_instance):
         if "hardware/fpga/src" in subfolders and not subfolders["hardware/fpga/src"]:
             # Find board directories in build_dir
             build_dir_fpga = os.path.join(self.build_dir, "hardware/fpga")
-            for board in self.board_list:
+            for board in self.get_setup_boards():
                 board_folder = find_folder_by_name(build_dir_fpga, board)
                 if not board_folder:
                     fail_with_msg(f"Board folder '{board}' not found inside '{build_dir_fpga}'.", ValueError)
@@ -914,19 +1026,25 @@ class iob_core(iob_module, iob_instance):
         the value of the `global_special_target` attribute.
         """
         core_dir, file_ext = find_module_setup_dir(core_name)
+        dep_gen.add_input_file(os.path.join(core_dir, f"{core_name}{file_ext}"))
 
         if file_ext == ".py":
-            import_python_module(
-                os.path.join(core_dir, f"{core_name}.py"),
-            )
-            core_module = sys.modules[core_name]
+            core_file = os.path.join(core_dir, f"{core_name}.py")
+
+            def core_setup(py_params_dict):
+                import_python_module(core_file)
+                return sys.modules[core_name].setup(py_params_dict)
+
             issuer = kwargs.pop("issuer", None)
             top_module = __class__.global_top_module.original_name if __class__.global_top_module else core_name
             # Call `setup(<py_params_dict>)` function of `<core_name>.py` to
             # obtain the core's py2hwsw dictionary.
             # Give it a dictionary with all arguments of this function, since the user
             # may want to use any of them to manipulate the core attributes.
-            core_dict = core_module.setup(
+            # Lib cores may reuse the dictionary from the elaboration cache.
+            core_dict, elab_cache_key = elab_cache.setup(
+                core_name,
+                core_file,
                 {
                     # "core_name": core_name,
                     "build_dir": __class__.global_build_dir,
@@ -935,7 +1053,8 @@ class iob_core(iob_module, iob_instance):
                     "py2hwsw_version": PY2HWSW_VERSION,
                     "top_module": top_module,
                     **kwargs,
-                }
+                },
+                core_setup,
             )
             py2_core_dict = {
                 "original_name": core_name,
@@ -950,6 +1069,7 @@ class iob_core(iob_module, iob_instance):
                 # the py2_core_dict
                 **kwargs,
             )
+            elab_cache.tag_core(instance, elab_cache_key)
         elif file_ext == ".json":
             instance = __class__.read_py2hw_json(
                 os.path.join(core_dir, f"{core_name}.json"),
@@ -1048,19 +1168,38 @@ def find_common_deep(path1, path2):
     )
 
 
+# Python/JSON setup files of each search directory. Format: {directory: {core_name: path}}
+_setup_file_indexes = {}
+
+
+def _get_setup_file_index(search_dir):
+    if search_dir not in _setup_file_indexes:
+        _setup_file_indexes[search_dir] = index_files(search_dir, [".py", ".json"])
+    return _setup_file_indexes[search_dir]
+
+
 def find_module_setup_dir(core_name):
     """Searches for a core's setup directory
     param core_name: The core_name object
     returns: The path to the setup directory
     returns: The file extension
     """
-    file_path = find_file(
-        iob_core.global_project_root, core_name, [".py", ".json"]
-    ) or find_file(
+    search_dirs = [
+        iob_core.global_project_root,
         os.path.join(os.path.dirname(__file__), ".."),
-        core_name,
-        [".py", ".json"],
-    )
+    ]
+    # Walk each search directory only once per process. Files created afterwards
+    # are still found by find_file().
+    file_path = None
+    for search_dir in search_dirs:
+        file_path = _get_setup_file_index(search_dir).get(core_name)
+        if file_path:
+            break
+    else:
+        for search_dir in search_dirs:
+            file_path = find_file(search_dir, core_name, [".py", ".json"])
+            if file_path:
+                break
     if not file_path:
         fail_with_msg(
             f"Python/JSON setup file of '{core_name}' core not found under path '{iob_core.global_project_root}'!",
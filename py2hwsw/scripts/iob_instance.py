@@ -10,8 +10,8 @@ from iob_base import (
     iob_base,
     find_obj_in_list,
     fail_with_msg,
-    debug,
 )
+from iob_log import get_logger
 from iob_portmap import iob_portmap, get_portmap_port
 from iob_signal import remove_signal_direction_suffixes
 
@@ -142,8 +142,8 @@ class iob_instance(iob_base):
                     issuer.ports, wire_name
                 )
                 if not wire:
-                    debug(
-                        f"Creating implicit wire '{port.name}' in '{issuer.name}'.", 1
+                    get_logger("elaborate").debug(
+                        "Creating implicit wire '%s' in '%s'.", port.name, issuer.name
                     )
                     # Add wire to issuer
                     wire_signals = remove_signal_direction_suffixes(port.signals)
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+#
+# Logging of the py2hwsw setup process.
+#
+# Each subsystem has its own logger, child of the 'py2hwsw' logger:
+#   resolve:   search and import of core setup files, elaboration cache
+#   elaborate: creation of core objects from the py2hwsw dictionaries
+#   generate:  generation of the build directory files
+#   copy:      copy of files from setup directories and from the library
+#   lint:      Verilog linters
+#   format:    Verilog, C and python formatters
+#
+# Messages are formatted lazily, so the arguments of disabled messages are never
+# converted to strings:
+#   log = get_logger("generate")
+#   log.debug("Generating '%s' in '%s'", core.name, core.build_dir)
+# Expensive arguments should be guarded by `log.isEnabledFor(logging.DEBUG)`.
+#
+# By default, the console shows INFO messages and above. The `--debug_level`
+# option of py2hwsw also enables DEBUG messages. The `--log_json` option (or the
+# PY2HWSW_LOG_JSON environment variable) also writes every message, including
+# DEBUG messages, to a JSON lines file, for CI.
+#
+
+import re
+import sys
+import json
+import logging
+
+import iob_colors
+
+ROOT_LOGGER = "py2hwsw"
+SUBSYSTEMS = ["resolve", "elaborate", "generate", "copy", "lint", "format"]
+
+# Matches ANSI color codes (stripped from JSON messages)
+ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+
+def get_logger(subsystem):
+    """Return logger of a py2hwsw subsystem
+    param subsystem: One of SUBSYSTEMS
+    """
+    assert subsystem in SUBSYSTEMS, f"Invalid log subsystem '{subsystem}'"
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def _subsystem(record):
+    return record.name.split(".", 1)[-1]
+
+
+class _console_formatter(logging.Formatter):
+    """Plain messages, as printed by previous py2hwsw versions"""
+
+    def format(self, record):
+        msg = record.getMessage()
+        if record.exc_info:
+            msg += "\n" + self.formatException(record.exc_info)
+        if record.levelno >= logging.ERROR:
+            return iob_colors.FAIL + msg + iob_colors.ENDC
+        if record.levelno >= logging.WARNING:
+            return iob_colors.WARNING + msg + iob_colors.ENDC
+        if record.levelno <= logging.DEBUG:
+            return f"[Debug {_subsystem(record)}]: {msg}"
+        return msg
+
+
+class _json_formatter(logging.Formatter):
+    """One JSON object per message"""
+
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 6),
+            "level": record.levelname.lower(),
+            "subsystem": _subsystem(record),
+            "message": ANSI_RE.sub("", record.getMessage()),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class _stdout_handler(logging.StreamHandler):
+    """Writes to the current sys.stdout (that may be replaced after creation)"""
+
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
+
+
+def configure(debug_level=0, json_file=None):
+    """Configure handlers of py2hwsw loggers
+    param debug_level: 0 shows INFO messages and above, >0 also shows DEBUG messages
+    param json_file: Path of JSON lines file to also write messages to (including
+                     DEBUG messages)
+    """
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    console_level = logging.DEBUG if debug_level > 0 else logging.INFO
+    # Debug messages are only formatted if some handler shows them
+    logger.setLevel(logging.DEBUG if json_file else console_level)
+    logger.propagate = False
+
+    console = _stdout_handler()
+    console.setLevel(console_level)
+    console.setFormatter(_console_formatter())
+    logger.addHandler(console)
+
+    if json_file:
+        sink = logging.FileHandler(json_file, mode="w")
+        sink.setFormatter(_json_formatter())
+        logger.addHandler(sink)
+
+
+# Console output by default, for users of py2hwsw modules that don't call configure()
+configure()
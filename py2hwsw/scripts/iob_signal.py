@@ -65,10 +65,15 @@ class iob_signal:
         width_str = "" if self.get_width_int() == 1 else f"[{self.width}-1:0] "
         return f"{self.direction}{port_type} {width_str}{self.name}{comma_char}\n"
 
-    def get_width_int(self):
+    def get_width_int(self, param_context=None):
+        """Return width as int. If width depends on parameters, evaluate it with the
+        given param_context (using their maximum values), or return it as is.
+        """
         try:
             return int(self.width)
         except ValueError:
+            if param_context:
+                return param_context.width(self.width)
             return self.width
 
 
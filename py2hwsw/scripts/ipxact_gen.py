@@ -10,6 +10,7 @@ import re
 import os
 import sys
 from iob_signal import iob_signal
+from param_context import get_param_context
 
 sys.path.append(
     os.path.join(os.path.dirname(os.path.abspath(__file__)), "../lib/hardware/iob_csrs")
@@ -149,7 +150,7 @@ class SwRegister:
         rst_val,
         volatile,
         description,
-        parameters_list,
+        param_context,
         fields,
     ):
         self.name = name
@@ -160,22 +161,8 @@ class SwRegister:
 
         self.hw_size = hw_size
 
-        max_size = hw_size
-        # if the max_size is a string, it has params, retrieve it's maximum value
-        if isinstance(max_size, str):
-            # transform the string into a mathemathical expression and retrieve the maximum value
-            max_size = max_size.replace(" ", "")
-            while True:
-                for param in parameters_list:
-                    # only replace complete words
-                    max_size = re.sub(
-                        r"\b" + param.name + r"\b", str(param.max_value), max_size
-                    )
-
-                # if the string only contains numbers or operators, evaluate it and break the loop
-                if re.match(r"^[0-9\+\-\*\/\(\)]+$", max_size):
-                    max_size = eval(max_size)
-                    break
+        # if the hw_size is a string, it has params, retrieve it's maximum value
+        max_size = param_context.eval(hw_size, "max")
 
         # Compute the size of the register in steps of 8 bits, rounding up
         sw_size = 8 * math.ceil(max_size / 8)
@@ -461,8 +448,7 @@ def gen_bus_interface_xml_file(bus_interface, dest_dir):
     with open(
         f"{dest_dir}/interface_{bus_details['name']}.{bus_details['version']}.xml", "w"
     ) as f:
-        f.write(
-            f"""\
+        f.write(f"""\
 <?xml version="1.0" encoding="UTF-8"?>
 <ipxact:busDefinition xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:ipxact="http://www.accellera.org/XMLSchema/IPXACT/1685-2022" xmlns:kactus2="http://kactus2.cs.tut.fi" xsi:schemaLocation="http://www.accellera.org/XMLSchema/IPXACT/1685-2022 http://www.accellera.org/XMLSchema/IPXACT/1685-2022/index.xsd">
 	<ipxact:vendor>{bus_details["vendor"]}</ipxact:vendor>
@@ -477,8 +463,7 @@ def gen_bus_interface_xml_file(bus_interface, dest_dir):
 		<kactus2:version>3,13,308,0</kactus2:version>
 	</ipxact:vendorExtensions>
 </ipxact:busDefinition>
-"""
-        )
+""")
 
 
 #    # Create the Abstraction Definition file for the interface
@@ -498,12 +483,12 @@ def gen_bus_interface_xml_file(bus_interface, dest_dir):
 # """)
 
 
-def gen_memory_map_xml(sw_regs, parameters_list):
+def gen_memory_map_xml(sw_regs, parameters_list, param_context):
     """
     Generate the memory map xml code
-    @param core: core object
     @param sw_regs: list of software registers
     @param parameters_list: list of parameters objects
+    @param param_context: evaluation context of the core's confs
     return: xml code
     """
 
@@ -520,7 +505,7 @@ def gen_memory_map_xml(sw_regs, parameters_list):
             sw_reg.rst_val,
             sw_reg.volatile,
             sw_reg.descr,
-            parameters_list,
+            param_context,
             sw_reg.fields,
         )
 
@@ -735,7 +720,9 @@ def generate_ipxact_xml(core, dest_dir):
     memory_map_xml = ""
     if csr_block:
         sw_regs = static_reg_tables[csr_block.name]
-        memory_map_xml = gen_memory_map_xml(sw_regs, parameters_list)
+        memory_map_xml = gen_memory_map_xml(
+            sw_regs, parameters_list, get_param_context(core)
+        )
 
     # Generate instantiations xml code
     instantiations_xml = gen_instantiations_xml(core, parameters_list)
@@ -12,8 +12,11 @@ import os
 def print_usage():
     usage_str = """
 Usage: ./makehex.py [--split] 1st_File 2nd_File 2nd_File_addr ... Firmware_Size output_file_name
+       ./makehex.py [--split] --config Config_File Firmware_Size output_file_name
 The first file is the main file and its address is 0.
 --split: Generate a separate hex file for each byte of memory words.
+--config: Read files and their hexadecimal addresses from Config_File, one
+          "File addr" pair per line (like the "<soc_name>_mem.config" files).
 """
     print(usage_str, file=sys.stderr)
 
@@ -38,6 +41,20 @@ def write_split_files(lines, output_file):
             f0.write(line[6:8] + "\n")
 
 
+def read_config(config_file):
+    """Read list of files and their addresses from memory config file"""
+    binfile = []
+    binaddr = []
+    with open(config_file, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            name, addr = line.split()
+            binfile.append(name)
+            binaddr.append(int(addr, 16))
+    return binfile, binaddr
+
+
 def main():
     split_words = False
     if "--split" in argv:
@@ -47,21 +64,27 @@ def main():
     output_file = argv[-1]
     argv.remove(output_file)
 
-    if len(argv) % 2 != 1:
-        print(f"Error: number of arguments must be odd. Got {len(argv)} arguments")
-        print_usage()
-        exit(1)
-    nFiles = int((len(argv) - 3) / 2) + 1
-    mem_size = 2 ** (int(argv[-1]))
-    binfile = [argv[1]]
-    binaddr = [0]
+    if "--config" in argv:
+        idx = argv.index("--config")
+        binfile, binaddr = read_config(argv[idx + 1])
+        mem_size = 2 ** (int(argv[-1]))
+        nFiles = len(binfile)
+    else:
+        if len(argv) % 2 != 1:
+            print(f"Error: number of arguments must be odd. Got {len(argv)} arguments")
+            print_usage()
+            exit(1)
+        nFiles = int((len(argv) - 3) / 2) + 1
+        mem_size = 2 ** (int(argv[-1]))
+        binfile = [argv[1]]
+        binaddr = [0]
+
+        for i in range(nFiles - 1):
+            binfile.append(argv[(i + 1) * 2])
+            binaddr.append(int(argv[(i + 1) * 2 + 1], 16))
     bindata = []
     aux = []
 
-    for i in range(nFiles - 1):
-        binfile.append(argv[(i + 1) * 2])
-        binaddr.append(int(argv[(i + 1) * 2 + 1], 16))
-
     for i in range(nFiles):
         with open(binfile[i], "rb") as f:
             bindata.append(f.read())
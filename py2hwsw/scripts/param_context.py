@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+#
+# Evaluation context of parameter-dependent expressions (widths, sizes, ...).
+# Built from the confs of a core, it resolves each conf lazily, once, after the
+# confs it depends on, and memoises the value of every expression evaluated.
+#
+
+import re
+from collections.abc import Mapping
+from math import ceil, log2
+
+from iob_base import fail_with_msg
+
+# Splits expression in identifiers and the rest (operators, numbers, spaces)
+TOKEN_RE = re.compile(r"([^\w_])")
+
+# Verilog functions/macros replaced by their python equivalents
+VERILOG_FUNCTIONS = {
+    "$clog2": "clog2",
+    "iob_max": "max",
+    "iob_min": "min",
+}
+
+ATTRIBUTES = ["val", "min", "max"]
+
+
+def clog2(val):
+    """Used by evaluated expressions"""
+    return ceil(log2(val))
+
+
+# Functions available to evaluated expressions
+EVAL_GLOBALS = {
+    "__builtins__": {},
+    "clog2": clog2,
+    "ceil": ceil,
+    "log2": log2,
+    "max": max,
+    "min": min,
+    "int": int,
+    "abs": abs,
+}
+
+
+def _flatten_confs(confs):
+    """Return list of confs, given a list of confs or conf groups (objects or dicts)"""
+    flat = []
+    for conf in confs or []:
+        group_confs = (
+            conf.get("confs")
+            if isinstance(conf, dict)
+            else getattr(conf, "confs", None)
+        )
+        if group_confs is not None:
+            flat += _flatten_confs(group_confs)
+        else:
+            flat.append(conf)
+    return flat
+
+
+def _conf_attr(conf, name, default=None):
+    if isinstance(conf, dict):
+        return conf.get(name, default)
+    return getattr(conf, name, default)
+
+
+class _param_view(Mapping):
+    """Read-only {conf name: resolved value} view for one attribute"""
+
+    def __init__(self, context, attribute):
+        self._context = context
+        self._attribute = attribute
+
+    def __getitem__(self, name):
+        if name not in self._context.confs:
+            raise KeyError(name)
+        return self._context.resolve(name, self._attribute)
+
+    def __iter__(self):
+        return iter(self._context.confs)
+
+    def __len__(self):
+        return len(self._context.confs)
+
+
+class param_context:
+    """Lazily evaluated, memoised values of a core's confs.
+    P and D confs are resolved with the requested attribute ('val', 'min' or 'max');
+    M and C confs always use 'val'.
+    """
+
+    def __init__(self, confs):
+        """
+        param confs: list of confs or conf groups (iob_conf objects or dictionaries)
+        """
+        self.confs = {_conf_attr(c, "name"): c for c in _flatten_confs(confs)}
+        # Format: {(name, attribute): value}
+        self._values = {}
+        # Format: {(expression, attribute): value}
+        self._expressions = {}
+        # Confs being resolved (for cycle detection)
+        self._resolving = []
+
+        self.val = _param_view(self, "val")
+        self.min = _param_view(self, "min")
+        self.max = _param_view(self, "max")
+
+    def _get_value(self, name, attribute):
+        """Return unevaluated value of conf for the given attribute"""
+        conf = self.confs[name]
+        if _conf_attr(conf, "type", "P") not in ["P", "D"]:
+            attribute = "val"
+        return _conf_attr(conf, attribute)
+
+    def resolve(self, name, attribute="val"):
+        """Return value of conf, evaluating the confs it depends on first.
+        param name: conf name
+        param attribute: 'val', 'min' or 'max'
+        returns: numeric value, or original value if it can not be evaluated
+        """
+        assert attribute in ATTRIBUTES, f"Invalid conf attribute '{attribute}'"
+        key = (name, attribute)
+        if key in self._values:
+            return self._values[key]
+        if key in self._resolving:
+            cycle = [n for n, _ in self._resolving[self._resolving.index(key) :]]
+            fail_with_msg(
+                f"Circular dependency between confs: {' -> '.join(cycle + [name])}"
+            )
+        self._resolving.append(key)
+        value = self._get_value(name, attribute)
+        try:
+            if isinstance(value, str) and value not in ["", "NA"]:
+                result = self.eval(value, attribute, strict=False)
+            else:
+                result = value
+        finally:
+            self._resolving.pop()
+        self._values[key] = result
+        return result
+
+    def _substitute(self, expression, attribute):
+        """Replace confs in expression by their resolved values"""
+        tokens = TOKEN_RE.split(expression)
+        for idx, token in enumerate(tokens):
+            if token not in self.confs:
+                continue
+            value = self.resolve(token, attribute)
+            tokens[idx] = (
+                f"({value})" if isinstance(value, (int, float)) else str(value)
+            )
+            # Remove '`' char if it was a macro
+            if idx > 0 and tokens[idx - 1] == "`":
+                tokens[idx - 1] = ""
+        expression = "".join(tokens)
+        for verilog_func, python_func in VERILOG_FUNCTIONS.items():
+            expression = expression.replace(verilog_func, python_func)
+        return expression
+
+    def eval(self, expression, attribute="val", strict=True):
+        """Evaluate mathematical expression with confs.
+        param expression: int or string with a math expression that may contain confs
+        param attribute: conf attribute used for P and D confs: 'val', 'min' or 'max'
+        param strict: if True, fail if the expression is not numeric. Otherwise, return
+                      the expression as is.
+        returns: numeric value of expression
+        """
+        if type(expression) is not str:
+            return expression
+        key = (expression, attribute)
+        if key not in self._expressions:
+            substituted = self._substitute(expression, attribute)
+            try:
+                result = eval(substituted, EVAL_GLOBALS)
+            except Exception:
+                result = None
+            self._expressions[key] = (
+                result if isinstance(result, (int, float)) else None
+            )
+        result = self._expressions[key]
+        if result is None:
+            if strict:
+                fail_with_msg(
+                    f"String '{expression}' evaluated to '{self._substitute(expression, attribute)}' is not a numeric expression."
+                )
+            return expression
+        return result
+
+    def width(self, width, attribute="max"):
+        """Return width as an int, evaluating it if it depends on confs.
+        Returns the width as is if it can not be evaluated.
+        """
+        try:
+            return int(width)
+        except (ValueError, TypeError):
+            return self.eval(width, attribute, strict=False)
+
+
+def get_param_context(core):
+    """Return (and create, on first call) the evaluation context of a core.
+    Should only be called once the core's confs are final.
+    param core: core object or dictionary with a 'confs' list
+    """
+    if isinstance(core, dict):
+        return param_context(core.get("confs", []))
+    context = core.__dict__.get("_param_context")
+    if context is None:
+        context = param_context(getattr(core, "confs", []))
+        core.__dict__["_param_context"] = context
+    return context
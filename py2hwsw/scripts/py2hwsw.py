@@ -6,11 +6,14 @@
 
 import sys
 import os
+import shlex
 import argparse
 
 import iob_base
 from iob_base import list_dir, copy_dir, cat_file
 from iob_core import iob_core
+import elab_cache
+import iob_log
 
 from py2hwsw_version import PY2HWSW_VERSION
 
@@ -65,6 +68,14 @@ if __name__ == "__main__":
         "Format: param1=value1:param2=value2:...",
     )
 
+    parser.add_argument(
+        "--board",
+        dest="boards",
+        action="append",
+        default=[],
+        metavar="<board_name>",
+        help="Only setup FPGA flow of the given board (may be given multiple times). Other boards are set up on demand by the fpga makefile. May also be given as python parameter 'board' (comma-separated list).",
+    )
     parser.add_argument(
         "--no_verilog_format",
         dest="verilog_format",
@@ -90,6 +101,13 @@ if __name__ == "__main__":
         default=0,
         help="Set the debug level (default: 0)",
     )
+    parser.add_argument(
+        "--log_json",
+        dest="log_json",
+        type=str,
+        default=os.environ.get("PY2HWSW_LOG_JSON"),
+        help="Also write setup log messages to given JSON lines file (default: $PY2HWSW_LOG_JSON).",
+    )
     parser.add_argument(
         "-v",
         "--version",
@@ -114,6 +132,61 @@ if __name__ == "__main__":
         action="store_true",
         help="Print cores provided by Py2HWSW's library",
     )
+    parser.add_argument(
+        "--audit_imports",
+        dest="audit_imports",
+        nargs="?",
+        const="check",
+        choices=["check", "update"],
+        help="Audit import time of lib core modules against the import baseline. Use 'update' to rewrite the baseline.",
+    )
+    parser.add_argument(
+        "--clean_all",
+        dest="clean_all",
+        nargs="?",
+        const=".",
+        metavar="ROOT",
+        help="Remove every py2hwsw build directory inside ROOT (default: current directory), without elaborating cores.",
+    )
+    parser.add_argument(
+        "--clean_core",
+        dest="clean_cores",
+        action="append",
+        default=[],
+        help="Only remove build directories of this core with `--clean_all` (may be given multiple times).",
+    )
+    parser.add_argument(
+        "--clean_depth",
+        dest="clean_depth",
+        type=int,
+        help="Only search build directories up to this depth below ROOT with `--clean_all` (default: any depth).",
+    )
+    parser.add_argument(
+        "--fast",
+        dest="fast",
+        action="store_true",
+        help="Clean target: find the build directory by its marker file and remove it, without elaborating the core or running `make clean`.",
+    )
+    parser.add_argument(
+        "--no_elab_cache",
+        dest="elab_cache",
+        action="store_false",
+        help="Do not reuse (or store) elaborated lib cores from the elaboration cache",
+    )
+    parser.add_argument(
+        "--elab_cache_dir",
+        dest="elab_cache_dir",
+        type=str,
+        default=elab_cache.cache_dir,
+        help=f"Elaboration cache directory (default: {elab_cache.cache_dir}). Can also be set with the PY2HWSW_CACHE_DIR environment variable.",
+    )
+    parser.add_argument(
+        "--elab_cache_size",
+        dest="elab_cache_size",
+        type=int,
+        default=elab_cache.max_size,
+        help=f"Maximum size of the elaboration cache in MiB (default: {elab_cache.max_size}). Least recently used entries are removed.",
+    )
     parser.add_argument(
         "--browse",
         dest="browse_lib",
@@ -160,6 +233,10 @@ if __name__ == "__main__":
     iob_core.global_project_vlint = args.verilog_lint
     iob_core.global_clang_format_rules_filepath = args.clang_rules
     iob_base.debug_level = args.debug_level
+    iob_log.configure(args.debug_level, args.log_json)
+    elab_cache.enabled = args.elab_cache
+    elab_cache.cache_dir = args.elab_cache_dir
+    elab_cache.max_size = args.elab_cache_size
 
     if args.py2hwsw_docs:
         iob_core.setup_py2_docs(PY2HWSW_VERSION)
@@ -173,6 +250,19 @@ if __name__ == "__main__":
     elif args.browse_lib:
         iob_core.browse_lib()
         exit(0)
+    elif args.audit_imports:
+        import import_audit
+
+        exit(0 if import_audit.audit_imports(args.audit_imports) else 1)
+    elif args.clean_all:
+        import clean_build
+
+        clean_build.remove_build_dirs(
+            clean_build.find_build_dirs(
+                args.clean_all, args.clean_cores, args.clean_depth
+            )
+        )
+        exit(0)
 
     # Browse/Copy/Manage py2hwsw files
     # https://github.com/IObundle/iob-soc/pull/975#discussion_r1843025005
@@ -203,9 +293,35 @@ if __name__ == "__main__":
             k, v = param.split("=")
             py_params[k] = v
 
+    # Boards to setup, given by `--board` or by the `board` python parameter
+    iob_core.global_board_filter = args.boards + [
+        b for b in py_params.get("board", "").split(",") if b
+    ]
+    if iob_core.global_board_filter:
+        # Command to setup this build dir again, without board options
+        argv = []
+        skip_next = False
+        for arg in sys.argv[1:]:
+            if skip_next:
+                skip_next = False
+            elif arg == "--board":
+                skip_next = True
+            elif not arg.startswith("--board="):
+                argv.append(arg)
+        iob_core.global_setup_cmd = f"cd {shlex.quote(os.getcwd())} && " + shlex.join(
+            [sys.executable, os.path.realpath(__file__)] + argv
+        )
+
     if args.target == "setup":
         instance = iob_core.get_core_obj(args.core_name, **py_params)
         instance.generate_build_dir()
+        elab_cache.finish()
+    elif args.target == "clean" and args.fast:
+        import clean_build
+
+        clean_build.remove_build_dirs(
+            clean_build.find_core_build_dirs(args.core_name, args.build_dir)
+        )
     elif args.target == "clean":
         iob_core.clean_build_dir(args.core_name)
     elif args.target == "print_build_dir":
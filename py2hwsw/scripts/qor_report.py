@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+#
+# qor_report.py: parse EDA tool reports and keep a Quality of Results (QoR) history
+#
+# Each report is read once, line by line, with precompiled regular expressions.
+# The metrics found (LUT/FF/DSP/BRAM, area, slack, Fmax, ...) are:
+# - appended to a QoR history (JSON lines or SQLite database), keyed by core, version
+#   and board;
+# - rendered as the .tex tables included by the document flow (vivado.tex,
+#   quartus.tex and asic.tex).
+#
+# Usage:
+#   ./qor_report.py vivado <vivado.log> [--tex vivado.tex]
+#   ./qor_report.py quartus <quartus.log> [--tex quartus.tex]
+#   ./qor_report.py genus <gates.rpt> <timing.rpt> [--tex asic.tex]
+#   ./qor_report.py yosys <yosys.log>
+# Options: --core <name> --version <version> --board <board> --db <history_file>
+#          --no_db --print
+#
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+
+# Default QoR history file. Files ending in SQLITE_EXTENSIONS use SQLite, others
+# use JSON lines.
+DEFAULT_DB = "qor_history.jsonl"
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+# Metrics stored in dedicated columns of the SQLite database
+DB_METRICS = ["lut", "ff", "dsp", "bram", "alm", "cells", "area", "slack", "fmax"]
+
+#
+# Vivado (utilization and timing summary in vivado.log)
+#
+VIVADO_RES = {
+    "lut": re.compile(r"LUTs\s*\|\s*(\d+)"),
+    "ff": re.compile(r"Registers\s*\|\s*(\d+)"),
+    "dsp": re.compile(r"DSPs\s*\|\s*(\d+)"),
+    "bram": re.compile(r"Block RAM Tile\s*\|\s*([\d.]+)"),
+    "pin": re.compile(r"Bonded IOB\s*\|\s*(\d+)"),
+}
+VIVADO_WNS_HEADER_RE = re.compile(r"^\s*WNS\(ns\)")
+VIVADO_CLOCK_HEADER_RE = re.compile(r"^\s*Clock\s+Waveform\(ns\)\s+Period\(ns\)")
+VIVADO_VALUES_RE = re.compile(r"^\s*(-?[\d.]+)")
+VIVADO_CLOCK_RE = re.compile(r"^\s*\S+\s+\{[^}]*\}\s+([\d.]+)")
+
+#
+# Quartus (fit and sta summaries in quartus.log)
+# Format: {metric: (keyword of line, regex)}
+#
+QUARTUS_RES = {
+    "alm": ("ALM", re.compile(r"([\d,]+) /")),
+    "ff": ("registers", re.compile(r"(\d+)")),
+    "dsp": ("DSP", re.compile(r"(\d+) /")),
+    "bram": ("RAM", re.compile(r"(\d+) /")),
+    "pin": ("pin", re.compile(r"(\d+) /")),
+    "fmax": ("MHz", re.compile(r"([\d.]+)\s*MHz")),
+    "slack": ("lack", re.compile(r"[Ss]lack\s*(?:is|:)\s*(-?[\d.]+)")),
+}
+
+#
+# Genus (gates.rpt and timing.rpt)
+# Format: {metric: (keyword of line, field index)}
+#
+GENUS_GATES_FIELDS = {
+    "area": ("total", 2),
+    "nands": ("ND2CLD", 1),
+    "nands_area": ("ND2CLD", 2),
+    "ff": ("sequential", 1),
+}
+GENUS_TIMING_FIELDS = {
+    "period": ("capture", 3),
+    "slack": ("slack", 3),
+}
+NON_NUMERIC_RE = re.compile(r"[a-zA-Z]")
+
+#
+# Yosys (output of `stat` and `ltp` commands)
+#
+YOSYS_MODULE_RE = re.compile(r"^===")
+YOSYS_CELLS_RE = re.compile(r"^\s*Number of cells:\s+(\d+)|^\s*(\d+)\s+cells\s*$")
+YOSYS_AREA_RE = re.compile(r"Chip area for (?:top )?module .*:\s*([\d.]+)")
+YOSYS_CELL_TYPE_RE = re.compile(r"^\s+(\$?[A-Za-z_][\w$]*)\s+(\d+)\s*$")
+YOSYS_CELL_COUNT_RE = re.compile(r"^\s+(\d+)\s+(\$?[A-Za-z_][\w$]*)\s*$")
+YOSYS_DEPTH_RE = re.compile(r"Longest topological path .*\(length=(\d+)\)")
+YOSYS_CELL_CLASSES = [
+    ("ff", re.compile(r"DFF|^FD|LATCH", re.IGNORECASE)),
+    ("lut", re.compile(r"^\$?lut|^LUT\d", re.IGNORECASE)),
+    ("dsp", re.compile(r"DSP|MULT|\$mul", re.IGNORECASE)),
+    ("bram", re.compile(r"RAMB|\$mem", re.IGNORECASE)),
+]
+
+
+def to_number(value):
+    """Convert string to int or float. Returns None if not a number."""
+    try:
+        return int(value.replace(",", ""))
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+
+def parse_vivado(log_file):
+    """Parse Vivado log with utilization and timing reports
+    :param str log_file: path of the log
+    :returns dict: metrics found
+    """
+    metrics = {}
+    pending = dict(VIVADO_RES)
+    state = None  # Table being read: "wns" or "clock"
+    with open(log_file, errors="replace") as f:
+        for line in f:
+            for name, regex in list(pending.items()):
+                match = regex.search(line)
+                if match:
+                    metrics[name] = to_number(match.group(1))
+                    del pending[name]
+            if state:
+                if not line.strip() or line.lstrip().startswith("-"):
+                    continue
+                if state == "wns" and "slack" not in metrics:
+                    match = VIVADO_VALUES_RE.match(line)
+                    if match:
+                        metrics["slack"] = to_number(match.group(1))
+                elif state == "clock" and "period" not in metrics:
+                    match = VIVADO_CLOCK_RE.match(line)
+                    if match:
+                        metrics["period"] = to_number(match.group(1))
+                state = None
+            elif VIVADO_WNS_HEADER_RE.match(line):
+                state = "wns"
+            elif VIVADO_CLOCK_HEADER_RE.match(line):
+                state = "clock"
+    if metrics.get("period") and "slack" in metrics:
+        metrics["fmax"] = round(1000 / (metrics["period"] - metrics["slack"]), 3)
+    return metrics
+
+
+def parse_quartus(log_file):
+    """Parse Quartus log with fit and timing summaries
+    :param str log_file: path of the log
+    :returns dict: metrics found
+    """
+    metrics = {}
+    pending = dict(QUARTUS_RES)
+    with open(log_file, errors="replace") as f:
+        for line in f:
+            for name, (keyword, regex) in list(pending.items()):
+                if keyword not in line:
+                    continue
+                match = regex.search(line)
+                if match:
+                    metrics[name] = to_number(match.group(1))
+                    del pending[name]
+            if not pending:
+                break
+    return metrics
+
+
+def parse_fields(report_file, fields):
+    """Find fields of the first line containing each keyword
+    :param str report_file: path of the report
+    :param dict fields: {metric: (keyword, field index)}
+    :returns dict: {metric: field string}
+    """
+    values = {}
+    pending = dict(fields)
+    with open(report_file, errors="replace") as f:
+        for line in f:
+            for name, (keyword, index) in list(pending.items()):
+                if keyword in line:
+                    split_line = line.split()
+                    if len(split_line) > index:
+                        values[name] = split_line[index]
+                    del pending[name]
+            if not pending:
+                break
+    return values
+
+
+def parse_genus(gates_rpt, timing_rpt):
+    """Parse Genus gates and timing reports
+    :param str gates_rpt: path of gates report
+    :param str timing_rpt: path of timing report (times in ps)
+    :returns dict: metrics found
+    """
+    values = parse_fields(gates_rpt, GENUS_GATES_FIELDS)
+    metrics = {
+        "area": to_number(values["area"]),
+        "ff": to_number(values["ff"]),
+    }
+    nands = to_number(values["nands"])
+    nands_area = to_number(values["nands_area"])
+    # Number of equivalent 2-input NAND gates
+    metrics["gates"] = int(math.ceil(metrics["area"] / (nands_area / nands)))
+
+    if os.path.exists(timing_rpt):
+        values = parse_fields(timing_rpt, GENUS_TIMING_FIELDS)
+        metrics["period"] = to_number(values["period"])
+        metrics["slack"] = to_number(NON_NUMERIC_RE.sub("", values["slack"]))
+        # Clock frequency in MHz
+        metrics["fmax"] = 1e6 / (metrics["period"] - metrics["slack"])
+    return metrics
+
+
+def parse_yosys(log_file):
+    """Parse Yosys log with output of `stat` (and optionally `ltp`) commands.
+    Uses the last statistics block of the log (usually the top module or the whole design).
+    :param str log_file: path of the log
+    :returns dict: metrics found
+    """
+    metrics = {}
+    cell_types = {}
+    with open(log_file, errors="replace") as f:
+        for line in f:
+            if YOSYS_MODULE_RE.match(line):
+                cell_types = {}
+                continue
+            match = YOSYS_CELLS_RE.match(line)
+            if match:
+                metrics["cells"] = int(match.group(1) or match.group(2))
+                continue
+            match = YOSYS_AREA_RE.search(line)
+            if match:
+                metrics["area"] = to_number(match.group(1))
+                continue
+            match = YOSYS_DEPTH_RE.search(line)
+            if match:
+                metrics["depth"] = int(match.group(1))
+                continue
+            match = YOSYS_CELL_TYPE_RE.match(line)
+            if match:
+                cell_types[match.group(1)] = int(match.group(2))
+                continue
+            match = YOSYS_CELL_COUNT_RE.match(line)
+            if match:
+                cell_types[match.group(2)] = int(match.group(1))
+    for cell_type, count in cell_types.items():
+        for name, regex in YOSYS_CELL_CLASSES:
+            if regex.search(cell_type):
+                metrics[name] = metrics.get(name, 0) + count
+                break
+    return metrics
+
+
+#
+# .tex tables
+#
+
+
+def tex_value(metrics, name):
+    value = metrics.get(name)
+    return "" if value is None else str(value)
+
+
+def write_vivado_tex(metrics, tex_file="vivado.tex"):
+    """Write Vivado resources table rows"""
+    with open(tex_file, "w") as f:
+        f.write(f"LUTs & {tex_value(metrics, 'lut')} \\\\ \\hline\n")
+        f.write("\\rowcolor{iob-blue}\n")
+        f.write(f"Registers & {tex_value(metrics, 'ff')}  \\\\  \\hline\n")
+        f.write(f"DSPs & {tex_value(metrics, 'dsp')} \\\\ \\hline\n")
+        f.write("\\rowcolor{iob-blue}\n")
+        f.write(f"BRAM & {tex_value(metrics, 'bram')} \\\\ \\hline\n")
+
+
+def write_quartus_tex(metrics, tex_file="quartus.tex"):
+    """Write Quartus resources table rows"""
+    alm = metrics.get("alm")
+    with open(tex_file, "w") as f:
+        f.write(f"ALM & {'' if alm is None else f'{alm:,}'} \\\\ \\hline\n")
+        f.write("\\rowcolor{iob-blue}\n")
+        f.write(f"FF & {tex_value(metrics, 'ff')}  \\\\  \\hline\n")
+        f.write(f"DSP & {tex_value(metrics, 'dsp')} \\\\ \\hline\n")
+        f.write("\\rowcolor{iob-blue}\n")
+        f.write(f"BRAM blocks & {tex_value(metrics, 'bram')} \\\\ \\hline\n")
+        f.write("\\rowcolor{iob-blue}\n")
+
+
+def write_asic_tex(metrics, tex_file="asic.tex"):
+    """Write ASIC results table row"""
+    with open(tex_file, "w") as f:
+        f.write(
+            f"{metrics['area']} & {metrics['gates']} & {metrics['ff']} & "
+            f"{metrics.get('fmax', 0):.5g}\\\\ \\hline"
+        )
+
+
+#
+# QoR history
+#
+
+
+def create_record(tool, metrics, core="", version="", board="", reports=[]):
+    """Create QoR history record
+    :param str tool: EDA tool that generated the reports
+    :param dict metrics: metrics parsed from the reports
+    :param str core: name of the core
+    :param str version: version of the core
+    :param str board: FPGA board (or ASIC node)
+    :param list reports: paths of the reports
+    :returns dict: record
+    """
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "core": core,
+        "version": version,
+        "board": board,
+        "tool": tool,
+        "reports": [os.path.abspath(r) for r in reports],
+        "metrics": metrics,
+    }
+
+
+def append_record(record, db_file=DEFAULT_DB):
+    """Append record to QoR history file (SQLite or JSON lines, based on extension)"""
+    if db_file.endswith(SQLITE_EXTENSIONS):
+        # Only imported when needed, to keep import time low
+        import sqlite3
+
+        with sqlite3.connect(db_file) as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS qor ("
+                "timestamp TEXT, core TEXT, version TEXT, board TEXT, tool TEXT, "
+                + ", ".join(f"{m} REAL" for m in DB_METRICS)
+                + ", metrics TEXT, reports TEXT)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS qor_key ON qor (core, version, board)"
+            )
+            columns = ["timestamp", "core", "version", "board", "tool"]
+            values = [record[c] for c in columns]
+            values += [record["metrics"].get(m) for m in DB_METRICS]
+            values += [json.dumps(record["metrics"]), json.dumps(record["reports"])]
+            db.execute(
+                f"INSERT INTO qor ({', '.join(columns + DB_METRICS)}, metrics, reports) "
+                f"VALUES ({', '.join('?' * len(values))})",
+                values,
+            )
+    else:
+        with open(db_file, "a") as f:
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def load_history(db_file=DEFAULT_DB, core=None, version=None, board=None):
+    """Load records of QoR history, optionally filtered by core, version and board
+    :returns list: records, oldest first
+    """
+    if not os.path.exists(db_file):
+        return []
+    key = {"core": core, "version": version, "board": board}
+    key = {k: v for k, v in key.items() if v is not None}
+    records = []
+    if db_file.endswith(SQLITE_EXTENSIONS):
+        import sqlite3
+
+        with sqlite3.connect(db_file) as db:
+            where = " AND ".join(f"{k} = ?" for k in key) or "1"
+            rows = db.execute(
+                "SELECT timestamp, core, version, board, tool, metrics, reports "
+                f"FROM qor WHERE {where} ORDER BY rowid",
+                list(key.values()),
+            )
+            for timestamp, core, version, board, tool, metrics, reports in rows:
+                records.append(
+                    create_record(tool, json.loads(metrics), core, version, board)
+                    | {"timestamp": timestamp, "reports": json.loads(reports)}
+                )
+    else:
+        with open(db_file) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if all(record.get(k) == v for k, v in key.items()):
+                    records.append(record)
+    return records
+
+
+#
+# Command line interface
+#
+
+# Format: {tool: (number of reports, parser, tex writer, default tex file)}
+TOOLS = {
+    "vivado": (1, parse_vivado, write_vivado_tex, "vivado.tex"),
+    "quartus": (1, parse_quartus, write_quartus_tex, "quartus.tex"),
+    "genus": (2, parse_genus, write_asic_tex, "asic.tex"),
+    "yosys": (1, parse_yosys, None, None),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Parse EDA tool reports, render .tex tables and keep a QoR history."
+    )
+    parser.add_argument("tool", choices=TOOLS.keys())
+    parser.add_argument(
+        "reports",
+        nargs="*",
+        help="Reports to parse. Vivado/Quartus/Yosys: log file (default: $LOG). "
+        "Genus: gates and timing reports (default: gates.rpt timing.rpt).",
+    )
+    parser.add_argument("--tex", help="Output .tex file (default depends on tool)")
+    parser.add_argument("--no_tex", action="store_true", help="Do not write .tex")
+    parser.add_argument("--core", default=os.environ.get("NAME", ""))
+    parser.add_argument("--version", default=os.environ.get("VERSION", ""))
+    parser.add_argument("--board", default=os.environ.get("BOARD", ""))
+    parser.add_argument(
+        "--db",
+        default=os.environ.get("QOR_DB", DEFAULT_DB),
+        help=f"QoR history file. SQLite if it ends in {'/'.join(SQLITE_EXTENSIONS)}, "
+        f"JSON lines otherwise (default: {DEFAULT_DB})",
+    )
+    parser.add_argument(
+        "--no_db", action="store_true", help="Do not append to QoR history"
+    )
+    parser.add_argument(
+        "--print", action="store_true", help="Print parsed metrics as JSON"
+    )
+    args = parser.parse_args()
+
+    n_reports, parse, write_tex, default_tex = TOOLS[args.tool]
+    reports = args.reports
+    if not reports:
+        if args.tool == "genus":
+            reports = ["gates.rpt", "timing.rpt"]
+        elif os.environ.get("LOG"):
+            reports = [os.environ["LOG"]]
+    if len(reports) != n_reports:
+        parser.error(f"'{args.tool}' requires {n_reports} report(s).")
+    if not os.path.exists(reports[0]):
+        print(f"Report '{reports[0]}' not found.", file=sys.stderr)
+        sys.exit(1)
+
+    metrics = parse(*reports)
+
+    if args.print:
+        print(json.dumps(metrics, indent=4))
+    if write_tex and not args.no_tex:
+        write_tex(metrics, args.tex or default_tex)
+    if not args.no_db:
+        append_record(
+            create_record(
+                args.tool, metrics, args.core, args.version, args.board, reports
+            ),
+            args.db,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,10 @@ import importlib.util
 # IObundle scripts imported:
 import iob_colors
 from iob_base import nix_permission_hack
+from iob_log import get_logger
+import dep_gen
+
+log = get_logger("copy")
 
 
 def get_lib_dir():
@@ -55,7 +59,7 @@ def sim_setup(python_module):
     sim_dir = "hardware/simulation"
 
     # Copy LIB sim files
-    shutil.copytree(
+    dep_gen.copytree(
         f"{get_lib_dir()}/{sim_dir}",
         f"{build_dir}/{sim_dir}",
         dirs_exist_ok=True,
@@ -102,7 +106,7 @@ CPP_INCLUDES+=-I../../../{python_module.relative_path_to_UUT}/hardware/src
         )
 
 
-# Setup fpga files, but only the ones in the board_list
+# Setup fpga files, but only the ones in the board_list (limited by `--board`)
 def fpga_setup(python_module):
     # If board_list is empty, then do nothing
     if not python_module.board_list:
@@ -115,7 +119,7 @@ def fpga_setup(python_module):
     tools_list = ["quartus", "vivado"]
 
     # Copy common fpga files in the fpga_dir (except for the directories in the tools list)
-    shutil.copytree(
+    dep_gen.copytree(
         src_dir,
         dst_dir,
         dirs_exist_ok=True,
@@ -150,7 +154,7 @@ INCLUDE_DIRS+=../../{python_module.relative_path_to_UUT}/hardware/src
         )
 
     # Copy LIB fpga directories only if their name is present in the board_list
-    for fpga in python_module.board_list:
+    for fpga in python_module.get_setup_boards():
         for tool in tools_list:
             setup_fpga_dir = os.path.join(src_dir, tool, fpga)
             if os.path.isdir(setup_fpga_dir):
@@ -161,10 +165,10 @@ INCLUDE_DIRS+=../../{python_module.relative_path_to_UUT}/hardware/src
                     setup_tool_file = os.path.join(setup_tool_dir, file)
                     dst_file = os.path.join(dst_dir, tool, file)
                     if os.path.isfile(setup_tool_file):
-                        shutil.copy2(setup_tool_file, dst_file)
+                        dep_gen.copy2(setup_tool_file, dst_file)
                         nix_permission_hack(dst_file)
                 # then copy the fpga directory (excluding 'doc' directory)
-                shutil.copytree(
+                dep_gen.copytree(
                     setup_fpga_dir,
                     os.path.join(dst_dir, tool, fpga),
                     dirs_exist_ok=True,
@@ -178,7 +182,7 @@ def lint_setup(python_module):
     lint_dir = "hardware/lint"
 
     # Copy LIB lint files
-    shutil.copytree(
+    dep_gen.copytree(
         f"{get_lib_dir()}/{lint_dir}",
         f"{build_dir}/{lint_dir}",
         dirs_exist_ok=True,
@@ -240,6 +244,7 @@ def syn_setup(python_module):
         )
         if os.path.isfile(src_file):
             os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+            dep_gen.add_input_file(src_file)
             shutil.copyfile(f"{src_file}", f"{dest_file}")
             nix_permission_hack(dest_file)
 
@@ -285,6 +290,7 @@ def run_setup_functions(python_module, module_type, **kwargs):
     }[module_type]
     full_module_path = os.path.join(python_module.setup_dir, module_path)
     if os.path.isfile(full_module_path):
+        dep_gen.add_input_file(full_module_path)
         # Get and run function of this file
         get_module_function(full_module_path, **kwargs)()
 
@@ -317,7 +323,7 @@ def sw_setup(python_module):
 
     # os.makedirs(build_dir + "/software/src",
     # Copy LIB software Makefile
-    shutil.copytree(
+    dep_gen.copytree(
         f"{get_lib_dir()}/software", f"{build_dir}/software", dirs_exist_ok=True
     )
     nix_permission_hack(f"{build_dir}/software")
@@ -335,10 +341,12 @@ def python_setup(build_dir):
         "board_client.py",
         "console.py",
         "console_ethernet.py",
+        "uart_lz4.py",
         "makehex.py",
         "hex_join.py",
         "fix_doxygen_subsections.py",
     ]:
+        dep_gen.add_input_file(f"{get_lib_dir()}/scripts/{file}")
         shutil.copy(f"{get_lib_dir()}/scripts/{file}", f"{dest_dir}/{file}")
         os.chmod(f"{dest_dir}/{file}", 0o755)
 
@@ -351,14 +359,14 @@ def doc_setup(python_module):
         # Copy LIB tex subdir files if not present
         os.makedirs(f"{build_dir}/document/{subdir}", exist_ok=True)
         for file in os.listdir(f"{get_lib_dir()}/document/{subdir}"):
-            shutil.copy2(
+            dep_gen.copy2(
                 f"{get_lib_dir()}/document/{subdir}/{file}",
                 f"{build_dir}/document/{subdir}/{file}",
             )
             nix_permission_hack(f"{build_dir}/document/{subdir}/{file}")
 
     # Copy document Makefile
-    shutil.copy2(f"{get_lib_dir()}/document/Makefile", f"{build_dir}/document/Makefile")
+    dep_gen.copy2(f"{get_lib_dir()}/document/Makefile", f"{build_dir}/document/Makefile")
     nix_permission_hack(f"{build_dir}/document/Makefile")
 
     # General documentation
@@ -372,7 +380,7 @@ def write_git_revision_short_hash(dst_dir):
     # Use the shortHash.tex from the setup directory if it exists
     # This file is present in pip installations (cannot use git rev-parse in pip installations)
     if os.path.isfile(setup_dir_file):
-        shutil.copy2(
+        dep_gen.copy2(
             setup_dir_file,
             f"{dst_dir}/{file_name}",
         )
@@ -429,6 +437,7 @@ def lib_module_setup(
             f"{iob_colors.FAIL} {module_name} is not a LIB module.{iob_colors.ENDC}"
         )
 
+    dep_gen.add_input_file(module_path)
     extension = os.path.splitext(module_path)[1]
     # If module_name.py is found, import the headers and srcs lists from it
     if extension == ".py":
@@ -458,7 +467,7 @@ def lib_module_setup(
 
 def copy_files(src_dir, dest_dir, sources=[], pattern="*", copy_all=False):
     files_copied = []
-    print(src_dir)
+    log.debug("Copying files from '%s' to '%s'", src_dir, dest_dir)
     if (sources != []) or copy_all:
         os.makedirs(dest_dir, exist_ok=True)
         for path in Path(src_dir).rglob(pattern):
@@ -466,6 +475,7 @@ def copy_files(src_dir, dest_dir, sources=[], pattern="*", copy_all=False):
             if (file in sources) or copy_all:
                 src_file = path.resolve()
                 dest_file = f"{dest_dir}/{file}"
+                dep_gen.add_input_file(src_file)
                 if os.path.isfile(src_file) and (
                     not (os.path.isfile(dest_file))
                     or (os.stat(src_file).st_mtime < os.stat(dest_file).st_mtime)
@@ -474,17 +484,14 @@ def copy_files(src_dir, dest_dir, sources=[], pattern="*", copy_all=False):
                     nix_permission_hack(dest_file)
                     files_copied.append(file)
                 elif not (os.path.isfile(src_file)):
-                    print(
-                        f"{iob_colors.WARNING}{src_file} is not a file.{iob_colors.ENDC}"
-                    )
+                    log.warning("%s is not a file.", src_file)
                 else:
-                    print(
-                        f"{iob_colors.INFO}Not copying file. File in build directory is newer than the one in the source directory.{iob_colors.ENDC}"
+                    log.debug(
+                        "Not copying file '%s'. File in build directory is newer than the one in the source directory.",
+                        file,
                     )
     else:
-        print(
-            f"{iob_colors.WARNING}'copy_files' function did nothing.{iob_colors.ENDC}"
-        )
+        log.warning("'copy_files' function did nothing.")
     return files_copied
 
 
@@ -528,6 +535,7 @@ def copy_with_rename(old_core_name, new_core_name):
             ),
         )
         # print(f"### DEBUG: {src} {dst}", file=sys.stderr)
+        dep_gen.add_input_file(src)
         try:
             file_perms = os.stat(src).st_mode
             with open(src, "r") as file:
@@ -571,6 +579,7 @@ def copytree_with_rename(src, dst, original_name, new_name, ignore=None, symlink
     dst = os.path.join(os.path.dirname(dst), os.path.basename(dst).replace(original_name, new_name).replace(original_name.upper(), new_name.upper()))
     os.makedirs(dst, exist_ok=True)
 
+    dep_gen.add_input_file(src)
     entries = os.listdir(src)
     ignored_names = set()
     if ignore:
@@ -608,6 +617,7 @@ def copy_rename_setup_subdir(core, directory, exclude_file_list=[]):
         if core.use_netlist:
             # copy SETUP_DIR/CORE.v netlist instead of
             # SETUP_DIR/hardware/src
+            dep_gen.add_input_file(os.path.join(core.setup_dir, f"{core.original_name}.v"))
             shutil.copyfile(
                 os.path.join(core.setup_dir, f"{core.original_name}.v"),
                 os.path.join(core.build_dir, dst_directory, f"{core.name}.v"),
@@ -630,7 +640,8 @@ def copy_rename_setup_subdir(core, directory, exclude_file_list=[]):
         )
 
         # if it is the fpga directory, only copy the directories in the cores board_list
-        for fpga in core.board_list:
+        # (limited to the boards selected with `--board`)
+        for fpga in core.get_setup_boards():
             # search for the fpga directory in the cores setup_dir/hardware/fpga
             # in both quartus and vivado directories
             for tools_dir in tools_list:
@@ -659,8 +670,10 @@ def copy_rename_setup_subdir(core, directory, exclude_file_list=[]):
                     )
                     break
             else:
-                print(
-                    f"Note: The setup FPGA directory '{fpga}' not found in subdirectories of '{core.setup_dir}/hardware/fpga/'"
+                log.info(
+                    "Note: The setup FPGA directory '%s' not found in subdirectories of '%s/hardware/fpga/'",
+                    fpga,
+                    core.setup_dir,
                 )
 
         nix_permission_hack(os.path.join(core.build_dir, directory))
@@ -723,6 +736,7 @@ def copy_rename_setup_directory(core, exclude_file_list=["*.py"]):
 
     # Copy custom_config_build.mk file if it exists
     if os.path.isfile(os.path.join(core.setup_dir, "custom_config_build.mk")):
+        dep_gen.add_input_file(os.path.join(core.setup_dir, "custom_config_build.mk"))
         shutil.copyfile(
             os.path.join(core.setup_dir, "custom_config_build.mk"),
             os.path.join(core.build_dir, "custom_config_build.mk"),
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# Micro-benchmark of the short string notation parser (str_to_kwargs decorator).
+# Collects the strings given in the short notation by the lib cores, and compares:
+# - shlex.split() against the dedicated tokenizer (iob_base.split_str);
+# - creating the argparse parsers for every string against reusing them.
+#
+# Usage: ./str_to_kwargs_bench.py [-n <repetitions>] [<search_dir> ...]
+
+import os
+import ast
+import sys
+import time
+import shlex
+import argparse
+import warnings
+
+import iob_base
+import iob_block
+import iob_conf
+import iob_port
+import iob_python_parameter
+import iob_wire
+
+# Short notation parser attributes for each core attribute
+ATTRS = {
+    "subblocks": iob_block.attrs,
+    "superblocks": iob_block.attrs,
+    "confs": iob_conf.attrs,
+    "ports": iob_port.attrs,
+    "wires": iob_wire.attrs,
+    "python_parameters": iob_python_parameter.attrs,
+}
+
+
+def get_str_value(node):
+    """Return value of a string node. Expressions of f-strings are replaced by '1'."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return "".join(
+            v.value if isinstance(v, ast.Constant) else "1" for v in node.values
+        )
+    return None
+
+
+def collect_strings(search_dirs):
+    """Find strings given in the short notation in python files of the given directories
+    :returns list: list of (attribute_name, string) tuples
+    """
+    strings = []
+    for search_dir in search_dirs:
+        for root, _, files in os.walk(search_dir):
+            for file in files:
+                if not file.endswith(".py"):
+                    continue
+                try:
+                    with open(os.path.join(root, file)) as f, warnings.catch_warnings():
+                        warnings.simplefilter("ignore", SyntaxWarning)
+                        tree = ast.parse(f.read())
+                except (SyntaxError, UnicodeDecodeError):
+                    continue
+                for node in ast.walk(tree):
+                    if not isinstance(node, ast.Dict):
+                        continue
+                    for key, value in zip(node.keys, node.values):
+                        if not (
+                            isinstance(key, ast.Constant)
+                            and key.value in ATTRS
+                            and isinstance(value, ast.List)
+                        ):
+                            continue
+                        for element in value.elts:
+                            string = get_str_value(element)
+                            if string is not None:
+                                strings.append((key.value, string))
+    return strings
+
+
+def time_it(func, repetitions):
+    """Return execution time of the given function, in seconds"""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("search_dirs", nargs="*")
+    parser.add_argument("-n", "--repetitions", type=int, default=20)
+    args = parser.parse_args()
+    search_dirs = args.search_dirs or [
+        os.path.join(os.path.dirname(__file__), "..", "lib")
+    ]
+
+    strings = collect_strings(search_dirs)
+    paragraphs = [
+        (attribute, p.strip())
+        for attribute, string in strings
+        for p in string.split("\n\n")
+        if p.strip()
+    ]
+    print(f"Found {len(strings)} strings ({len(paragraphs)} blocks) in short notation.")
+
+    # Check that both tokenizers give the same result
+    for _, paragraph in paragraphs:
+        if shlex.split(paragraph) != iob_base.split_str(paragraph):
+            print(f"Tokenizer mismatch for string:\n{paragraph}")
+            sys.exit(1)
+
+    def dummy_create(core, **kwargs):
+        pass
+
+    # Decorated functions with their own parser cache
+    decorated = {
+        name: iob_base.str_to_kwargs(a)(dummy_create) for name, a in ATTRS.items()
+    }
+
+    def parse_uncached():
+        for attribute, string in strings:
+            iob_base.str_to_kwargs(ATTRS[attribute])(dummy_create).parse_str(string)
+
+    def parse_cached():
+        for attribute, string in strings:
+            decorated[attribute].parse_str(string)
+
+    results = [
+        (
+            "shlex.split",
+            time_it(lambda: [shlex.split(p) for _, p in paragraphs], args.repetitions),
+        ),
+        (
+            "split_str",
+            time_it(
+                lambda: [iob_base.split_str(p) for _, p in paragraphs],
+                args.repetitions,
+            ),
+        ),
+        ("parse (new parsers)", time_it(parse_uncached, args.repetitions)),
+        ("parse (cached parsers)", time_it(parse_cached, args.repetitions)),
+    ]
+    for name, duration in results:
+        print(
+            f"{name:<24} {duration / args.repetitions * 1000:10.3f} ms per pass over all strings"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,10 @@ import os
 import argparse
 import subprocess
 
+from iob_log import get_logger
+
+log = get_logger("format")
+
 
 def submodule_exceptions(path):
     # get repository submodules
@@ -93,7 +97,7 @@ def run_tool(tool, path=".", rules_file_path=None, ignore_paths=[]):
 
     # find all files and run tool
     tool_cmd = f"{build_find_cmd(path, file_extentions, ignore_paths)} | xargs -r {cmd} {flags}"
-    print(tool_cmd)
+    log.debug("%s", tool_cmd)
     subprocess.run(tool_cmd, shell=True, check=True)
 
 
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+# Benchmark of the raw and compressed (FRXZ) UART file transfers used to boot firmware.
+# For each file, reports the number of bytes on the line and the transfer time at the
+# given baud rates (10 bits per byte), and checks that the blocks decode correctly.
+# With --sim, also runs the simulation of a build directory (set up with init_mem=0)
+# with BOOT_COMPRESS=0 and BOOT_COMPRESS=1, and reports the wall-clock time of each.
+#
+# Usage: ./uart_boot_bench.py [-b <baud> ...] [--sim <build_dir>] <file> ...
+
+import os
+import re
+import sys
+import glob
+import time
+import argparse
+import subprocess
+
+import uart_lz4
+
+DEFAULT_BAUDS = [115200, 3000000]
+
+# Bytes of protocol overhead besides the file contents: FTX/FRX/FRXZ command and
+# file size (4 bytes) on each direction, and the ACK before the file transfer
+PROTOCOL_OVERHEAD = 10
+
+
+def transfer_sizes(data):
+    """Number of bytes on the line for the raw and compressed transfers of a file
+    :returns tuple: (raw size, compressed size)
+    """
+    blocks = uart_lz4.encode_file(data)
+    assert (
+        b"".join(uart_lz4.decode_block(b) for b in blocks) == data
+    ), "Compressed blocks do not decode to the original file"
+    # Each block is acknowledged by the receiver
+    compressed = sum(len(b) + 1 for b in blocks)
+    return len(data) + PROTOCOL_OVERHEAD, compressed + PROTOCOL_OVERHEAD
+
+
+def line_time(size, baud):
+    """Time, in seconds, to transfer size bytes (8N1, 10 bits per byte)"""
+    return size * 10 / baud
+
+
+def run_sim(build_dir, compress, make_flags):
+    """Run simulation of build directory with the given bootloader transfer mode
+    :returns tuple: (wall-clock time in seconds, console transfer time or None)
+    """
+    # Force rebuild of the bootloader and of the simulation test log
+    for pattern in [
+        "software/*_boot.elf",
+        "software/*_boot.bin",
+        "hardware/simulation/*_bootrom.hex",
+        "hardware/simulation/test.log",
+    ]:
+        for path in glob.glob(os.path.join(build_dir, pattern)):
+            os.remove(path)
+    start = time.perf_counter()
+    result = subprocess.run(
+        ["make", "-C", build_dir, "sim-run", f"BOOT_COMPRESS={int(compress)}"]
+        + make_flags,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode:
+        print(result.stdout[-2000:], result.stderr[-2000:])
+        sys.exit(f"Error: simulation with BOOT_COMPRESS={int(compress)} failed.")
+    match = re.search(r"file sent in ([\d.]+) s", result.stdout)
+    return elapsed, float(match.group(1)) if match else None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare raw and compressed UART firmware transfers."
+    )
+    parser.add_argument("files", nargs="*", help="Firmware or Linux images")
+    parser.add_argument(
+        "-b",
+        "--baud",
+        type=int,
+        action="append",
+        help=f"Baud rate (default: {', '.join(str(b) for b in DEFAULT_BAUDS)})",
+    )
+    parser.add_argument(
+        "--sim",
+        metavar="BUILD_DIR",
+        help="Also simulate boot of build directory with both transfer modes",
+    )
+    parser.add_argument(
+        "--make_flags",
+        default="",
+        help="Extra make flags for the simulation (for example, 'SIMULATOR=verilator')",
+    )
+    args = parser.parse_args()
+    bauds = args.baud or DEFAULT_BAUDS
+
+    if not args.files and not args.sim:
+        parser.error("no files or build directory given")
+
+    for file in args.files:
+        with open(file, "rb") as f:
+            data = f.read()
+        raw, compressed = transfer_sizes(data)
+        print(f"{os.path.basename(file)}: {len(data)} bytes")
+        print(
+            f"    line bytes: raw {raw}, compressed {compressed} "
+            f"({compressed / raw * 100:.1f} %)"
+        )
+        for baud in bauds:
+            print(
+                f"    {baud:>8} baud: raw {line_time(raw, baud):9.3f} s, "
+                f"compressed {line_time(compressed, baud):9.3f} s"
+            )
+
+    if args.sim:
+        make_flags = args.make_flags.split()
+        for compress in [False, True]:
+            elapsed, transfer = run_sim(args.sim, compress, make_flags)
+            mode = "compressed" if compress else "raw"
+            transfer_str = f", transfer {transfer:.3f} s" if transfer else ""
+            print(f"simulation ({mode}): {elapsed:.3f} s{transfer_str}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 IObundle
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+#
+# Block-wise LZ4 codec of the compressed UART file transfer protocol.
+#
+# The file is split in blocks of BLOCK_SIZE bytes. Each block is sent as:
+# - 2 bytes (little endian): payload length. Bit 15 (BLOCK_STORED) is set if the
+#   payload is the raw block (used when compression does not reduce its size);
+# - 4 bytes (little endian): CRC-32 of the uncompressed block (same as zlib.crc32);
+# - payload: block in the LZ4 block format, or raw.
+# The receiver answers each block with ACK, or NAK to request its retransmission.
+#
+# Blocks are independent (matches never reference previous blocks), so the decoder
+# in iob_uart.c writes them directly to their final location in memory.
+#
+
+import zlib
+
+BLOCK_SIZE = 4096
+BLOCK_STORED = 0x8000
+HEADER_SIZE = 6
+
+# LZ4 block format constants
+MIN_MATCH = 4
+MAX_OFFSET = 0xFFFF
+# Last match must start at least MFLIMIT bytes before end of block
+MFLIMIT = 12
+# Last LAST_LITERALS bytes of block are always literals
+LAST_LITERALS = 5
+
+
+def _write_length(out, length):
+    """Write extra bytes of a length whose 4-bit field is saturated (15)"""
+    length -= 15
+    while length >= 255:
+        out.append(255)
+        length -= 255
+    out.append(length)
+
+
+def _write_sequence(out, literals, offset=0, match_length=0):
+    """Write LZ4 sequence. The last sequence of a block has no match."""
+    lit_len = len(literals)
+    match_code = match_length - MIN_MATCH if match_length else 0
+    out.append((min(lit_len, 15) << 4) | min(match_code, 15))
+    if lit_len >= 15:
+        _write_length(out, lit_len)
+    out += literals
+    if match_length:
+        out += offset.to_bytes(2, byteorder="little")
+        if match_code >= 15:
+            _write_length(out, match_code)
+
+
+def compress_block(data):
+    """Compress block using the LZ4 block format (greedy parser)
+    :param bytes data: uncompressed block
+    :returns bytes: compressed block
+    """
+    out = bytearray()
+    end = len(data)
+    match_limit = end - LAST_LITERALS
+    table = {}  # Format: {4-byte sequence: last position}
+    anchor = 0
+    i = 0
+    while i < end - MFLIMIT:
+        sequence = data[i : i + MIN_MATCH]
+        ref = table.get(sequence)
+        table[sequence] = i
+        if ref is None or i - ref > MAX_OFFSET:
+            i += 1
+            continue
+        length = MIN_MATCH
+        while i + length < match_limit and data[ref + length] == data[i + length]:
+            length += 1
+        _write_sequence(out, data[anchor:i], i - ref, length)
+        i += length
+        anchor = i
+    _write_sequence(out, data[anchor:])
+    return bytes(out)
+
+
+def decompress_block(data, max_size=BLOCK_SIZE):
+    """Decompress block in the LZ4 block format. Reference model of the decoder
+    in iob_uart.c.
+    :param bytes data: compressed block
+    :param int max_size: maximum size of uncompressed block
+    :returns bytes: uncompressed block
+    """
+    out = bytearray()
+    i = 0
+
+    def read_length(length):
+        nonlocal i
+        if length == 15:
+            while True:
+                byte = data[i]
+                i += 1
+                length += byte
+                if byte != 255:
+                    break
+        return length
+
+    while i < len(data):
+        token = data[i]
+        i += 1
+        lit_len = read_length(token >> 4)
+        out += data[i : i + lit_len]
+        i += lit_len
+        if i >= len(data):
+            break
+        offset = int.from_bytes(data[i : i + 2], byteorder="little")
+        i += 2
+        assert 0 < offset <= len(out), "Invalid LZ4 match offset"
+        match_length = read_length(token & 15) + MIN_MATCH
+        for _ in range(match_length):
+            out.append(out[-offset])
+        assert len(out) <= max_size, "LZ4 block larger than maximum size"
+    return bytes(out)
+
+
+def encode_block(block, compress=True):
+    """Encode block with its header
+    :param bytes block: uncompressed block (at most BLOCK_SIZE bytes)
+    :param bool compress: if False, always send the raw block
+    :returns bytes: header and payload
+    """
+    payload = compress_block(block) if compress else block
+    length = len(payload)
+    if length >= len(block):
+        payload = block
+        length = len(block) | BLOCK_STORED
+    crc = zlib.crc32(block)
+    return (
+        length.to_bytes(2, byteorder="little")
+        + crc.to_bytes(4, byteorder="little")
+        + payload
+    )
+
+
+def encode_file(data, compress=True):
+    """Split file in blocks and encode them
+    :param bytes data: file contents
+    :param bool compress: if False, send raw blocks (still CRC checked)
+    :returns list: encoded blocks
+    """
+    return [
+        encode_block(data[i : i + BLOCK_SIZE], compress)
+        for i in range(0, len(data), BLOCK_SIZE)
+    ]
+
+
+def decode_block(encoded):
+    """Decode block with its header, checking its CRC
+    :param bytes encoded: header and payload
+    :returns bytes: uncompressed block, or None if CRC does not match
+    """
+    length = int.from_bytes(encoded[0:2], byteorder="little")
+    crc = int.from_bytes(encoded[2:HEADER_SIZE], byteorder="little")
+    payload = encoded[HEADER_SIZE:]
+    if length & BLOCK_STORED:
+        block = payload
+    else:
+        block = decompress_block(payload)
+    if zlib.crc32(block) != crc:
+        return None
+    return block
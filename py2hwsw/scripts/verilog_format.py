@@ -7,6 +7,10 @@
 import sys
 import subprocess
 
+from iob_log import get_logger
+
+log = get_logger("format")
+
 
 def format_files(
     files_list, format_rules_file="./submodules/LIB/scripts/verible-format.rules"
@@ -22,7 +26,7 @@ def format_files(
     format_cmd = (
         f'verible-verilog-format --inplace {format_rules} {" ".join(files_list)}'
     )
-    print(format_cmd)
+    log.debug("%s", format_cmd)
     result = subprocess.run(format_cmd, shell=True)
     if result.returncode != 0:
         exit(result.returncode)
@@ -15,7 +15,9 @@ import block_gen
 import comb_gen
 import fsm_gen
 import snippet_gen
-from iob_base import debug
+from iob_log import get_logger
+
+log = get_logger("generate")
 
 
 # Find include statements inside a list of lines and replace them by the contents of the included file and return the new list of lines
@@ -80,13 +82,14 @@ def replace_includes(setup_dir="", build_dir="", ignore_snippets=[]):
                 VerilogFiles.append(f"{root}/{file}")
 
     for VerilogFile in VerilogFiles:
-        debug(f"Replacing includes in {VerilogFile}", 1)
+        log.debug("Replacing includes in %s", VerilogFile)
         with open(VerilogFile, "r") as source:
             try:
                 lines = source.readlines()
             except UnicodeDecodeError:
-                print(
-                    f"{iob_colors.FAIL}Error occured when opening '{VerilogFile}'. That file is not utf-8 encoded.{iob_colors.ENDC}."
+                log.error(
+                    "Error occured when opening '%s'. That file is not utf-8 encoded.",
+                    VerilogFile,
                 )
                 exit(1)
             # replace the include statements with the content of the file
@@ -99,8 +102,8 @@ def replace_includes(setup_dir="", build_dir="", ignore_snippets=[]):
     for VSnippetFile in VSnippetFiles:
         os.remove(VSnippetFile)
 
-    print(
-        f"{iob_colors.INFO}Replaced Verilog Snippet includes with respective content and deleted the files.{iob_colors.ENDC}"
+    log.debug(
+        "Replaced Verilog Snippet includes with respective content and deleted the files."
     )
 
 
@@ -163,14 +166,12 @@ def inplace_change(filename, old_string, new_string):
     with open(filename) as f:
         s = f.read()
         if old_string not in s:
-            print('"{old_string}" not found in {filename}.'.format(**locals()))
+            log.debug('"%s" not found in %s.', old_string, filename)
             return
 
     # Safely write the changed content, if found in the file
     with open(filename, "w") as f:
-        print(
-            'Changing "{old_string}" to "{new_string}" in {filename}'.format(**locals())
-        )
+        log.debug('Changing "%s" to "%s" in %s', old_string, new_string, filename)
         s = s.replace(old_string, new_string)
         f.write(s)
 
@@ -183,9 +184,9 @@ def generate_verilog(core):
     file_path = os.path.join(out_dir, f"{core.name}.v")
 
     if os.path.exists(file_path):
-        debug(
-            f"Not generating '{core.name}.v'. Module already exists (probably created manually or generated previously).",
-            1,
+        log.debug(
+            "Not generating '%s.v'. Module already exists (probably created manually or generated previously).",
+            core.name,
         )
         return
 
@@ -15,6 +15,9 @@ import sys
 import subprocess
 
 import iob_colors
+from iob_log import get_logger
+
+log = get_logger("lint")
 
 linters = [
     {
@@ -38,7 +41,7 @@ linters = [
 
 def lint_files(files_list, extra_flags="", config_path="."):
     """Run Linter on given list of files, while grouping them according to their location in the IObundle standard directory structure."""
-    print(f"Linting files: {files_list}", file=sys.stderr)  # DEBUG
+    log.debug("Linting files: %s", files_list)
     # Group files by their directories
     dir_file_list = {}
     for file in files_list:
@@ -89,8 +92,9 @@ def lint_files(files_list, extra_flags="", config_path="."):
     for linter in linters:
         # Lint files for each directory combination
         for directory, files in files_to_lint.items():
-            print(
-                f'\n{iob_colors.INFO}Linting from base directory "{directory}"{iob_colors.ENDC}'
+            log.info(
+                f'\n{iob_colors.INFO}Linting from base directory "%s"{iob_colors.ENDC}',
+                directory,
             )
             linter_cmd = f"{linter['command']}"
             linter_cmd = f"{linter_cmd} {extra_flags}"
@@ -100,11 +104,11 @@ def lint_files(files_list, extra_flags="", config_path="."):
             if linter['waiver_file'] and os.path.exists(waiver_file):
                 linter_cmd = f"{linter_cmd} {linter['waiver_command']} {waiver_file}"
             linter_cmd = f"{linter_cmd} {' '.join(files)}"
-            print(linter_cmd)
+            log.debug("%s", linter_cmd)
             result = subprocess.run(linter_cmd, shell=True)
             if result.returncode != 0:
                 exit(result.returncode)
-            print(f"{iob_colors.INFO}Lint successful!{iob_colors.ENDC}")
+            log.info(f"{iob_colors.INFO}Lint successful!{iob_colors.ENDC}")
 
     # DEBUG: Print child directories and files to lint
     #    print("Base dir: "+directory, file=sys.stderr)